@@ -1,86 +1,151 @@
-import turtle
 from const import *
-from bullet import Bullet
-import time
+from clock import SimClock
+from collections import deque
 import math
-import pygame
 from sound_mange import * 
 
 STATE_PATROL = "Patrol"
 STATE_ATTACK = "Attack"
 
+
+class FiringPattern:
+    """
+    How an enemy shape shoots: the velocities of the bullets of one volley, and whether the
+    enemy drops its oldest bullet once it has `max_bullets` in flight.
+    """
+    __slots__ = ("volley", "limited")
+
+    def __init__(self, volley, limited=False):
+        """
+        Initialize a firing pattern.
+
+        Args:
+            volley (tuple): The (vx, vy) of each bullet fired at once, before the attack
+                speed multiplier is applied to vy.
+            limited (bool): True to limit the bullets in flight to the enemy's max_bullets.
+        """
+        self.volley = volley
+        self.limited = limited
+
+
+FIRING_PATTERNS = {
+    # A single bullet straight down
+    AIRPLANE_2: FiringPattern(((0, -5),)),
+    # Three bullets at slightly different angles downward
+    AIRPLANE_3: FiringPattern(tuple(
+        (math.cos(math.radians(angle)) * 5, math.sin(math.radians(angle)) * 5)
+        for angle in (-100, -90, -80)
+    )),
+    # A single bullet, with a limit on the bullets in flight
+    AIRPLANE_4: FiringPattern(((0, -5),), limited=True),
+    # A single bullet straight down
+    AIRPLANE_5: FiringPattern(((0, -5),)),
+}
+
 class Airplane:
     """
     A base class for all airplanes in the game, including the player and enemies.
     
-    Airplanes have a position, velocity, health, and can shoot bullets. They also have
-    an associated turtle object for graphical representation and can be destroyed upon
-    taking sufficient damage.
+    Airplanes have a position, velocity, health, and can shoot bullets. They can be destroyed
+    upon taking sufficient damage. Airplanes only hold simulation state; their graphical
+    representation is an optional view attached with `attach_view`.
+
+    Airplanes use `__slots__` and keep their coordinates as plain floats updated in place,
+    so moving an airplane does not allocate a new position tuple.
+
+    The bullets an airplane fires are put in flight in a shared ProjectileRegistry, which
+    moves and collides them; the airplane only counts how many of its bullets are alive.
     """
+    __slots__ = ("size", "clock", "bullet_pool", "projectiles", "_shape", "_x", "_y", "_vx",
+                 "_vy", "_health", "live_bullets", "_is_destroyed", "view")
 
-    def __init__(self, position, velocity, shape, health, size=40):
+    def __init__(self, position, velocity, shape, health, size=40, clock=None, bullet_pool=None,
+                 *, projectiles):
         """
         Initialize the airplane with given parameters.
         
         Args:
             position (tuple): The (x, y) coordinates of the airplane.
             velocity (tuple): The (vx, vy) velocity vector of the airplane.
-            shape (str): The turtle shape representing the airplane.
+            shape (str): The image shape representing the airplane.
             health (int): The health points of the airplane.
             size (int): The radius or half-diameter size of the airplane.
+            clock (SimClock): The simulation clock all timing is read from. The airplane
+                gets its own clock if none is given.
+            bullet_pool (BulletPool): The pool bullets are taken from. Defaults to the pool
+                of the projectile registry, which spent bullets are returned to.
+            projectiles (ProjectileRegistry): The registry fired bullets are put in flight in,
+                shared by every airplane of the world.
         """
         self.size = size
+        self.clock = clock if clock is not None else SimClock()
+        self.bullet_pool = bullet_pool if bullet_pool is not None else projectiles.bullet_pool
+        self.projectiles = projectiles
         self._shape = shape
-        self._position = position
-        self._velocity = velocity
+        self._x, self._y = position
+        self._vx, self._vy = velocity
         self._health = health
 
-        self._turtle = turtle.Turtle()
-        self._turtle.penup()
-        self._turtle.screen.register_shape(shape)
-        self._turtle.shape(shape)
-        self._turtle.goto(self._position)
-        self._turtle.showturtle()
-
-        self._bullets = []
-        self._explosion_images = EXPLOSION_FRAMES
-        self._explosion_frame = 0
+        self.live_bullets = 0
         self._is_destroyed = False
+        self.view = None
+
+    def attach_view(self, view):
+        """
+        Attach a view that draws this airplane and show it at the current position.
 
-        self._explosion_turtle = turtle.Turtle()
-        self._explosion_turtle.hideturtle()
+        Args:
+            view: An object with `update(entity)`, `show()`, `hide()`, `set_shape(shape)`,
+                `explode(entity)` and `bullet_view(bullet)` methods, or None to run headless.
+        """
+        self.view = view
+        if view is not None:
+            view.update(self)
+            view.show()
 
     @property
     def position(self):
         """
         tuple: The current (x, y) position of the airplane.
         """
-        return self._position
+        return (self._x, self._y)
 
     @position.setter
     def position(self, position):
         """
-        Set a new position for the airplane and move the turtle accordingly.
+        Set a new position for the airplane and move its view accordingly.
         
         Args:
             position (tuple): The new (x, y) position of the airplane.
         """
-        self._position = position
-        self._turtle.goto(self._position)
+        self.move_to(*position)
+
+    def move_to(self, x, y):
+        """
+        Move the airplane to a new position in place and move its view accordingly.
+
+        Args:
+            x (float): The new x-coordinate of the airplane.
+            y (float): The new y-coordinate of the airplane.
+        """
+        self._x = x
+        self._y = y
+        if self.view is not None:
+            self.view.update(self)
 
     @property
     def x(self):
         """
         float: The x-coordinate of the airplane’s position.
         """
-        return self._position[0]
+        return self._x
 
     @property
     def y(self):
         """
         float: The y-coordinate of the airplane’s position.
         """
-        return self._position[1]
+        return self._y
 
     @property
     def shape(self):
@@ -92,22 +157,20 @@ class Airplane:
     @shape.setter
     def shape(self, other):
         """
-        Set a new shape for the airplane and update its turtle representation.
+        Set a new shape for the airplane and update its view.
         
         Args:
             other (str): The new shape name.
         """
-        self._turtle.screen.register_shape(other)
-        self._turtle.shape(other)
+        self._shape = other
+        if self.view is not None:
+            self.view.set_shape(other)
 
     def move(self):
         """
         Move the airplane according to its velocity vector.
         """
-        new_x = self._position[0] + self._velocity[0]
-        new_y = self._position[1] + self._velocity[1]
-        self._position = (new_x, new_y)
-        self._turtle.goto(self._position)
+        self.move_to(self._x + self._vx, self._y + self._vy)
 
     def take_damage(self, amount):
         """
@@ -123,88 +186,31 @@ class Airplane:
             self.destroy()
 
     def destroy(self):
-        """Destroy the airplane by hiding it and playing an explosion animation."""
+        """
+        Destroy the airplane by hiding it and playing an explosion animation. Bullets it
+        already fired keep flying.
+        """
         SoundManager.play_explosion_sound()  # Play explosion sound
         self._is_destroyed = True
         self._health = 0
-        self._turtle.hideturtle()
-        self._turtle.clear()
-        self.remove_bullets()
-        self._handle_explosion_step()
-        self._turtle.screen.update()
-        self._explosion_turtle.clear()
-
-    def _handle_explosion_step(self):
-        """
-        Handle a single step of the explosion animation. Calls itself via a timer until all frames have been displayed.
-        """
-        self._explosion_turtle.penup()
-        self._turtle.clear()
-
-        if self._explosion_frame < len(self._explosion_images):
-            self._explosion_turtle.screen.register_shape(self._explosion_images[self._explosion_frame])
-            self._explosion_turtle.shape(self._explosion_images[self._explosion_frame])
-            self._explosion_turtle.goto(self._position)
-            self._explosion_turtle.showturtle()
-            self._explosion_frame += 1
-            self._explosion_turtle.screen.ontimer(self._handle_explosion_step, EXPLOSION_DELAY)
-        else:
-            self._explosion_turtle.hideturtle()
-            self._turtle.hideturtle()
+        if self.view is not None:
+            self.view.explode(self)
 
     def add_bullet(self, bullet):
         """
-        Add a bullet to the airplane’s bullet list.
+        Put a bullet fired by the airplane in flight, drawing it if the airplane has a view.
         
         Args:
             bullet (Bullet): The bullet object to add.
-        """
-        self._bullets.append(bullet)
-
-    def update_bullets(self, target):
-        """
-        Move and handle collisions for the airplane’s bullets.
-        
-        Args:
-            target: The target object to check for bullet collisions.
-        """
-        for bullet in self._bullets[:]:
-            bullet.move()
-            if self._check_bullet_collision(bullet, target):
-                bullet.hide_bullet()
-                self._bullets.remove(bullet)
-                target.take_damage(1)
-            elif bullet.is_off_screen():
-                bullet.hide_bullet()
-                self._bullets.remove(bullet)
 
-    def _check_bullet_collision(self, bullet, target):
-        """
-        Check if a bullet collides with a target.
-
-        Args:
-            bullet (Bullet): The bullet object.
-            target: The target object (usually a PlayerAirplane or EnemyAirplane).
-        
         Returns:
-            bool: True if the bullet collided with the target, False otherwise.
-        """
-        return bullet.distance(target) < target.size + bullet.size
-
-    def draw_bullets(self):
-        """
-        Make all bullets visible.
-        """
-        for bullet in self._bullets:
-            bullet.turtle.showturtle()
-
-    def remove_bullets(self):
+            int: The bullet's serial number in the projectile registry.
         """
-        Remove all bullets from the airplane, hiding them first.
-        """
-        for bullet in self._bullets:
-            bullet.hide_bullet()
-        self._bullets.clear()
+        if bullet.view is None and self.view is not None:
+            bullet.attach_view(self.view.bullet_view(bullet))
+        else:
+            bullet.draw()
+        return self.projectiles.add(bullet, self)
 
 
 class PlayerAirplane(Airplane):
@@ -212,19 +218,27 @@ class PlayerAirplane(Airplane):
     The player’s airplane class, which can be controlled by keyboard input, shoot bullets,
     and receive special abilities from mystery balls.
     """
+    __slots__ = ("_is_up_pressed", "_is_left_pressed", "_is_right_pressed", "_is_down_pressed",
+                 "_is_space_pressed", "is_tridirectional", "bullet_size", "speed_multiplier",
+                 "last_shot_time", "shot_cooldown", "score", "ability_activation_time")
 
-    def __init__(self, position, velocity, shape, health, size=20):
+    def __init__(self, position, velocity, shape, health, size=20, clock=None, bullet_pool=None,
+                 *, projectiles):
         """
         Initialize the player’s airplane.
         
         Args:
             position (tuple): Initial (x, y) position.
             velocity (tuple): Initial (vx, vy) velocity vector.
-            shape (str): The turtle shape to represent the player airplane.
+            shape (str): The image shape to represent the player airplane.
             health (int): The initial health of the player.
             size (int): The radius/size of the player’s airplane.
+            clock (SimClock): The simulation clock all timing is read from.
+            bullet_pool (BulletPool): The pool bullets are taken from and returned to.
+            projectiles (ProjectileRegistry): The registry fired bullets are put in flight in.
         """
-        super().__init__(position, velocity, shape, health, size)
+        super().__init__(position, velocity, shape, health, size, clock, bullet_pool,
+                         projectiles=projectiles)
         self._is_up_pressed = False
         self._is_left_pressed = False
         self._is_right_pressed = False
@@ -234,7 +248,7 @@ class PlayerAirplane(Airplane):
         self.is_tridirectional = False
         self.bullet_size = size
         self.speed_multiplier = 1
-        self.last_shot_time = 0
+        self.last_shot_time = -math.inf
         self.shot_cooldown = 0.3
         self.score = 0
         self.ability_activation_time = 0
@@ -301,7 +315,7 @@ class PlayerAirplane(Airplane):
         Activate tri-directional shooting mode, allowing the player to shoot three bullets at once.
         """
         self.is_tridirectional = True
-        self.ability_activation_time = time.time()
+        self.ability_activation_time = self.clock.now
 
     def increase_health(self):
         """
@@ -314,7 +328,7 @@ class PlayerAirplane(Airplane):
         Double the player’s speed for a temporary period.
         """
         self.speed_multiplier = 1.8
-        self.ability_activation_time = time.time()
+        self.ability_activation_time = self.clock.now
 
     def deactivate_ability(self):
         """
@@ -345,62 +359,27 @@ class PlayerAirplane(Airplane):
         # Boundary check
         if -SCREEN_WIDTH / 2 + self.size < new_x < SCREEN_WIDTH / 2 - self.size and \
            -SCREEN_HEIGHT / 2 + self.size < new_y < SCREEN_HEIGHT / 2 - self.size:
-            self.position = (new_x, new_y)
+            self.move_to(new_x, new_y)
 
-        turtle.update()
-
-    def update(self, enemies):
+    def update(self):
         """
-        Update the player’s state, handle abilities timeout, movement, and bullet collisions.
-        
-        Args:
-            enemies (list): A list of enemy airplanes.
+        Update the player’s state: handle abilities timeout and movement. The player’s
+        bullets are moved by the projectile registry.
         """
-        current_time = time.time()
+        current_time = self.clock.now
 
         # Deactivate abilities if their lifetime has passed
         if self.is_tridirectional and (current_time - self.ability_activation_time) > MYSTERY_BALL_LIFETIME:
             self.deactivate_ability()
 
         self.move_airplane_directional()
-        self.update_bullets(enemies)
-
-    def update_bullets(self, enemies):
-        """
-        Move player’s bullets and check for collisions with enemies.
-        
-        Args:
-            enemies (list): A list of enemy airplanes.
-        """
-        for bullet in self._bullets[:]:
-            bullet.move()
-            for enemy in enemies:
-                if self._check_bullet_collision(bullet, enemy):
-                    self.handle_bullet_collision(bullet, enemy)
-                    break
-
-            if bullet.is_off_screen():
-                bullet.hide_bullet()
-                self._bullets.remove(bullet)
-
-    def handle_bullet_collision(self, bullet, target):
-        """
-        Handle the event where a player bullet collides with an enemy target.
-        
-        Args:
-            bullet (Bullet): The bullet that collided.
-            target (Airplane): The enemy airplane that was hit.
-        """
-        target.take_damage(10)
-        bullet.hide_bullet()
-        self._bullets.remove(bullet)
 
     def shoot(self):
         """
         Shoot bullets based on the current shooting mode (normal or tri-directional),
         respecting the cooldown time.
         """
-        current_time = time.time()
+        current_time = self.clock.now
         cooldown = 0.5 if self.is_tridirectional else self.shot_cooldown
 
         if current_time - self.last_shot_time > cooldown:
@@ -411,7 +390,7 @@ class PlayerAirplane(Airplane):
                 for angle in angles:
                     dx = math.cos(math.radians(angle)) * 5
                     dy = math.sin(math.radians(angle)) * 5
-                    bullet = Bullet(
+                    bullet = self.bullet_pool.acquire(
                         x=self.x,
                         y=self.y + self.bullet_size + 5,
                         vx=dx,
@@ -420,7 +399,7 @@ class PlayerAirplane(Airplane):
                     )
                     self.add_bullet(bullet)
             else:
-                bullet = Bullet(
+                bullet = self.bullet_pool.acquire(
                     x=self.x,
                     y=self.y + self.size + 5,
                     vx=0,
@@ -437,20 +416,28 @@ class EnemyAirplane(Airplane):
     The enemy can switch states between Patrol and Attack depending on player distance and position.
     It moves downwards, can shoot bullets, and is destroyed upon taking enough damage or reaching the bottom.
     """
+    __slots__ = ("last_shot_time", "shot_cooldown", "max_bullets", "bullet_count",
+                 "attack_distance", "attack_speed", "state", "patrol_left_bound",
+                 "patrol_right_bound", "patrol_speed", "descent_speed", "moving_right", "_fired")
 
-    def __init__(self, position, velocity, shape, health, size=20):
+    def __init__(self, position, velocity, shape, health, size=20, clock=None, bullet_pool=None,
+                 *, projectiles):
         """
         Initialize the enemy airplane with patrol and attack parameters.
         
         Args:
             position (tuple): Initial (x, y) position.
             velocity (tuple): Initial (vx, vy) velocity vector.
-            shape (str): The turtle shape for the enemy airplane.
+            shape (str): The image shape for the enemy airplane.
             health (int): The health points of the enemy.
             size (int): The radius/size of the enemy airplane.
+            clock (SimClock): The simulation clock all timing is read from.
+            bullet_pool (BulletPool): The pool bullets are taken from and returned to.
+            projectiles (ProjectileRegistry): The registry fired bullets are put in flight in.
         """
-        super().__init__(position, velocity, shape, health, size)
-        self.last_shot_time = 0
+        super().__init__(position, velocity, shape, health, size, clock, bullet_pool,
+                         projectiles=projectiles)
+        self.last_shot_time = -math.inf
         self.shot_cooldown = 1.0
         self.max_bullets = 5
         self.bullet_count = 0
@@ -464,7 +451,12 @@ class EnemyAirplane(Airplane):
         self.patrol_left_bound = -100
         self.patrol_right_bound = 100
         self.patrol_speed = 2
+        # Downward speed in Patrol state
+        self.descent_speed = ENEMY_SPEED
         self.moving_right = True
+        # (serial, bullet) of the bullets fired by a limited pattern, oldest first. Only
+        # created once a limited pattern fires, as most enemies never need it
+        self._fired = None
 
     def handle_state_machine(self, target):
         """
@@ -476,11 +468,12 @@ class EnemyAirplane(Airplane):
         if self._is_destroyed:
             return
 
-        dist = self.distance(target)
+        dx = self._x - target.x
+        dy = self._y - target.y
         # Check if enemy is above the player
         if self.y > target.y:
-            # If close enough, switch to Attack state
-            if dist < self.attack_distance:
+            # If close enough, switch to Attack state (comparing squared distances)
+            if dx * dx + dy * dy < self.attack_distance * self.attack_distance:
                 self.state = STATE_ATTACK
             else:
                 self.state = STATE_PATROL
@@ -517,8 +510,8 @@ class EnemyAirplane(Airplane):
                 new_x = self.patrol_left_bound
                 self.moving_right = True
 
-        new_y = self.y - ENEMY_SPEED
-        self.position = (new_x, new_y)
+        new_y = self.y - self.descent_speed
+        self.move_to(new_x, new_y)
 
     def move_attack(self, target):
         """
@@ -527,9 +520,7 @@ class EnemyAirplane(Airplane):
         Args:
             target (Airplane): The target airplane.
         """
-        new_x = self.x
-        new_y = self.y - self.attack_speed
-        self.position = (new_x, new_y)
+        self.move_to(self._x, self._y - self.attack_speed)
 
     def handle_shooting(self, target):
         """
@@ -551,114 +542,64 @@ class EnemyAirplane(Airplane):
 
     def shoot_based_on_shape(self, target, cooldown, enhanced_vy_multiplier=1.0):
         """
-        Shoot bullets in patterns depending on the enemy’s shape.
+        Shoot bullets in the pattern of the enemy’s shape, looked up in FIRING_PATTERNS.
         
         Args:
             target (Airplane): The target airplane.
             cooldown (float): The time between allowed shots.
             enhanced_vy_multiplier (float): Multiplier for bullet vertical speed.
         """
-        current_time = time.time()
-        if self.shape == AIRPLANE_2:
-            self.shoot_normal(current_time, cooldown, enhanced_vy_multiplier)
-        elif self.shape == AIRPLANE_3:
-            self.shoot_tri_directional(current_time, cooldown, enhanced_vy_multiplier)
-        elif self.shape == AIRPLANE_4:
-            self.shoot_with_limit(current_time, cooldown, enhanced_vy_multiplier)
-        elif self.shape == AIRPLANE_5:
-            self.shoot_fast(current_time, cooldown, enhanced_vy_multiplier)
+        pattern = FIRING_PATTERNS.get(self.shape)
+        if pattern is None:
+            return
+        self.limit_bullets(pattern)
+        if self.clock.now - self.last_shot_time > cooldown:
+            self.fire(pattern, enhanced_vy_multiplier)
 
-    def shoot_normal(self, current_time, cooldown, enhanced_vy_multiplier):
+    def limit_bullets(self, pattern):
         """
-        Enemy shoots a single bullet straight down.
-        
-        Args:
-            current_time (float): The current time for cooldown comparison.
-            cooldown (float): Time interval between shots.
-            enhanced_vy_multiplier (float): Vertical speed multiplier for bullets.
-        """
-        if current_time - self.last_shot_time > cooldown:
-            self.last_shot_time = current_time
-            bullet = Bullet(
-                x=self.x,
-                y=self.y - self.size - 5,
-                vx=0,
-                vy=-5 * enhanced_vy_multiplier,
-                owner=ENEMY
-            )
-            self.add_bullet(bullet)
+        Drop the oldest bullet if the pattern limits the bullets in flight and the limit is reached.
 
-    def shoot_tri_directional(self, current_time, cooldown, enhanced_vy_multiplier):
-        """
-        Enemy shoots three bullets at slightly different angles downward.
-        
         Args:
-            current_time (float): The current time for cooldown comparison.
-            cooldown (float): Time interval between shots.
-            enhanced_vy_multiplier (float): Vertical speed multiplier for bullets.
+            pattern (FiringPattern): The firing pattern of the enemy.
         """
-        if current_time - self.last_shot_time > cooldown:
-            self.last_shot_time = current_time
-            angles = [-100, -90, -80]
-            for angle in angles:
-                dx = math.cos(math.radians(angle)) * 5
-                dy = math.sin(math.radians(angle)) * 5 * enhanced_vy_multiplier
-                bullet = Bullet(
-                    x=self.x,
-                    y=self.y - self.size - 5,
-                    vx=dx,
-                    vy=dy,
-                    owner=ENEMY
-                )
-                self.add_bullet(bullet)
+        fired = self._fired
+        if not pattern.limited or fired is None:
+            return
+        # Forget bullets that already hit something or left the screen (and may have been
+        # recycled as another bullet since)
+        while fired and (fired[0][1].serial != fired[0][0] or fired[0][1].shooter is not self):
+            fired.popleft()
+        if self.live_bullets >= self.max_bullets and fired:
+            self.projectiles.remove(fired.popleft()[1])
 
-    def shoot_with_limit(self, current_time, cooldown, enhanced_vy_multiplier):
-        """
-        Enemy shoots bullets but has a limit on how many bullets can be active at once.
-        
-        Args:
-            current_time (float): The current time for cooldown comparison.
-            cooldown (float): Time interval between shots.
-            enhanced_vy_multiplier (float): Vertical speed multiplier for bullets.
+    def fire(self, pattern, enhanced_vy_multiplier):
         """
-        if len(self._bullets) >= self.max_bullets:
-            self._bullets[0].hide_bullet()
-            self._bullets.pop(0)
+        Fire one volley of a firing pattern downward and restart the cooldown.
 
-        if current_time - self.last_shot_time > cooldown:
-            self.last_shot_time = current_time
-            bullet = Bullet(
-                x=self.x,
-                y=self.y - self.size - 5,
-                vx=0,
-                vy=-5 * enhanced_vy_multiplier,
-                owner=ENEMY
-            )
-            self.add_bullet(bullet)
-
-    def shoot_fast(self, current_time, cooldown, enhanced_vy_multiplier):
-        """
-        Enemy shoots bullets at the normal pattern but potentially with a shorter cooldown.
-        
         Args:
-            current_time (float): The current time for cooldown comparison.
-            cooldown (float): Time interval between shots.
+            pattern (FiringPattern): The firing pattern of the enemy.
             enhanced_vy_multiplier (float): Vertical speed multiplier for bullets.
         """
-        if current_time - self.last_shot_time > cooldown:
-            self.last_shot_time = current_time
-            bullet = Bullet(
+        self.last_shot_time = self.clock.now
+        for vx, vy in pattern.volley:
+            bullet = self.bullet_pool.acquire(
                 x=self.x,
                 y=self.y - self.size - 5,
-                vx=0,
-                vy=-5 * enhanced_vy_multiplier,
+                vx=vx,
+                vy=vy * enhanced_vy_multiplier,
                 owner=ENEMY
             )
-            self.add_bullet(bullet)
+            serial = self.add_bullet(bullet)
+            if pattern.limited:
+                if self._fired is None:
+                    self._fired = deque()
+                self._fired.append((serial, bullet))
 
     def update(self, target):
         """
-        Update the enemy airplane’s state, movement, and bullets. Handle collisions with the player.
+        Update the enemy airplane’s state, movement and shooting. Its bullets are moved by the
+        projectile registry.
         
         Args:
             target (Airplane): The target airplane (usually the player).
@@ -677,42 +618,4 @@ class EnemyAirplane(Airplane):
                 target.take_damage(1)
                 self.destroy()
 
-            self.update_bullets(target)
             self.handle_shooting(target)
-        else:
-            self.update_bullets(target)
-
-    def update_bullets(self, target):
-        """
-        Move enemy bullets and handle collisions with the target (player).
-        
-        Args:
-            target (Airplane): The target airplane (player).
-        """
-        for bullet in self._bullets[:]:
-            bullet.move()
-            if bullet.is_off_screen():
-                bullet.hide_bullet()
-                self._bullets.remove(bullet)
-            elif self._check_bullet_collision(bullet, target):
-                self.handle_bullet_collision(bullet, target)
-
-    def handle_bullet_collision(self, bullet, target):
-        """
-        Handle bullet collision with the target (player), causing damage.
-        
-        Args:
-            bullet (Bullet): The bullet that collided.
-            target (Airplane): The target airplane that was hit.
-        """
-        target.take_damage(1)
-        bullet.hide_bullet()
-        self._bullets.remove(bullet)
-
-    def remove_bullets(self):
-        """
-        Remove all bullets belonging to this enemy airplane.
-        """
-        for bullet in self._bullets:
-            bullet.hide_bullet()
-        self._bullets.clear()
\ No newline at end of file
@@ -0,0 +1,143 @@
+import math
+import os
+import time
+import turtle
+import tkinter as tk
+from const import *
+
+
+def circle_polygon(size, segments=BULLET_SHAPE_SEGMENTS):
+    """
+    Build a circle as the corners of a polygon turtle shape.
+
+    Args:
+        size (float): The radius of the circle.
+        segments (int): The number of corners.
+
+    Returns:
+        tuple: The (x, y) corners of the polygon.
+    """
+    points = []
+    for i in range(segments):
+        angle = 2 * math.pi * i / segments
+        points.append((size * math.cos(angle), size * math.sin(angle)))
+    return tuple(points)
+
+
+class AssetRegistry:
+    """
+    Load every image of the game once and hand out cached handles.
+
+    `register_shape` and `tk.PhotoImage` re-read and re-decode a GIF on every call. The
+    registry decodes each image a single time, on `preload` or on first use, and shares the
+    same PhotoImage between canvas items (`image`) and turtle shapes (`shape`). It records
+    how long each image took to load and roughly how much memory it holds.
+    """
+
+    def __init__(self, screen):
+        """
+        Initialize an empty registry.
+
+        Args:
+            screen (turtle.TurtleScreen): The screen image shapes are registered with.
+        """
+        self.screen = screen
+        self._images = {}
+        self._shapes = set()
+        self._stats = {}
+
+    def preload(self, paths=IMAGE_ASSETS):
+        """
+        Load and register a list of images up front, skipping any that fail to load.
+
+        Args:
+            paths (list): The GIF paths to load. Defaults to every image in const.py.
+        """
+        for path in paths:
+            try:
+                self.shape(path)
+            except tk.TclError:
+                print(f"Error loading image: {path}")
+
+    def image(self, path):
+        """
+        Get the decoded image of a GIF, loading it on first use.
+
+        Args:
+            path (str): The path of the GIF image.
+
+        Returns:
+            tkinter.PhotoImage: The cached image.
+
+        Raises:
+            tkinter.TclError: If the image cannot be read.
+        """
+        image = self._images.get(path)
+        if image is None:
+            start = time.perf_counter()
+            image = tk.PhotoImage(file=path)
+            self._images[path] = image
+            self._stats[path] = {
+                "load_ms": (time.perf_counter() - start) * 1000,
+                "file_bytes": os.path.getsize(path),
+                # Tk keeps decoded images as 32-bit RGBA
+                "decoded_bytes": image.width() * image.height() * 4,
+            }
+        return image
+
+    def shape(self, path):
+        """
+        Get a GIF as a turtle shape, registering it with the screen on first use.
+
+        Args:
+            path (str): The path of the GIF image.
+
+        Returns:
+            str: The registered shape name, to pass to `turtle.shape`.
+        """
+        if path not in self._shapes:
+            self.screen.register_shape(path, turtle.Shape("image", self.image(path)))
+            self._shapes.add(path)
+        return path
+
+    def circle(self, size):
+        """
+        Get a circle of the given radius as a polygon turtle shape, registering it with the
+        screen on first use.
+
+        Args:
+            size (int): The radius of the circle.
+
+        Returns:
+            str: The registered shape name, to pass to `turtle.shape`.
+        """
+        name = f"{BULLET_SHAPE}_{size}"
+        if name not in self._shapes:
+            self.screen.register_shape(name, circle_polygon(size))
+            self._shapes.add(name)
+        return name
+
+    def stats(self):
+        """
+        Get the load time and memory of every loaded image.
+
+        Returns:
+            dict: Maps each path to a dict with "load_ms", "file_bytes" and "decoded_bytes".
+        """
+        return dict(self._stats)
+
+    def memory(self):
+        """
+        Get the memory held by the decoded images.
+
+        Returns:
+            int: The estimated size of every loaded image, in bytes.
+        """
+        return sum(stats["decoded_bytes"] for stats in self._stats.values())
+
+    def __len__(self):
+        """
+        Returns:
+            int: The number of loaded images.
+        """
+        return len(self._images)
@@ -1,15 +1,16 @@
-import turtle
 import math
 from const import *
 
 class Ball:
     """
     A Ball object represents a moving circular particle with methods for collision detection
-    and response against other balls, walls, and paddles. It uses turtle graphics for its
-    on-screen representation.
+    and response against other balls, walls, and paddles. It only holds simulation state;
+    its on-screen representation is an optional view attached with `attach_view`.
     """
+    __slots__ = ("size", "x", "y", "vx", "vy", "color", "mass", "count",
+                 "canvas_width", "canvas_height", "view")
 
-    def __init__(self, size, x, y, vx, vy, color):
+    def __init__(self, size, x, y, vx, vy, color, bounds=None):
         """
         Initialize a Ball with the given parameters.
 
@@ -20,7 +21,11 @@ class Ball:
             vx (float): The initial horizontal velocity of the ball.
             vy (float): The initial vertical velocity of the ball.
             color (str): The color of the ball (currently unused if the ball uses a shape).
+            bounds (tuple): The (half_width, half_height) of the world the ball moves in,
+                centered on the origin. Defaults to the game screen.
         """
+        if bounds is None:
+            bounds = (SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2)
         self.size = size
         self.x = x
         self.y = y
@@ -29,10 +34,21 @@ class Ball:
         self.color = color
         self.mass = 100 * size ** 2
         self.count = 0
-        self.canvas_width = turtle.screensize()[0]
-        self.canvas_height = turtle.screensize()[1]
-        self.turtle = turtle.Turtle()
-        self.turtle.penup()
+        self.canvas_width = bounds[0]
+        self.canvas_height = bounds[1]
+        self.view = None
+
+    def attach_view(self, view):
+        """
+        Attach a view that draws this ball, and draw it at the current position.
+
+        Args:
+            view: An object with `update(entity)`, `show()` and `hide()` methods, or None
+                to run the ball headless.
+        """
+        self.view = view
+        if view is not None:
+            view.update(self)
 
     def bounce_off_vertical_wall(self):
         """
@@ -102,23 +118,9 @@ class Ball:
         """
         if self is that:
             return math.inf
-        dx = that.x - self.x
-        dy = that.y - self.y
-        dvx = that.vx - self.vx
-        dvy = that.vy - self.vy
-        dvdr = dx * dvx + dy * dvy
-        if dvdr > 0:
-            return math.inf
-        dvdv = dvx ** 2 + dvy ** 2
-        if dvdv == 0:
-            return math.inf
-        drdr = dx ** 2 + dy ** 2
-        sigma = self.size + that.size
-        d = (dvdr ** 2) - dvdv * (drdr - sigma ** 2)
-        if d < 0:
-            return math.inf
-        t = -(dvdr + math.sqrt(d)) / dvdv
-        return t if t > 0 else math.inf
+        return contact_time(that.x - self.x, that.y - self.y,
+                            that.vx - self.vx, that.vy - self.vy,
+                            self.size + that.size)
 
     def time_to_hit_vertical_wall(self):
         """
@@ -183,4 +185,33 @@ class Ball:
         Returns:
             str: A string containing the ball’s x, y, vx, vy, and collision count.
         """
-        return f"{self.x}:{self.y}:{self.vx}:{self.vy}:{self.count}"
\ No newline at end of file
+        return f"{self.x}:{self.y}:{self.vx}:{self.vy}:{self.count}"
+
+
+def contact_time(dx, dy, dvx, dvy, sigma):
+    """
+    Calculate when two circles moving at constant velocities first touch, in closed form.
+
+    Args:
+        dx (float): The x-offset of the second circle's center from the first's.
+        dy (float): The y-offset of the second circle's center from the first's.
+        dvx (float): The x-velocity of the second circle relative to the first.
+        dvy (float): The y-velocity of the second circle relative to the first.
+        sigma (float): The sum of the radii of the two circles.
+
+    Returns:
+        float: The time until the circles touch, or math.inf if they are moving apart,
+            never touch, or already overlap.
+    """
+    dvdr = dx * dvx + dy * dvy
+    if dvdr > 0:
+        return math.inf
+    dvdv = dvx ** 2 + dvy ** 2
+    if dvdv == 0:
+        return math.inf
+    drdr = dx ** 2 + dy ** 2
+    d = (dvdr ** 2) - dvdv * (drdr - sigma ** 2)
+    if d < 0:
+        return math.inf
+    t = -(dvdr + math.sqrt(d)) / dvdv
+    return t if t > 0 else math.inf
@@ -0,0 +1,242 @@
+"""
+Headless benchmark of the game simulation.
+
+Runs fixed, seeded scenarios through a GameWorld without opening a window and prints
+frames/sec, frame-time percentiles, per-stage timings, peak memory and the memory of one
+instance of each entity class as JSON, so runs can be compared between changes:
+
+    python benchmark.py                          # every scenario
+    python benchmark.py enemies_50_each --frames 2000 --output bench.json
+"""
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from const import *
+from world import GameWorld
+from airplane import PlayerAirplane, EnemyAirplane
+from bullet import Bullet
+from mystery import MysteryBall
+from clock import SimClock
+from bullet_pool import BulletPool
+from projectiles import ProjectileRegistry
+from sound_mange import SoundManager
+from profiler import FrameProfiler, percentile
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+
+def setup_enemies_50_each(world):
+    """Place 50 enemies of each AIRPLANE_* type in a grid over the top of the screen."""
+    shapes = [AIRPLANE_2, AIRPLANE_3, AIRPLANE_4, AIRPLANE_5]
+    columns = 10
+    for i in range(50 * len(shapes)):
+        row, column = divmod(i, columns)
+        x = -SCREEN_WIDTH / 2 + 40 + column * (SCREEN_WIDTH - 80) / (columns - 1)
+        y = SCREEN_HEIGHT / 2 - 40 - row * 8
+        world.add_enemy(x, y, shapes[i % len(shapes)])
+
+
+def setup_tri_fire(world):
+    """Give the player tri-directional shooting for the whole run."""
+    world.player.activate_tridirectional_shooting()
+
+
+def hold_space(world, frame):
+    """Hold the space key: shoot every frame, like keyboard auto-repeat does."""
+    world.player.press_space()
+
+
+def hold_space_tri(world, frame):
+    """Hold the space key while keeping tri-directional shooting active."""
+    world.player.ability_activation_time = world.clock.now
+    world.player.is_tridirectional = True
+    world.player.press_space()
+
+
+def strafe_and_shoot(world, frame):
+    """Move left and right across the screen while holding the space key."""
+    player = world.player
+    if (frame // 120) % 2 == 0:
+        player.release_left()
+        player.press_right()
+    else:
+        player.release_right()
+        player.press_left()
+    player.press_space()
+
+
+SCENARIOS = {
+    "baseline": {
+        "description": "Regular waves, player strafing and shooting",
+        "frames": 5000,
+        "setup": None,
+        "inputs": strafe_and_shoot,
+    },
+    "enemies_50_each": {
+        "description": "50 enemies of each AIRPLANE_* type at once",
+        "frames": 1000,
+        "setup": setup_enemies_50_each,
+        "inputs": hold_space,
+    },
+    "tri_fire": {
+        "description": "Player holding space with tri-directional fire",
+        "frames": 10000,
+        "setup": setup_tri_fire,
+        "inputs": hold_space_tri,
+    },
+}
+
+
+def run_scenario(name, frames=None, seed=BENCHMARK_SEED, trace_memory=False):
+    """
+    Run one scenario headless and measure it.
+
+    Args:
+        name (str): The name of the scenario in SCENARIOS.
+        frames (int): The number of simulation frames, or None for the scenario default.
+        seed (int): The seed of the world's random number generator.
+        trace_memory (bool): Measure the peak Python heap with tracemalloc (slower).
+
+    Returns:
+        dict: The measurements of the run.
+    """
+    scenario = SCENARIOS[name]
+    frames = frames if frames is not None else scenario["frames"]
+
+    if trace_memory:
+        tracemalloc.start()
+
+    world = GameWorld(seed=seed, profiler=FrameProfiler(window=frames))
+    world.spawn_player()
+    if scenario["setup"] is not None:
+        scenario["setup"](world)
+
+    frame_times = []
+    max_bullets = 0
+    start = time.perf_counter()
+    for frame in range(frames):
+        frame_start = time.perf_counter()
+        # Keep the player alive so every scenario runs for its full length
+        world.player._health = BENCHMARK_PLAYER_HEALTH
+        scenario["inputs"](world, frame)
+        world.step()
+        frame_times.append(time.perf_counter() - frame_start)
+        max_bullets = max(max_bullets, world.bullet_count())
+        if world.game_over:
+            break
+    elapsed = time.perf_counter() - start
+
+    result = {
+        "scenario": name,
+        "description": scenario["description"],
+        "seed": seed,
+        "frames": len(frame_times),
+        "seconds": elapsed,
+        "fps": len(frame_times) / elapsed if elapsed > 0 else 0.0,
+        "frame_ms": frame_time_stats(frame_times),
+        "stages_ms": world.profiler.report(),
+        "max_bullets": max_bullets,
+        "score": world.player.score,
+        "bullet_pool": world.bullet_pool.stats(),
+    }
+    if trace_memory:
+        result["peak_traced_bytes"] = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    if resource is not None:
+        # ru_maxrss is in kilobytes on Linux
+        result["peak_rss_kb"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return result
+
+
+def entity_memory(count=ENTITY_MEMORY_SAMPLES):
+    """
+    Measure the average memory of one instance of each entity class with tracemalloc.
+
+    Args:
+        count (int): The number of instances allocated per class.
+
+    Returns:
+        dict: Maps each entity class name to its average size in bytes.
+    """
+    clock = SimClock()
+    pool = BulletPool()
+    projectiles = ProjectileRegistry(pool)
+    factories = {
+        "Bullet": lambda: Bullet(0, 0, 0, BULLET_SPEED, PLAYER),
+        "MysteryBall": lambda: MysteryBall(20, 0, 0, 0, -5, "red", MYSTERY_BALL1),
+        "EnemyAirplane": lambda: EnemyAirplane((0, 0), (0, 0), AIRPLANE_2, 3, 40, clock, pool,
+                                               projectiles=projectiles),
+        "PlayerAirplane": lambda: PlayerAirplane((0, 0), (0, 0), PLAYER_PIC, 3, 40, clock, pool,
+                                                 projectiles=projectiles),
+    }
+    sizes = {}
+    for name, factory in factories.items():
+        tracemalloc.start()
+        baseline = tracemalloc.get_traced_memory()[0]
+        instances = [factory() for _ in range(count)]
+        used = tracemalloc.get_traced_memory()[0] - baseline
+        tracemalloc.stop()
+        # Leave out the list holding the instances
+        sizes[name] = round((used - sys.getsizeof(instances)) / count, 1)
+    return sizes
+
+
+def frame_time_stats(frame_times):
+    """
+    Summarize frame times.
+
+    Args:
+        frame_times (list): Frame durations, in seconds.
+
+    Returns:
+        dict: The mean, p50, p95, p99 and max frame time, in milliseconds.
+    """
+    samples = sorted(frame_times)
+    if not samples:
+        return {"mean": 0.0, "p50": 0.0, "p95": 0.0, "p99": 0.0, "max": 0.0}
+    return {
+        "mean": sum(samples) / len(samples) * 1000,
+        "p50": percentile(samples, 50) * 1000,
+        "p95": percentile(samples, 95) * 1000,
+        "p99": percentile(samples, 99) * 1000,
+        "max": samples[-1] * 1000,
+    }
+
+
+def main(argv=None):
+    """
+    Parse the command line, run the selected scenarios and write the JSON results.
+
+    Args:
+        argv (list): The command line arguments, or None to use sys.argv.
+    """
+    SoundManager.set_enabled(False)
+    parser = argparse.ArgumentParser(description="Headless benchmark of the game simulation.")
+    parser.add_argument("scenarios", nargs="*",
+                        help=f"Scenarios to run (default: all): {', '.join(SCENARIOS)}.")
+    parser.add_argument("--frames", type=int, help="Override the number of frames of every scenario.")
+    parser.add_argument("--seed", type=int, default=BENCHMARK_SEED, help="Random seed of the world.")
+    parser.add_argument("--tracemalloc", action="store_true", help="Measure the peak Python heap (slower).")
+    parser.add_argument("--output", help="Write the JSON results to this file instead of stdout.")
+    args = parser.parse_args(argv)
+
+    names = args.scenarios or list(SCENARIOS)
+    for name in names:
+        if name not in SCENARIOS:
+            parser.error(f"unknown scenario: {name}")
+    results = [run_scenario(name, args.frames, args.seed, args.tracemalloc) for name in names]
+    text = json.dumps({"entity_bytes": entity_memory(), "results": results}, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
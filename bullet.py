@@ -1,4 +1,3 @@
-import pygame  
 from const import *
 from ball import Ball
 from sound_mange import * 
@@ -8,10 +7,11 @@ class Bullet(Ball):
     A Bullet is a small projectile that can be fired by either the player or an enemy.
     It inherits from the Ball class, adding directional heading and owner attributes.
     """
+    __slots__ = ("owner", "shooter", "index", "serial")
 
-    def __init__(self, x, y, vx, vy, owner):
+    def __init__(self, x, y, vx, vy, owner, bounds=None):
         """
-        Initialize a new Bullet instance and play the shooting sound effect.
+        Initialize a new Bullet instance.
 
         Args:
             x (float): The initial x-coordinate of the bullet.
@@ -19,28 +19,51 @@ class Bullet(Ball):
             vx (float): The horizontal velocity component of the bullet.
             vy (float): The vertical velocity component of the bullet.
             owner (str): The owner of the bullet, either PLAYER or ENEMY.
+            bounds (tuple): The (half_width, half_height) of the world. Defaults to the game screen.
         """
         color = ORANGE if owner == PLAYER else RED
-        super().__init__(size=5, x=x, y=y, vx=vx, vy=vy, color=color)
+        super().__init__(size=5, x=x, y=y, vx=vx, vy=vy, color=color, bounds=bounds)
         self.owner = owner
-        self.turtle.setheading(90 if owner == PLAYER else 270)
-        self.draw()
+        # Set by the ProjectileRegistry while the bullet is in flight
+        self.shooter = None
+        self.index = -1
+        self.serial = 0
+
+    def reset(self, x, y, vx, vy, owner):
+        """
+        Reinitialize a recycled bullet so it can be fired again.
+
+        Args:
+            x (float): The new x-coordinate of the bullet.
+            y (float): The new y-coordinate of the bullet.
+            vx (float): The new horizontal velocity component of the bullet.
+            vy (float): The new vertical velocity component of the bullet.
+            owner (str): The owner of the bullet, either PLAYER or ENEMY.
+        """
+        self.x = x
+        self.y = y
+        self.vx = vx
+        self.vy = vy
+        self.owner = owner
+        self.color = ORANGE if owner == PLAYER else RED
+        self.count = 0
 
     def hide_bullet(self):
         """
-        Hide the bullet's turtle representation from the screen.
+        Hide the bullet's on-screen representation, if it has one.
         """
-        self.turtle.clear()
-        self.turtle.hideturtle()
+        if self.view is not None:
+            self.view.hide()
 
     def is_off_screen(self):
         """
-        Check if the bullet has moved outside the boundaries of the screen.
+        Check if the bullet has moved outside the boundaries of its world.
 
         Returns:
             bool: True if the bullet is off screen, otherwise False.
         """
-        return not (-SCREEN_WIDTH / 2 < self.x < SCREEN_WIDTH / 2 and -SCREEN_HEIGHT / 2 < self.y < SCREEN_HEIGHT / 2)
+        return not (-self.canvas_width < self.x < self.canvas_width
+                    and -self.canvas_height < self.y < self.canvas_height)
 
     def move(self):
         """
@@ -48,23 +71,14 @@ class Bullet(Ball):
         """
         self.x += self.vx
         self.y += self.vy
-        self.turtle.clear()
-        self.turtle.penup()
-        self.turtle.goto(self.x, self.y)
         self.draw()
 
     def draw(self):
         """
-        Draw the bullet on the screen as a small filled circle.
+        Draw the bullet at its current position through its view, if it has one.
         """
-        self.turtle.color(self.color)
-        self.turtle.fillcolor(self.color)
-        self.turtle.goto(self.x, self.y - self.size)
-        self.turtle.pendown()
-        self.turtle.begin_fill()
-        self.turtle.circle(self.size)
-        self.turtle.end_fill()
-        self.turtle.hideturtle()
+        if self.view is not None:
+            self.view.update(self)
 
     def __str__(self):
         """
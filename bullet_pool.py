@@ -0,0 +1,87 @@
+from const import *
+from bullet import Bullet
+
+
+class BulletPool:
+    """
+    A BulletPool recycles Bullet instances together with their views.
+
+    Firing a shot takes a hidden bullet from the pool when one is available instead of
+    building a new Bullet (and a new turtle). Spent bullets are handed back with `release`.
+    At most `max_size` idle bullets are kept; extra ones are disposed of, and their views
+    hand their turtles back to the TurtlePool so other views draw with them.
+    """
+
+    def __init__(self, max_size=BULLET_POOL_SIZE):
+        """
+        Initialize an empty pool.
+
+        Args:
+            max_size (int): The maximum number of idle bullets kept for reuse.
+        """
+        self.max_size = max_size
+        self._free = []
+        self.hits = 0
+        self.misses = 0
+        self.discarded = 0
+
+    def __len__(self):
+        """
+        Return the number of idle bullets waiting to be reused.
+
+        Returns:
+            int: The number of idle bullets.
+        """
+        return len(self._free)
+
+    def acquire(self, x, y, vx, vy, owner):
+        """
+        Get a bullet ready to fire, reusing an idle one when possible.
+
+        Args:
+            x (float): The initial x-coordinate of the bullet.
+            y (float): The initial y-coordinate of the bullet.
+            vx (float): The horizontal velocity component of the bullet.
+            vy (float): The vertical velocity component of the bullet.
+            owner (str): The owner of the bullet, either PLAYER or ENEMY.
+
+        Returns:
+            Bullet: A bullet at the given position, with its view (if any) still attached.
+        """
+        if self._free:
+            self.hits += 1
+            bullet = self._free.pop()
+            bullet.reset(x, y, vx, vy, owner)
+            return bullet
+        self.misses += 1
+        return Bullet(x=x, y=y, vx=vx, vy=vy, owner=owner)
+
+    def release(self, bullet):
+        """
+        Hide a spent bullet and keep it for reuse, or dispose of it if the pool is full.
+
+        Args:
+            bullet (Bullet): The bullet to give back.
+        """
+        bullet.hide_bullet()
+        if len(self._free) < self.max_size:
+            self._free.append(bullet)
+        else:
+            self.discarded += 1
+            if bullet.view is not None:
+                bullet.view.dispose()
+                bullet.view = None
+
+    def stats(self):
+        """
+        Get the pool counters.
+
+        Returns:
+            dict: The number of hits, misses, discarded bullets and idle bullets.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "discarded": self.discarded,
+            "idle": len(self._free),
+        }
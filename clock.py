@@ -0,0 +1,78 @@
+from const import *
+
+
+class SimClock:
+    """
+    A deterministic simulation clock that advances in fixed timesteps.
+
+    All gameplay timing (shooting cooldowns, ability durations, movement) reads the
+    simulation time from this clock instead of `time.time()`. The clock only moves when it
+    is ticked, so a run is reproducible regardless of machine load, and a headless run can
+    tick it as fast as the CPU allows.
+    """
+
+    def __init__(self, timestep=SIM_TIMESTEP, max_steps=MAX_STEPS_PER_FRAME):
+        """
+        Initialize the clock at time zero.
+
+        Args:
+            timestep (float): The length of one simulation step, in seconds.
+            max_steps (int): The most steps `advance` will ask for at once, so one very slow
+                frame does not trigger a long catch-up burst.
+        """
+        self.timestep = timestep
+        self.max_steps = max_steps
+        self.frame = 0
+        self._accumulator = 0.0
+
+    @property
+    def now(self):
+        """
+        float: The current simulation time, in seconds.
+        """
+        return self.frame * self.timestep
+
+    def tick(self):
+        """
+        Advance the clock by exactly one timestep.
+
+        Returns:
+            int: The new frame index.
+        """
+        self.frame += 1
+        return self.frame
+
+    def advance(self, real_elapsed):
+        """
+        Accumulate real time and return how many fixed steps are now due.
+
+        The caller is expected to run one simulation step (and `tick`) per returned step.
+        Leftover time smaller than a timestep is carried over to the next call; time beyond
+        `max_steps` is dropped, so the game slows down instead of spiralling under load.
+
+        Args:
+            real_elapsed (float): The wall-clock seconds since the previous call.
+
+        Returns:
+            int: The number of simulation steps to run.
+        """
+        self._accumulator += max(0.0, real_elapsed)
+        steps = int(self._accumulator // self.timestep)
+        if steps > self.max_steps:
+            steps = self.max_steps
+            self._accumulator = 0.0
+        else:
+            self._accumulator -= steps * self.timestep
+        return steps
+
+    def elapsed_since(self, timestamp):
+        """
+        Compute how much simulation time has passed since a timestamp.
+
+        Args:
+            timestamp (float): An earlier value of `now`.
+
+        Returns:
+            float: The simulation seconds elapsed.
+        """
+        return self.now - timestamp
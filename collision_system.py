@@ -0,0 +1,240 @@
+import heapq
+import math
+from particles import top_k_hits
+
+
+class Event:
+    """
+    An Event is a predicted collision at a given simulation time.
+
+    An event involving `a` and `b` is a ball-ball collision, an event with only `a` is a
+    vertical wall collision and an event with only `b` is a horizontal wall collision. The
+    collision counts of the balls are recorded when the event is created so it can later be
+    recognised as stale.
+    """
+
+    def __init__(self, time, a, b):
+        """
+        Initialize a new Event.
+
+        Args:
+            time (float): The simulation time at which the event occurs.
+            a (Ball): The first ball involved, or None.
+            b (Ball): The second ball involved, or None.
+        """
+        self.time = time
+        self.a = a
+        self.b = b
+        self.count_a = a.count if a is not None else -1
+        self.count_b = b.count if b is not None else -1
+
+    def __lt__(self, that):
+        """
+        Order events by their time so they can be kept in a heap.
+
+        Args:
+            that (Event): Another event.
+
+        Returns:
+            bool: True if this event happens before `that`.
+        """
+        return self.time < that.time
+
+    def is_valid(self):
+        """
+        Check whether the event is still valid.
+
+        An event becomes stale as soon as one of its balls takes part in another collision
+        after the event was predicted.
+
+        Returns:
+            bool: True if no ball involved has collided since the prediction.
+        """
+        if self.a is not None and self.a.count != self.count_a:
+            return False
+        if self.b is not None and self.b.count != self.count_b:
+            return False
+        return True
+
+
+class CollisionSystem:
+    """
+    An event-driven simulation of a set of balls.
+
+    Instead of testing every pair of balls every frame, the system keeps a priority queue
+    of predicted collisions (computed with `Ball.time_to_hit` and the wall variants) and
+    jumps from one event to the next. After each collision only the balls involved are
+    re-predicted, so an event costs O(n log n) instead of O(n²) per frame.
+    """
+
+    def __init__(self, balls, k=None):
+        """
+        Initialize the collision system and predict the first events of every ball.
+
+        Args:
+            balls (list): The Ball instances to simulate.
+            k (int): If given, seed the queue with only the `k` earliest ball-ball contacts
+                of each ball, computed in one vectorized pass, instead of every pair in pure
+                Python. A seeded ball is fully predicted as soon as it or one of its seeded
+                partners collides, since its other contacts may then come first.
+        """
+        self.balls = list(balls)
+        self.time = 0.0
+        self._pq = []
+        # id() of the balls whose ball-ball events were only seeded, not fully predicted
+        self._partial = set()
+        # id() of a ball -> the partially predicted balls that were seeded with it
+        self._seeded_with = {}
+        if k is None:
+            for ball in self.balls:
+                self.predict(ball)
+        else:
+            self._seed_top_k(k)
+
+    def _seed_top_k(self, k):
+        """
+        Seed the queue with wall events and the `k` earliest ball-ball events of every ball.
+
+        Args:
+            k (int): The number of ball-ball events to keep per ball.
+        """
+        balls = self.balls
+        times, partners = top_k_hits(
+            [b.x for b in balls], [b.y for b in balls],
+            [b.vx for b in balls], [b.vy for b in balls],
+            [b.size for b in balls], k
+        )
+        for i, a in enumerate(balls):
+            for dt, j in zip(times[i].tolist(), partners[i].tolist()):
+                if j < 0:
+                    break
+                self._pq.append(Event(self.time + dt, a, balls[j]))
+                self._seeded_with.setdefault(id(balls[j]), []).append(a)
+            if partners[i, -1] >= 0:
+                # All k slots were used, so contacts beyond the k-th were left out
+                self._partial.add(id(a))
+            dt_x = a.time_to_hit_vertical_wall()
+            if dt_x != math.inf:
+                self._pq.append(Event(self.time + max(0.0, dt_x), a, None))
+            dt_y = a.time_to_hit_horizontal_wall()
+            if dt_y != math.inf:
+                self._pq.append(Event(self.time + max(0.0, dt_y), None, a))
+        heapq.heapify(self._pq)
+
+    def predict(self, a, limit=math.inf):
+        """
+        Push every future collision of ball `a` onto the priority queue.
+
+        Args:
+            a (Ball): The ball to predict events for.
+            limit (float): Events later than this simulation time are ignored.
+        """
+        if a is None:
+            return
+        for b in self.balls:
+            dt = a.time_to_hit(b)
+            if dt != math.inf and self.time + dt <= limit:
+                heapq.heappush(self._pq, Event(self.time + dt, a, b))
+
+        dt_x = a.time_to_hit_vertical_wall()
+        if dt_x != math.inf and self.time + dt_x <= limit:
+            heapq.heappush(self._pq, Event(self.time + max(0.0, dt_x), a, None))
+
+        dt_y = a.time_to_hit_horizontal_wall()
+        if dt_y != math.inf and self.time + dt_y <= limit:
+            heapq.heappush(self._pq, Event(self.time + max(0.0, dt_y), None, a))
+
+    def _complete_seeded(self, ball):
+        """
+        Fully predict the partially predicted balls that were seeded with a ball that just
+        collided, since their seeded event with it is now stale.
+
+        Args:
+            ball (Ball): The ball that collided, or None.
+        """
+        if ball is None or not self._partial:
+            return
+        self._partial.discard(id(ball))
+        for other in self._seeded_with.pop(id(ball), ()):
+            if id(other) in self._partial:
+                self._partial.discard(id(other))
+                self.predict(other)
+
+    def add(self, ball, limit=math.inf):
+        """
+        Add a ball to the running simulation and predict its events.
+
+        Args:
+            ball (Ball): The ball to add.
+            limit (float): Events later than this simulation time are ignored.
+        """
+        self.balls.append(ball)
+        self.predict(ball, limit)
+
+    def _drift(self, dt):
+        """
+        Move every ball in a straight line for `dt` units of simulation time.
+
+        Args:
+            dt (float): The amount of time to move the balls for.
+        """
+        if dt <= 0:
+            return
+        for ball in self.balls:
+            ball.x += ball.vx * dt
+            ball.y += ball.vy * dt
+
+    def next_event_time(self):
+        """
+        Get the time of the next valid event, discarding stale events on the way.
+
+        Returns:
+            float: The simulation time of the next event, or math.inf if there is none.
+        """
+        while self._pq and not self._pq[0].is_valid():
+            heapq.heappop(self._pq)
+        return self._pq[0].time if self._pq else math.inf
+
+    def advance(self, dt):
+        """
+        Advance the simulation by `dt` units of time, resolving every collision on the way.
+
+        Args:
+            dt (float): The amount of simulation time to advance.
+
+        Returns:
+            int: The number of collisions resolved.
+        """
+        target = self.time + dt
+        resolved = 0
+        while self.next_event_time() <= target:
+            event = heapq.heappop(self._pq)
+            self._drift(event.time - self.time)
+            self.time = event.time
+
+            a, b = event.a, event.b
+            if a is not None and b is not None:
+                a.bounce_off(b)
+            elif a is not None:
+                a.bounce_off_vertical_wall()
+            elif b is not None:
+                b.bounce_off_horizontal_wall()
+            resolved += 1
+
+            self.predict(a)
+            self.predict(b)
+            self._complete_seeded(a)
+            self._complete_seeded(b)
+
+        self._drift(target - self.time)
+        self.time = target
+        return resolved
+
+    def __len__(self):
+        """
+        Return the number of pending events, including stale ones not yet discarded.
+
+        Returns:
+            int: The size of the priority queue.
+        """
+        return len(self._pq)
@@ -21,8 +21,11 @@ EXPLOSION_FRAMES = [
     "picture/EXPLOSION_4.gif"
 ]
 EXPLOSION_DELAY = 200  # milliseconds between explosion frames
+EXPLOSION_MAX_ACTIVE = 16  # Most explosions animated at once; extra ones are skipped
 
 FPS = 1000
+SIM_TIMESTEP = 1 / 60      # Seconds of game time simulated per fixed step
+MAX_STEPS_PER_FRAME = 5    # Most fixed steps run to catch up after a slow frame
 SCROLL_SPEED = 6
 
 BG_IMAGE_PATHS = ["picture/bg1.gif", "picture/bg2.gif"]
@@ -40,16 +43,59 @@ HEART_BROKE = "picture/HEART_BROKE.gif"
 PLAYER_SPEED = 5
 BULLET_SPEED = 15
 ENEMY_SPEED = 3
+SPAWN_SLOT_WIDTH = 80  # Width of an enemy spawn slot: two enemy radii, so enemies in adjacent slots never overlap
+ENEMY_AI_BATCH_MIN = 64  # Fewest live enemies worth updating in one vectorized pass
+
+# Collision broadphase
+SPATIAL_HASH_CELL_SIZE = 100  # Grid cell size of the spatial hash, in pixels
+CONTINUOUS_COLLISION = True   # Check bullets along their whole path each step, not just where they land
+
+# Bullet sprites
+BULLET_SHAPE = "bullet"       # Prefix of the registered circular bullet shapes
+BULLET_SHAPE_SEGMENTS = 12    # Number of polygon points approximating a bullet
+
+# Bullet pool
+BULLET_POOL_SIZE = 256  # Maximum number of idle bullets kept for reuse
 
 # Mystery Ball Constants
 MYSTERY_BALL1 = 1
 MYSTERY_BALL2 = 2
 MYSTERY_BALL3 = 3
-
+MYSTERY_BALL_PICS = {
+    MYSTERY_BALL1: "picture/MYSTERY_BALL1.gif",
+    MYSTERY_BALL2: "picture/MYSTERY_BALL2.gif",
+    MYSTERY_BALL3: "picture/MYSTERY_BALL3.gif",
+}
 
 MYSTERY_BALL_SPAWN_RATE = 5  # Percentage chance of spawning a mystery ball (1-100)
 MYSTERY_BALL_LIFETIME = 5    # Seconds the ability lasts
 
+# Profiler overlay
+PROFILER_WINDOW = 240           # Samples kept per stage for the rolling percentiles
+PROFILER_REFRESH_FRAMES = 15    # Frames between two overlay text refreshes
+PROFILER_TOGGLE_KEY = "F3"
+PROFILER_FONT = ("Courier", 10, "normal")
+
+# Benchmark
+BENCHMARK_SEED = 1234
+ENTITY_MEMORY_SAMPLES = 1000  # Instances allocated per class to measure entity memory
+BENCHMARK_PLAYER_HEALTH = 10 ** 9  # Health restored every frame so the player never dies
+
+# Simulation farm
+SIMFARM_GAMES = 100            # Seeded games per parameter set and policy
+SIMFARM_MAX_SECONDS = 300      # Game time after which a surviving player's game is stopped
+SIMFARM_OUTPUT = "simfarm_results.json"
+
+# Replays
+REPLAY_VERSION = 1
+
+# HUD Constants
+HUD_SCORE_FONT = ("Arial", 20, "normal")
+HUD_MAX_HEARTS = 3
+HUD_HEARTS_X = -200      # x-coordinate of the first heart
+HUD_HEARTS_Y = -300      # y-coordinate of the hearts
+HUD_HEART_SPACING = 40
+
 # Game Over Constants
 GAME_OVER_TEXT = "Game Over"
 GAME_OVER_FONT = ("Arial", 80, "bold")
@@ -73,4 +119,22 @@ LOGO_FLIP_INTERVAL = 500
 SHOOT = "sfx/Shooting.wav"
 EXPLOSION = "sfx/Explosion_sound.wav"
 POWERUP = "sfx/Powerup_sound.wav"
-START = "sfx/Start.wav"
\ No newline at end of file
+START = "sfx/Start.wav"
+SOUND_ENABLED = True
+SOUND_QUEUE_SIZE = 32  # Play requests waiting for the audio worker before new ones are dropped
+
+# Leaderboard
+SCORE_BACKEND = "sqlite"        # "sqlite" (indexed database) or "csv" (plain scores.csv)
+SCORES_CSV = "scores.csv"       # Score file of the csv backend, imported into the database once
+LEADERBOARD_DB = "scores.db"
+LEADERBOARD_BUSY_TIMEOUT = 5  # Seconds to wait for another game instance holding the database
+SCOREBOARD_SIZE = 5             # Scores shown on the game over screen
+
+# Every image of the game, preloaded once by the AssetRegistry
+IMAGE_ASSETS = (
+    [PLAYER_PIC, AIRPLANE_LOGO, HEART_FULL, HEART_BROKE]
+    + ENEMY_PIC
+    + EXPLOSION_FRAMES
+    + list(MYSTERY_BALL_PICS.values())
+    + BG_IMAGE_PATHS
+)
@@ -0,0 +1,149 @@
+import time
+import turtle
+from const import *
+
+
+class Explosion:
+    """
+    One running explosion animation, drawn by a pooled turtle.
+    """
+
+    def __init__(self, sprite, x, y, start):
+        """
+        Initialize an explosion.
+
+        Args:
+            sprite (turtle.Turtle): The pooled turtle drawing the explosion.
+            x (float): The x-coordinate of the explosion.
+            y (float): The y-coordinate of the explosion.
+            start (float): The perf_counter time the explosion started at.
+        """
+        self.sprite = sprite
+        self.x = x
+        self.y = y
+        self.start = start
+        self.frame = -1
+
+
+class ExplosionManager:
+    """
+    Play every explosion of the game from one place.
+
+    Explosions are drawn by a small pool of turtles, created on first use and reused, and are
+    all advanced by a single `update` run by the frame scheduler every frame. At most
+    `capacity` explosions run at once; explosions started beyond that are skipped, so wiping
+    out a whole wave costs the same per frame as a few explosions.
+    """
+
+    def __init__(self, assets=None, capacity=EXPLOSION_MAX_ACTIVE):
+        """
+        Initialize a manager with no explosions running.
+
+        Args:
+            assets (AssetRegistry): The registry the explosion frames are taken from. Without
+                one, the frames are registered with the screen directly.
+            capacity (int): The most explosions running at once.
+        """
+        self.assets = assets
+        self.capacity = capacity
+        self.frames = EXPLOSION_FRAMES
+        self._active = []
+        self._idle = []
+        self._sprites = 0
+        self._skipped = 0
+
+    def _shape(self, path):
+        """
+        Get the registered shape of an explosion frame.
+
+        Args:
+            path (str): The path of the GIF image.
+
+        Returns:
+            str: The registered shape name.
+        """
+        if self.assets is not None:
+            return self.assets.shape(path)
+        turtle.Screen().register_shape(path)
+        return path
+
+    def _acquire_sprite(self):
+        """
+        Take an idle sprite from the pool, creating one if the pool is empty.
+
+        Returns:
+            turtle.Turtle: A hidden turtle.
+        """
+        if self._idle:
+            return self._idle.pop()
+        sprite = turtle.Turtle()
+        sprite.hideturtle()
+        sprite.penup()
+        self._sprites += 1
+        return sprite
+
+    def spawn(self, x, y):
+        """
+        Start an explosion, unless `capacity` explosions are already running.
+
+        Args:
+            x (float): The x-coordinate of the explosion.
+            y (float): The y-coordinate of the explosion.
+
+        Returns:
+            bool: True if the explosion was started.
+        """
+        if len(self._active) >= self.capacity:
+            self._skipped += 1
+            return False
+        sprite = self._acquire_sprite()
+        sprite.goto(x, y)
+        self._active.append(Explosion(sprite, x, y, time.perf_counter()))
+        return True
+
+    def update(self):
+        """
+        Advance every running explosion to the frame its age calls for and return finished
+        explosions' sprites to the pool. Runs every frame.
+        """
+        if not self._active:
+            return
+        now = time.perf_counter()
+        running = []
+        for explosion in self._active:
+            frame = int((now - explosion.start) * 1000 // EXPLOSION_DELAY)
+            if frame >= len(self.frames):
+                explosion.sprite.hideturtle()
+                self._idle.append(explosion.sprite)
+                continue
+            if frame != explosion.frame:
+                explosion.frame = frame
+                explosion.sprite.shape(self._shape(self.frames[frame]))
+                if not explosion.sprite.isvisible():
+                    explosion.sprite.showturtle()
+            running.append(explosion)
+        self._active = running
+
+    def clear(self):
+        """Stop every running explosion immediately."""
+        for explosion in self._active:
+            explosion.sprite.hideturtle()
+            self._idle.append(explosion.sprite)
+        self._active = []
+
+    def stats(self):
+        """
+        Get the pool usage.
+
+        Returns:
+            dict: The number of "active" explosions, pooled "sprites", and explosions
+                "skipped" because the cap was reached.
+        """
+        return {"active": len(self._active), "sprites": self._sprites, "skipped": self._skipped}
+
+    def __len__(self):
+        """
+        Returns:
+            int: The number of running explosions.
+        """
+        return len(self._active)
@@ -0,0 +1,116 @@
+import numpy as np
+from const import *
+from airplane import STATE_PATROL, STATE_ATTACK, FIRING_PATTERNS
+
+
+class EnemyController:
+    """
+    Run the state machine of every enemy at once.
+
+    `EnemyAirplane.update` decides each enemy's state, movement and firing one enemy at a
+    time. The controller gathers the enemies' coordinates and parameters into arrays once
+    per frame and computes the patrol/attack transitions, the new positions, the
+    bottom-of-screen checks and which enemies are off cooldown in a single vectorized pass,
+    comparing squared distances. Only applying the results (moving the views, firing the
+    volley looked up in FIRING_PATTERNS) is left per enemy.
+
+    Each NumPy call has a fixed cost, so waves smaller than `batch_min` enemies are cheaper
+    to run through `EnemyAirplane.update` one by one; both paths give the same result.
+    """
+
+    def __init__(self, batch_min=ENEMY_AI_BATCH_MIN):
+        """
+        Initialize the controller.
+
+        Args:
+            batch_min (int): The fewest live enemies updated in one vectorized pass.
+        """
+        self.batch_min = batch_min
+
+    def update(self, enemies, player):
+        """
+        Update every enemy for one frame, in list order, like calling `enemy.update(player)`
+        on each.
+
+        Args:
+            enemies (list): The enemy airplanes, destroyed ones included.
+            player (PlayerAirplane): The player the enemies chase and shoot at.
+        """
+        alive = [enemy for enemy in enemies if not enemy._is_destroyed]
+        if not alive:
+            return
+        if len(alive) < self.batch_min:
+            for enemy in enemies:
+                enemy.update(player)
+            return
+        decisions = self.decide(alive, player)
+        index = 0
+        for enemy in enemies:
+            if enemy._is_destroyed:
+                continue
+            attack, x, y, moving_right, bottom, can_fire, multiplier = decisions[index]
+            index += 1
+
+            enemy.state = STATE_ATTACK if attack else STATE_PATROL
+            enemy.moving_right = moving_right
+            enemy.move_to(x, y)
+            if bottom:
+                # Reduce player health by 1 and destroy the enemy
+                player.take_damage(1)
+                enemy.destroy()
+            if enemy._is_destroyed:
+                continue
+            pattern = FIRING_PATTERNS.get(enemy.shape)
+            if pattern is None:
+                continue
+            enemy.limit_bullets(pattern)
+            if can_fire:
+                enemy.fire(pattern, multiplier)
+
+    def decide(self, enemies, player):
+        """
+        Compute the next state, position and firing eligibility of live enemies.
+
+        Args:
+            enemies (list): The live enemy airplanes.
+            player (PlayerAirplane): The player.
+
+        Returns:
+            list: One (attack, x, y, moving_right, bottom, can_fire, multiplier) tuple per
+                enemy, in order, made of plain Python values.
+        """
+        columns = np.array([
+            (enemy._x, enemy._y, enemy.size, enemy.attack_distance, enemy.attack_speed,
+             enemy.patrol_left_bound, enemy.patrol_right_bound, enemy.patrol_speed,
+             enemy.descent_speed, enemy.moving_right, enemy.shot_cooldown, enemy.last_shot_time)
+            for enemy in enemies
+        ], dtype=np.float64).T
+        (x, y, size, attack_distance, attack_speed, left, right, patrol_speed,
+         descent_speed, moving_right, shot_cooldown, last_shot_time) = columns
+        moving_right = moving_right.astype(bool)
+
+        # Attack when above the player and within the attack distance
+        dx = x - player.x
+        dy = y - player.y
+        attack = (y > player.y) & (dx * dx + dy * dy < attack_distance * attack_distance)
+
+        # Patrol: sweep between the patrol bounds, turning around at either bound
+        patrol_x = np.where(moving_right, x + patrol_speed, x - patrol_speed)
+        past_right = moving_right & (patrol_x > right)
+        past_left = ~moving_right & (patrol_x < left)
+        patrol_x = np.where(past_right, right, np.where(past_left, left, patrol_x))
+        patrol_right = np.where(past_right, False, np.where(past_left, True, moving_right))
+
+        new_x = np.where(attack, x, patrol_x)
+        new_y = np.where(attack, y - attack_speed, y - descent_speed)
+        new_moving_right = np.where(attack, moving_right, patrol_right)
+        bottom = new_y < -SCREEN_HEIGHT / 2 + size
+
+        # In Attack state, shoot faster and bullets move faster
+        cooldown = np.where(attack, np.maximum(0.5, shot_cooldown / 2.0), shot_cooldown)
+        can_fire = enemies[0].clock.now - last_shot_time > cooldown
+        multiplier = np.where(attack, 1.8, 1.0)
+
+        return list(zip(attack.tolist(), new_x.tolist(), new_y.tolist(),
+                        new_moving_right.tolist(), bottom.tolist(), can_fire.tolist(),
+                        multiplier.tolist()))
@@ -0,0 +1,88 @@
+from const import *
+
+
+class Hud:
+    """
+    The heads-up display showing the score and the player's hearts.
+
+    Instead of clearing and re-writing the text and re-stamping the hearts every frame, the
+    HUD owns one persistent canvas item per widget. It remembers the last values it drew and
+    only touches a widget (with `itemconfig`) when its value actually changes.
+
+    Turtles raise their own items whenever they are drawn, so the HUD items share one tag
+    and are raised above them with a single `raise_to_top` call per frame.
+    """
+
+    TAG = "hud"
+
+    def __init__(self, canvas, assets):
+        """
+        Initialize the HUD on a canvas. Items are created the first time they are shown.
+
+        Args:
+            canvas (tkinter.Canvas): The turtle screen's canvas.
+            assets (AssetRegistry): The registry the heart images are taken from.
+        """
+        self.canvas = canvas
+        self.assets = assets
+        self._score_item = None
+        self._heart_items = []
+        self._last_score_text = None
+        self._last_health = None
+
+    def show_score(self, text):
+        """
+        Show the score text, redrawing it only if it changed.
+
+        Args:
+            text (str): The text to show.
+        """
+        if text == self._last_score_text:
+            return
+        self._last_score_text = text
+        if self._score_item is None:
+            # Turtle coordinates (x, y) map to canvas coordinates (x, -y)
+            self._score_item = self.canvas.create_text(
+                0, -(SCREEN_HEIGHT / 2 - 50),
+                text=text, anchor="s", fill=WHITE, font=HUD_SCORE_FONT, tags=self.TAG
+            )
+        else:
+            self.canvas.itemconfig(self._score_item, text=text)
+
+    def show_health(self, health):
+        """
+        Show the player's health as hearts, redrawing them only if the health changed.
+
+        Args:
+            health (int): The player's health.
+        """
+        health = max(0, min(health, HUD_MAX_HEARTS))
+        if health == self._last_health:
+            return
+        self._last_health = health
+        hearts = [HEART_FULL] * health + [HEART_BROKE] * (HUD_MAX_HEARTS - health)
+        if not self._heart_items:
+            for i, heart in enumerate(hearts):
+                item = self.canvas.create_image(
+                    HUD_HEARTS_X + i * HUD_HEART_SPACING, -HUD_HEARTS_Y,
+                    image=self.assets.image(heart), tags=self.TAG
+                )
+                self._heart_items.append(item)
+        else:
+            for item, heart in zip(self._heart_items, hearts):
+                self.canvas.itemconfig(item, image=self.assets.image(heart))
+
+    def raise_to_top(self):
+        """Draw every HUD item above the bullets and airplanes, with one canvas call."""
+        self.canvas.tag_raise(self.TAG)
+
+    def clear(self):
+        """Delete every HUD item from the canvas."""
+        if self._score_item is not None:
+            self.canvas.delete(self._score_item)
+        for item in self._heart_items:
+            self.canvas.delete(item)
+        self._score_item = None
+        self._heart_items = []
+        self._last_score_text = None
+        self._last_health = None
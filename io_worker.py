@@ -0,0 +1,82 @@
+import queue
+import threading
+import traceback
+
+
+class IOWorker:
+    """
+    Run slow file and database work on a background thread, off the Tk thread.
+
+    Jobs run one at a time, in the order they were submitted. A job's result is handed back
+    to the UI through the frame scheduler, so callbacks always run on the Tk thread at the
+    start of a frame. Whenever the queue runs empty, the optional `flush` function is
+    called, so several writes submitted together share a single fsync.
+    """
+
+    def __init__(self, scheduler, flush=None):
+        """
+        Start the worker thread.
+
+        Args:
+            scheduler (FrameScheduler): The scheduler that runs result callbacks on the Tk thread.
+            flush (callable): Called on the worker thread whenever the queue runs empty, and
+                once more before the worker stops. It takes no arguments.
+        """
+        self.scheduler = scheduler
+        self.flush = flush
+        self._jobs = queue.SimpleQueue()
+        # Not a daemon: writes still queued when the window closes are finished before exit
+        self._thread = threading.Thread(target=self._run, name="IOWorker")
+        self._thread.start()
+
+    def submit(self, func, *args, callback=None):
+        """
+        Queue a job.
+
+        Args:
+            func (callable): The function to run on the worker thread.
+            *args: The arguments passed to func.
+            callback (callable): If given, called on the Tk thread with func's return value.
+        """
+        self._jobs.put((func, args, callback))
+
+    def stop(self):
+        """Finish the queued jobs, flush, and end the worker thread. Does not wait for it."""
+        self._jobs.put(None)
+
+    def join(self, timeout=None):
+        """
+        Wait for the worker thread to end after `stop`.
+
+        Args:
+            timeout (float): The most seconds to wait, or None to wait until it ends.
+        """
+        self._thread.join(timeout)
+
+    def _run(self):
+        """Run jobs until stopped, flushing whenever the queue runs empty."""
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                break
+            func, args, callback = job
+            try:
+                result = func(*args)
+            except Exception:
+                # A failed save must not take the worker down with it
+                traceback.print_exc()
+            else:
+                if callback is not None:
+                    self.scheduler.call_soon_threadsafe(lambda c=callback, r=result: c(r))
+            if self._jobs.empty():
+                self._flush()
+        self._flush()
+
+    def _flush(self):
+        """Call the flush function, reporting rather than raising its errors."""
+        if self.flush is None:
+            return
+        try:
+            self.flush()
+        except Exception:
+            traceback.print_exc()
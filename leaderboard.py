@@ -0,0 +1,346 @@
+import io
+import csv
+import heapq
+import os
+import sqlite3
+from const import *
+
+try:
+    import fcntl
+except ImportError:  # Not available on Windows
+    fcntl = None
+
+
+class Leaderboard:
+    """
+    A persistent leaderboard stored in a local SQLite database.
+
+    Scores are kept in a table with an index on the score, so adding a score is a B-tree
+    insert (O(log n)) and the top K scores are read straight off the index (O(K)) instead of
+    reading and sorting every score ever recorded. Scores from the old `scores.csv` file are
+    imported the first time the database is created.
+
+    The database runs in WAL mode with `synchronous=NORMAL`: commits are atomic and safe to
+    run from several game instances at once, but are only fsynced by `sync`, so a batch of
+    writes shares one fsync.
+    """
+
+    def __init__(self, path=LEADERBOARD_DB, csv_path=SCORES_CSV):
+        """
+        Open the leaderboard, creating the database and migrating the CSV scores if needed.
+
+        Args:
+            path (str): The path of the SQLite database.
+            csv_path (str): The path of the legacy CSV score file to import, if it exists.
+        """
+        self.path = path
+        self.connection = sqlite3.connect(path, timeout=LEADERBOARD_BUSY_TIMEOUT)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        with self.connection:
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS scores ("
+                "id INTEGER PRIMARY KEY, username TEXT NOT NULL, score INTEGER NOT NULL)"
+            )
+            self.connection.execute(
+                "CREATE INDEX IF NOT EXISTS scores_by_score ON scores (score DESC, id)"
+            )
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)"
+            )
+        self._migrate_csv(csv_path)
+
+    def _migrate_csv(self, csv_path):
+        """
+        Import the scores of a legacy CSV file once, skipping rows that are not a
+        username and an integer score.
+
+        Args:
+            csv_path (str): The path of the CSV score file.
+
+        Returns:
+            int: The number of imported scores.
+        """
+        with self.connection:
+            # Take the write lock first, so two instances starting together import only once
+            self.connection.execute("BEGIN IMMEDIATE")
+            if self.connection.execute("SELECT 1 FROM meta WHERE key = 'migrated_csv'").fetchone():
+                return 0
+            rows = []
+            if csv_path is not None and os.path.isfile(csv_path):
+                with open(csv_path, mode='r', newline='', encoding='utf-8') as csvfile:
+                    for row in csv.DictReader(csvfile):
+                        try:
+                            rows.append((row["username"], int(row["score"])))
+                        except (KeyError, TypeError, ValueError):
+                            continue
+            self.connection.executemany("INSERT INTO scores (username, score) VALUES (?, ?)", rows)
+            self.connection.execute(
+                "INSERT INTO meta (key, value) VALUES ('migrated_csv', ?)", (str(csv_path),)
+            )
+        return len(rows)
+
+    def add(self, username, score):
+        """
+        Record a score.
+
+        Args:
+            username (str): The name of the player.
+            score (int): The player's score.
+        """
+        with self.connection:
+            self.connection.execute(
+                "INSERT INTO scores (username, score) VALUES (?, ?)", (username, int(score))
+            )
+
+    def top(self, k=SCOREBOARD_SIZE):
+        """
+        Get the best scores. Ties keep the order the scores were recorded in.
+
+        Args:
+            k (int): The number of scores to return.
+
+        Returns:
+            list: Up to k (username, score) tuples, best first.
+        """
+        return self.connection.execute(
+            "SELECT username, score FROM scores ORDER BY score DESC, id LIMIT ?", (k,)
+        ).fetchall()
+
+    def __len__(self):
+        """
+        Returns:
+            int: The number of recorded scores.
+        """
+        return self.connection.execute("SELECT COUNT(*) FROM scores").fetchone()[0]
+
+    def sync(self):
+        """Make every score added so far durable on disk."""
+        self.connection.execute("PRAGMA wal_checkpoint(PASSIVE)")
+
+    def close(self):
+        """Close the database connection."""
+        self.connection.close()
+
+
+class CsvLeaderboard:
+    """
+    A leaderboard kept in the plain `scores.csv` format, with a cached top K.
+
+    The best scores are kept in a min-heap of size K built from one streaming pass over the
+    file. Adding a score appends one row and updates the heap in place. The file size and
+    mtime seen last are remembered; if another process appends to the file, only the new
+    rows are read, and the heap is only rebuilt from scratch if the file shrank or was
+    replaced. Blank or malformed rows are skipped and counted in `skipped`.
+
+    Each row is appended with a single write to a file opened with O_APPEND, under an
+    exclusive lock, so game instances sharing the file never interleave partial rows.
+    Rows are only fsynced by `sync`, so a batch of writes shares one fsync.
+    """
+
+    HEADER = ["username", "score"]
+
+    def __init__(self, path=SCORES_CSV, k=SCOREBOARD_SIZE):
+        """
+        Open the leaderboard. The file is read on the first query.
+
+        Args:
+            path (str): The path of the CSV score file.
+            k (int): The number of best scores kept in memory.
+        """
+        self.path = path
+        self.k = k
+        self.skipped = 0
+        self._heap = []
+        self._rows = 0
+        self._offset = 0
+        self._stat = None
+        self._fd = None
+        self._unsynced = False
+
+    def _reset(self):
+        """Forget everything read so far, so the next refresh reads the whole file."""
+        self.skipped = 0
+        self._heap = []
+        self._rows = 0
+        self._offset = 0
+        self._stat = None
+
+    def _push(self, username, score):
+        """
+        Offer a score to the top-K heap. Ties keep the order the scores were recorded in.
+
+        Args:
+            username (str): The name of the player.
+            score (int): The player's score.
+        """
+        # The heap root is the worst kept score: lowest, then most recently recorded
+        entry = (score, -self._rows, username)
+        self._rows += 1
+        if len(self._heap) < self.k:
+            heapq.heappush(self._heap, entry)
+        elif entry > self._heap[0]:
+            heapq.heapreplace(self._heap, entry)
+
+    def _refresh(self):
+        """
+        Bring the heap up to date with the file, reading only the rows appended since the
+        last refresh unless the file shrank or was replaced.
+        """
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            self._reset()
+            return
+        key = (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+        if key == self._stat:
+            return
+        if self._stat is None or stat.st_ino != self._stat[0] or stat.st_size < self._offset:
+            self._reset()
+
+        with open(self.path, mode='rb') as f:
+            f.seek(self._offset)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    # A row still being written; read it on the next refresh
+                    break
+                self._offset += len(line)
+                self._parse(line)
+        self._stat = (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+
+    def _parse(self, line):
+        """
+        Parse one line of the file into the heap, skipping the header and bad rows.
+
+        Args:
+            line (bytes): One complete line of the file.
+        """
+        try:
+            row = next(csv.reader([line.decode('utf-8')]), [])
+        except (UnicodeDecodeError, csv.Error):
+            self.skipped += 1
+            return
+        if row == self.HEADER:
+            return
+        try:
+            username, score = row
+            self._push(username, int(score))
+        except ValueError:
+            self.skipped += 1
+
+    def add(self, username, score):
+        """
+        Append a score to the file and to the cached top K.
+
+        Args:
+            username (str): The name of the player.
+            score (int): The player's score.
+        """
+        self._refresh()
+        buffer = io.StringIO()
+        csv.writer(buffer).writerow([username, int(score)])
+        row = buffer.getvalue().encode('utf-8')
+
+        fd = self._append_fd()
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+        try:
+            size = os.fstat(fd).st_size
+            if size == 0:
+                # Write header if the file is new
+                header = io.StringIO()
+                csv.writer(header).writerow(self.HEADER)
+                row = header.getvalue().encode('utf-8') + row
+            elif os.pread(fd, 1, size - 1) != b"\n":
+                # End an unterminated last row first, so ours starts on a line of its own
+                row = b"\r\n" + row
+            while row:
+                row = row[os.write(fd, row):]
+        finally:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+        self._unsynced = True
+        # Read our own row back through the incremental path
+        self._refresh()
+
+    def _append_fd(self):
+        """
+        Get a descriptor appending to the score file, reopening it if the file was replaced.
+
+        Returns:
+            int: The open file descriptor.
+        """
+        if self._fd is not None:
+            try:
+                current = os.stat(self.path).st_ino
+            except FileNotFoundError:
+                current = None
+            if current != os.fstat(self._fd).st_ino:
+                self._close_fd()
+        if self._fd is None:
+            # Readable too, so `add` can check how the file ends
+            self._fd = os.open(self.path, os.O_RDWR | os.O_APPEND | os.O_CREAT, 0o644)
+        return self._fd
+
+    def _close_fd(self):
+        """Sync and close the append descriptor, if it is open."""
+        if self._fd is None:
+            return
+        self.sync()
+        os.close(self._fd)
+        self._fd = None
+
+    def top(self, k=SCOREBOARD_SIZE):
+        """
+        Get the best scores. Ties keep the order the scores were recorded in.
+
+        Args:
+            k (int): The number of scores to return.
+
+        Returns:
+            list: Up to k (username, score) tuples, best first.
+        """
+        if k > self.k:
+            self.k = k
+            self._reset()
+        self._refresh()
+        best = sorted(self._heap, reverse=True)[:k]
+        return [(username, score) for score, _, username in best]
+
+    def __len__(self):
+        """
+        Returns:
+            int: The number of valid scores in the file.
+        """
+        self._refresh()
+        return self._rows
+
+    def sync(self):
+        """Make every score added so far durable on disk."""
+        if self._fd is not None and self._unsynced:
+            os.fsync(self._fd)
+            self._unsynced = False
+
+    def close(self):
+        """Sync and close the score file."""
+        self._close_fd()
+
+
+def open_leaderboard(backend=SCORE_BACKEND):
+    """
+    Open the leaderboard of the configured backend.
+
+    Args:
+        backend (str): "sqlite" for the indexed database, "csv" for the plain score file.
+
+    Returns:
+        Leaderboard | CsvLeaderboard: The opened leaderboard.
+
+    Raises:
+        ValueError: If the backend is unknown.
+    """
+    if backend == "sqlite":
+        return Leaderboard()
+    if backend == "csv":
+        return CsvLeaderboard()
+    raise ValueError(f"Unknown score backend: {backend}")
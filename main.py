@@ -1,13 +1,20 @@
 import turtle
 import tkinter as tk
 import random
-import csv
-import os
+import time
+import argparse
 from const import *
-from airplane import PlayerAirplane, EnemyAirplane
-from mystery import MysteryBall
-from bullet import Bullet
 from sound_mange import * 
+from view import TurtleViewFactory
+from world import GameWorld
+from hud import Hud
+from assets import AssetRegistry
+from effects import ExplosionManager
+from leaderboard import open_leaderboard
+from io_worker import IOWorker
+from scheduler import FrameScheduler
+from profiler import FrameProfiler, ProfilerOverlay
+from replay import InputRecorder, Replay
 
 class GameController:
     """
@@ -18,8 +25,19 @@ class GameController:
     a scoreboard.
     """
 
-    def __init__(self):
-        """Initialize the game controller and set up the initial login screen."""
+    def __init__(self, record_path=None, replay_path=None):
+        """
+        Initialize the game controller and set up the initial login screen.
+
+        Args:
+            record_path (str): If given, the player's inputs are recorded and saved to this
+                replay file at game over.
+            replay_path (str): If given, the recorded session in this replay file is played
+                back, one simulation step per frame, instead of reading the keyboard.
+        """
+        self.record_path = record_path
+        self.replay_path = replay_path
+
         # Initial Setup
         self.screen = turtle.Screen()
         self.screen.setup(width=SCREEN_WIDTH, height=SCREEN_HEIGHT)
@@ -28,11 +46,9 @@ class GameController:
         self.screen.tracer(0)
         self.canvas = self.screen.getcanvas()
 
-        # Register image shapes
-        self.screen.register_shape(HEART_FULL)
-        self.screen.register_shape(HEART_BROKE)
-        self.screen.register_shape(AIRPLANE_LOGO)
-        self.screen.register_shape(PLAYER_PIC)
+        # Decode every image once, up front
+        self.assets = AssetRegistry(self.screen)
+        self.assets.preload()
 
         # Turtle for login/logo
         self.logo_turtle = turtle.Turtle()
@@ -77,24 +93,64 @@ class GameController:
         self.scoreboard_turtle.penup()
         self.scoreboard_turtle.color(WHITE)
 
-        # Turtle for displaying score and hearts
-        self.display_turtle = turtle.Turtle()
-        self.display_turtle.hideturtle()
-        self.display_turtle.penup()
+        # Persistent canvas items for the score and hearts
+        self.hud = Hud(self.canvas, self.assets)
 
         # Attributes for game state
-        self.score_text = None
-        self.player = None
         self.username = ""
         self.current_input = ""
         self.bg_images = []
         self.bg_ids = []
-        self.mystery_balls = []
-        self.enemies = []
-        self.last_score_used_to_spawn = -1
         self.game_started = False
+        self._last_frame_time = None
+        self._logo_angle = 0
+
+        # Single frame loop: every animation runs as a system, presented once per frame
+        self.profiler = FrameProfiler()
+        self.profiler_overlay = ProfilerOverlay(self.canvas, self.profiler)
+        self.scheduler = FrameScheduler(self.screen, profiler=self.profiler)
+        self.scheduler.start()
+
+        # Score file and replay writes run on a background thread. The leaderboard is
+        # opened and only ever used there.
+        self.leaderboard = None
+        self.io = IOWorker(self.scheduler, flush=self._sync_scores)
+        self.effects = ExplosionManager(self.assets)
+
+        # Input recording and replay
+        self.replay = Replay.load(replay_path) if replay_path else None
+        seed = self.replay.seed if self.replay is not None else None
+
+        # Simulation state, drawn through turtle views
+        self.world = GameWorld(seed=seed, view_factory=TurtleViewFactory(self.effects, self.assets), profiler=self.profiler)
+        self.clock = self.world.clock
+        self.recorder = InputRecorder(self.world.seed) if record_path else None
 
         self.login_screen()
+        if self.replay is not None:
+            self.current_input = "Replay"
+            self.start_game()
+
+    @property
+    def player(self):
+        """
+        PlayerAirplane: The player's airplane, or None before the game starts.
+        """
+        return self.world.player
+
+    @property
+    def enemies(self):
+        """
+        list: The enemy airplanes currently in the game.
+        """
+        return self.world.enemies
+
+    @property
+    def mystery_balls(self):
+        """
+        list: The mystery balls currently falling.
+        """
+        return self.world.mystery_balls
 
     def login_screen(self):
         """
@@ -102,9 +158,9 @@ class GameController:
         Binds keys for username input and starting the game.
         """
         SoundManager.play_start_sound()  # Play start sound on login screen
-        self.change_background_color()
-        self.rotate_logo()
-        self.flip_logo()
+        self.scheduler.add_system("login_background", self.change_background_color, interval=1000)
+        self.scheduler.add_system("login_rotate", self.rotate_logo, interval=50)
+        self.scheduler.add_system("login_flip", self.flip_logo, interval=LOGO_FLIP_INTERVAL)
 
         # Bind keys for username input
         self.screen.listen()
@@ -147,7 +203,9 @@ class GameController:
         self.game_started = True
         self.username = self.current_input if self.current_input else "Player"
 
-        # Clear login screen elements
+        # Stop the login animations and clear login screen elements
+        for name in ("login_background", "login_rotate", "login_flip"):
+            self.scheduler.remove_system(name)
         self.logo_turtle.hideturtle()
         self.welcome_turtle.clear()
         self.instruction_turtle.clear()
@@ -158,44 +216,31 @@ class GameController:
         self.spawn_background()
         self.initialize_game_objects()
         self.bind_keys()
-        self.game_loop()
+        self.scheduler.add_system("game", self.game_loop, order=10)
+        self.scheduler.add_system("effects", self.effects.update, order=20)
+        self.scheduler.add_system("overlay", self.update_profiler_overlay, order=100)
 
     def change_background_color(self):
-        """Periodically change the background color on the login screen."""
-        if self.game_started:
-            return
+        """Change the background color on the login screen. Runs every second."""
         new_color = random.choice(LOGIN_BG_COLORS)
         self.screen.bgcolor(new_color)
-        self.screen.ontimer(self.change_background_color, 1000)  # Change every second
-
-    def rotate_logo(self, angle=0):
-        """
-        Rotate the logo continuously on the login screen.
 
-        Args:
-            angle (int): The current angle of rotation.
-        """
-        if self.game_started:
-            return
-        self.logo_turtle.setheading(angle)
-        self.screen.update()
-        self.screen.ontimer(lambda: self.rotate_logo((angle + LOGO_ROTATION_SPEED) % 360), 50)
+    def rotate_logo(self):
+        """Rotate the logo a step further on the login screen. Runs every 50 ms."""
+        self.logo_turtle.setheading(self._logo_angle)
+        self._logo_angle = (self._logo_angle + LOGO_ROTATION_SPEED) % 360
 
     def flip_logo(self):
-        """Flip the logo periodically on the login screen."""
-        if self.game_started:
-            return
+        """Flip the logo on the login screen. Runs every LOGO_FLIP_INTERVAL ms."""
         current_heading = self.logo_turtle.heading()
         new_heading = (current_heading + 180) % 360
         self.logo_turtle.setheading(new_heading)
-        self.screen.update()
-        self.screen.ontimer(self.flip_logo, LOGO_FLIP_INTERVAL)
 
     def spawn_background(self):
         """Load and place background images that scroll continuously."""
         for path in BG_IMAGE_PATHS:
             try:
-                img = tk.PhotoImage(file=path)
+                img = self.assets.image(path)
                 self.bg_images.append(img)
             except tk.TclError:
                 print(f"Error loading background image: {path}")
@@ -214,121 +259,57 @@ class GameController:
             )
             self.bg_ids.append(bg_id)
 
-        self.scroll_background()
+        self.scheduler.add_system("background", self.scroll_background, order=0)
 
     def scroll_background(self):
-        """Scroll the background images downwards."""
+        """Scroll the background images downwards. Runs every frame."""
         for bg_id in self.bg_ids:
             self.canvas.move(bg_id, 0, SCROLL_SPEED)
             x, y = self.canvas.coords(bg_id)
             if y >= SCREEN_HEIGHT:
                 max_y = min([self.canvas.coords(b)[1] for b in self.bg_ids])
                 self.canvas.coords(bg_id, x, max_y - self.bg_images[0].height())
-        self.screen.update()
-        self.screen.ontimer(self.scroll_background, int(1000 / FPS))
 
     def initialize_game_objects(self):
         """Initialize player and other game objects."""
-        self.player = PlayerAirplane(
-            position=(0, -200),
-            velocity=(0, 0),
-            shape=PLAYER_PIC,
-            health=3,
-            size=40
-        )
+        self.world.spawn_player()
 
     def bind_keys(self):
-        """Bind the control keys for player movement and actions."""
-        self.screen.onkeypress(self.player.press_up, "Up")
-        self.screen.onkeyrelease(self.player.release_up, "Up")
-        self.screen.onkeypress(self.player.press_left, "Left")
-        self.screen.onkeyrelease(self.player.release_left, "Left")
-        self.screen.onkeypress(self.player.press_right, "Right")
-        self.screen.onkeyrelease(self.player.release_right, "Right")
-        self.screen.onkeypress(self.player.press_down, "Down")
-        self.screen.onkeyrelease(self.player.release_down, "Down")
-        self.screen.onkeypress(self.player.press_space, "space")
-        self.screen.onkeyrelease(self.player.release_space, "space")
+        """
+        Bind the control keys for player movement and actions. During a replay the
+        recorded inputs drive the player, so only the overlay key is bound.
+        """
+        if self.replay is None:
+            for key, name in (("Up", "up"), ("Left", "left"), ("Right", "right"),
+                              ("Down", "down"), ("space", "space")):
+                self.screen.onkeypress(lambda a=f"press_{name}": self.handle_input(a), key)
+                self.screen.onkeyrelease(lambda a=f"release_{name}": self.handle_input(a), key)
+        self.screen.onkeypress(self.profiler_overlay.toggle, PROFILER_TOGGLE_KEY)
         self.screen.listen()
 
-    def display_score(self):
-        """Display the player's current score."""
-        if self.score_text:
-            self.score_text.clear()
-        else:
-            self.score_text = turtle.Turtle()
-            self.score_text.hideturtle()
-            self.score_text.penup()
-            self.score_text.color(WHITE)
-        self.score_text.goto(0, SCREEN_HEIGHT / 2 - 50)
-        self.score_text.write(
-            f"{self.username} Score: {self.player.score}",
-            align="center",
-            font=("Arial", 20, "normal")
-        )
-
-    def health_ui(self):
-        """Display the player's health as hearts."""
-        self.display_turtle.clear()
-        health = max(0, min(self.player._health, 3))
-        hearts = [HEART_FULL] * health + [HEART_BROKE] * (3 - health)
-        for i, heart in enumerate(hearts):
-            self.display_image(-200 + i * 40, -300, heart)
-
-    def display_image(self, x, y, image_shape):
+    def handle_input(self, action):
         """
-        Stamp an image at a specific coordinate.
+        Apply a player input, recording it with the current simulation frame if recording.
 
         Args:
-            x (float): The x-coordinate.
-            y (float): The y-coordinate.
-            image_shape (str): The turtle shape to stamp.
+            action (str): The name of the player method to call, one of replay.ACTIONS.
         """
-        self.display_turtle.goto(x, y)
-        self.display_turtle.shape(image_shape)
-        self.display_turtle.stamp()
-
-    def spawn_mystery_ball(self):
-        """Spawn a mystery ball with a random type at a random position."""
-        mystery_types = [1, 2, 3]
-        mystery_type = random.choice(mystery_types)
-        mystery_ball = MysteryBall(
-            size=20,
-            x=random.randint(-SCREEN_WIDTH // 2 + 50, SCREEN_WIDTH // 2 - 50),
-            y=SCREEN_HEIGHT // 2 - 50,
-            vx=0,
-            vy=-5,
-            color="red",
-            ball_type=mystery_type
-        )
-        self.mystery_balls.append(mystery_ball)
-
-    def spawn_enemy(self):
-        """Spawn an enemy airplane at a random position without overlapping existing enemies."""
-        shapes = [AIRPLANE_2, AIRPLANE_3, AIRPLANE_4, AIRPLANE_5]
-        random_shape = random.choice(shapes)
-        while True:
-            x_pos = random.randint(-SCREEN_WIDTH // 2 + 50, SCREEN_WIDTH // 2 - 50)
-            y_pos = SCREEN_HEIGHT // 2 - 50
-            overlap = False
-            for enemy in self.enemies:
-                if abs(x_pos - enemy.x) < enemy.size * 2 and abs(y_pos - enemy.y) < enemy.size * 2:
-                    overlap = True
-                    break
-            if not overlap:
-                new_enemy = EnemyAirplane(
-                    position=(x_pos, y_pos),
-                    velocity=(0, 0),
-                    shape=random_shape,
-                    health=3,
-                    size=40
-                )
-                self.enemies.append(new_enemy)
-                break
+        if self.recorder is not None:
+            self.recorder.record(self.clock.frame, action)
+        getattr(self.player, action)()
+
+    def display_score(self):
+        """Display the player's current score. The HUD only redraws it when it changes."""
+        self.hud.show_score(f"{self.username} Score: {self.player.score}")
+
+    def health_ui(self):
+        """Display the player's health as hearts. The HUD only redraws them when they change."""
+        self.hud.show_health(self.player._health)
 
     def display_game_over(self):
         """
-        Display the Game Over screen, prompt for restart, save the score to CSV, and show the scoreboard.
+        Display the Game Over screen, prompt for restart, and save the score to the leaderboard
+        in the background. The scoreboard is shown once the save has finished.
         """
         self.screen.bgcolor(GAME_OVER_BG_COLOR)
         self.game_over_turtle.goto(0, 0)
@@ -339,8 +320,7 @@ class GameController:
             font=GAME_OVER_FONT
         )
         self.health_ui()  # Show hearts
-        self.save_score_to_csv()
-        self.show_scoreboard()
+        self.io.submit(self.save_score, self.username, self.player.score, callback=self.show_scoreboard)
 
         # Restart prompt
         self.game_over_turtle.goto(0, -50)
@@ -352,39 +332,55 @@ class GameController:
         self.screen.onkeypress(self.restart_game, "r")
         self.screen.listen()
 
-    def save_score_to_csv(self):
-        """Save the player's username and score to a CSV file."""
-        filename = "scores.csv"
-        file_exists = os.path.isfile(filename)
+    def save_score(self, username, score):
+        """
+        Save a score to the leaderboard and read back the top scores. Runs on the I/O worker.
 
-        with open(filename, mode='a', newline='', encoding='utf-8') as csvfile:
-            writer = csv.writer(csvfile)
-            # Write header if file does not exist
-            if not file_exists:
-                writer.writerow(["username", "score"])
-            writer.writerow([self.username, self.player.score])
+        Args:
+            username (str): The name of the player.
+            score (int): The player's score.
 
-    def show_scoreboard(self):
+        Returns:
+            list: The top (username, score) tuples of the leaderboard.
         """
-        Show the top scores from the CSV file on screen after the game is over.
-        The scoreboard is shown below the Game Over message.
+        if self.leaderboard is None:
+            self.leaderboard = open_leaderboard()
+        self.leaderboard.add(username, score)
+        return self.leaderboard.top(SCOREBOARD_SIZE)
+
+    def _sync_scores(self):
+        """Make the saved scores durable on disk. Runs on the I/O worker when it is idle."""
+        if self.leaderboard is not None:
+            self.leaderboard.sync()
+
+    def _close_leaderboard(self):
+        """Close the leaderboard. Runs on the I/O worker."""
+        if self.leaderboard is not None:
+            self.leaderboard.close()
+            self.leaderboard = None
+
+    def shutdown(self, wait=False):
         """
-        filename = "scores.csv"
-        if not os.path.isfile(filename):
-            return
+        Stop the frame loop and let the I/O worker finish its pending writes and exit.
 
-        scores = []
-        with open(filename, mode='r', encoding='utf-8') as csvfile:
-            reader = csv.DictReader(csvfile)
-            for row in reader:
-                try:
-                    score = int(row["score"])
-                    scores.append((row["username"], score))
-                except ValueError:
-                    continue
+        Args:
+            wait (bool): Wait until the worker has exited, so none of its jobs can touch
+                the controller afterwards.
+        """
+        self.scheduler.stop()
+        self.io.submit(self._close_leaderboard)
+        self.io.stop()
+        if wait:
+            self.io.join()
 
-        # Sort scores in descending order by score
-        scores.sort(key=lambda x: x[1], reverse=True)
+    def show_scoreboard(self, scores):
+        """
+        Show the top scores of the leaderboard on screen after the game is over.
+        The scoreboard is shown below the Game Over message.
+
+        Args:
+            scores (list): The top (username, score) tuples, best first.
+        """
 
         self.scoreboard_turtle.clear()
         self.scoreboard_turtle.goto(0, -150)
@@ -394,9 +390,9 @@ class GameController:
             font=("Arial", 20, "bold")
         )
 
-        # Show top 5 scores
+        # Show top scores
         y_offset = -180
-        for i, (user, score) in enumerate(scores[:5], start=1):
+        for i, (user, score) in enumerate(scores, start=1):
             self.scoreboard_turtle.goto(0, y_offset)
             self.scoreboard_turtle.write(
                 f"{i}. {user}: {score}",
@@ -410,51 +406,69 @@ class GameController:
         Restart the game from the beginning.
         This method re-initializes the GameController and starts fresh.
         """
+        # The old worker must be done with self.leaderboard before __init__ resets it
+        self.shutdown(wait=True)
         self.screen.clear()
-        self.__init__()
+        self.__init__(self.record_path, self.replay_path)
 
     def game_loop(self):
         """
-        Main game loop: update the player, enemies, mystery balls,
-        check for game over, and schedule the next frame.
+        Main game loop, run by the scheduler every frame: run as many fixed simulation
+        steps as the elapsed real time calls for, refresh the HUD and check for game over.
+        A replay runs exactly one step per frame, as fast as the screen can draw.
         """
-        self.player.update(self.enemies)
-        self.health_ui()
-        self.display_score()
+        if self.replay is not None:
+            if self.clock.frame >= self.replay.frames and not self.world.game_over:
+                self.scheduler.remove_system("game")
+                return
+            self.replay.apply(self.world)
+            self.world.step()
+        else:
+            now = time.perf_counter()
+            if self._last_frame_time is None:
+                self._last_frame_time = now - self.clock.timestep
+            steps = self.clock.advance(now - self._last_frame_time)
+            self._last_frame_time = now
+
+            for _ in range(steps):
+                self.world.step()
+                if self.world.game_over:
+                    break
+
+        with self.profiler.scope("hud"):
+            self.health_ui()
+            self.display_score()
+            self.hud.raise_to_top()
 
         if self.player._health <= 0:
+            self.scheduler.remove_system("game")
+            if self.recorder is not None:
+                self.io.submit(self.recorder.save, self.record_path, self.clock.frame)
             self.display_game_over()
-            self.screen.update()
-            return
-
-        for ball in self.mystery_balls[:]:
-            ball.move()
-            if self.player.distance(ball) < self.player.size + ball.size:
-                ball.activate_ability(self.player)
-                self.mystery_balls.remove(ball)
-            elif ball.is_off_screen():
-                ball._hide_ball()
-                self.mystery_balls.remove(ball)
-
-        for enemy in self.enemies[:]:
-            enemy.update(self.player)
-            if enemy._is_destroyed:
-                self.enemies.remove(enemy)
-                self.player.score += 1
-
-        if not self.enemies:
-            for _ in range(random.randint(1, 4)):
-                self.spawn_enemy()
-
-        if self.player.score % 7 == 0 and self.player.score != self.last_score_used_to_spawn:
-            self.spawn_mystery_ball()
-            self.last_score_used_to_spawn = self.player.score
 
-        self.screen.update()
-        self.screen.ontimer(self.game_loop, int(1000 / FPS))
+    def update_profiler_overlay(self):
+        """Refresh the profiler overlay with live entity and turtle counts, if it is shown."""
+        self.profiler_overlay.update({
+            "enemies": len(self.enemies),
+            "bullets": self.world.bullet_count,
+            "mystery balls": len(self.mystery_balls),
+            "pooled bullets": lambda: len(self.world.bullet_pool),
+            "explosions": lambda: len(self.effects),
+            "turtles": lambda: len(self.screen.turtles()),
+            "canvas items": lambda: len(self.canvas.find_all()),
+            "image memory KB": lambda: self.assets.memory() // 1024,
+        })
 
 
 if __name__ == "__main__":
-    game = GameController()
+    parser = argparse.ArgumentParser(description="Airplane Shooting Game")
+    parser.add_argument("--record", metavar="PATH", help="Record the session's inputs to a replay file.")
+    parser.add_argument("--replay", metavar="PATH", help="Play back a recorded replay file.")
+    args = parser.parse_args()
+    game = GameController(record_path=args.record, replay_path=args.replay)
     turtle.tracer(0)
-    turtle.mainloop()
\ No newline at end of file
+    try:
+        turtle.mainloop()
+    finally:
+        # Also on Ctrl-C or an error, or the non-daemon I/O worker keeps the process alive
+        game.shutdown()
\ No newline at end of file
@@ -1,5 +1,3 @@
-import random
-import time
 from const import *
 from ball import Ball
 from airplane import PlayerAirplane
@@ -13,8 +11,9 @@ class MysteryBall(Ball):
     providing a different power-up. When the player collects a MysteryBall, a corresponding ability
     is activated for a limited duration.
     """
+    __slots__ = ("type", "time_collected", "_shape")
 
-    def __init__(self, size, x, y, vx, vy, color, ball_type):
+    def __init__(self, size, x, y, vx, vy, color, ball_type, bounds=None):
         """
         Initialize a MysteryBall with the given parameters.
 
@@ -26,16 +25,21 @@ class MysteryBall(Ball):
             vy (float): The vertical velocity of the ball.
             color (str): The color of the ball (unused if using images).
             ball_type (int): The type of the mystery ball, determining the ability it grants.
+            bounds (tuple): The (half_width, half_height) of the world. Defaults to the game screen.
         """
-        super().__init__(size, x, y, vx, vy, color)
+        super().__init__(size, x, y, vx, vy, color, bounds)
         self.type = ball_type
         self.time_collected = None
 
-        # Set the MysteryBall image based on its type
-        self._shape = f"picture/MYSTERY_BALL{self.type}.gif"
-        self.turtle.screen.register_shape(self._shape)
-        self.turtle.shape(self._shape)
-        self.turtle.goto(self.x, self.y)
+        # The MysteryBall image based on its type, used by its view
+        self._shape = MYSTERY_BALL_PICS[self.type]
+
+    @property
+    def shape(self):
+        """
+        str: The image shape used to draw the MysteryBall.
+        """
+        return self._shape
 
     def move(self):
         """
@@ -44,18 +48,17 @@ class MysteryBall(Ball):
         This updates the y-position of the MysteryBall, causing it to fall down the screen.
         """
         self.y += self.vy
-        self.turtle.clear()
-        self.turtle.penup()
-        self.turtle.goto(self.x, self.y)
+        if self.view is not None:
+            self.view.update(self)
 
     def is_off_screen(self):
         """
         Check if the MysteryBall has moved off the screen.
 
         Returns:
-            bool: True if the MysteryBall is below the bottom of the screen, False otherwise.
+            bool: True if the MysteryBall is below the bottom of its world, False otherwise.
         """
-        return self.y < -SCREEN_HEIGHT / 2
+        return self.y < -self.canvas_height
 
     def activate_ability(self, player: PlayerAirplane):
         """
@@ -71,7 +74,7 @@ class MysteryBall(Ball):
             player.increase_health()
         elif self.type == MYSTERY_BALL3:
             player.double_speed()
-        self.time_collected = time.time()
+        self.time_collected = player.clock.now
         self._hide_ball()
 
     def is_ability_active(self, player: PlayerAirplane):
@@ -86,16 +89,19 @@ class MysteryBall(Ball):
         Returns:
             bool: True if the ability is still active, False otherwise.
         """
-        if self.time_collected and (time.time() - self.time_collected) > MYSTERY_BALL_LIFETIME:
+        if self.time_collected is not None and player.clock.elapsed_since(self.time_collected) > MYSTERY_BALL_LIFETIME:
             player.deactivate_ability()
             return False
         return True
 
     def _hide_ball(self):
         """
-        Hide the MysteryBall’s turtle representation.
+        Remove the MysteryBall’s on-screen representation, if it has one, and dispose of its
+        view so its turtle can be reused.
 
-        This method is called after the ball has been collected by the player.
+        This method is called after the ball has been collected by the player or has left
+        the screen.
         """
-        self.turtle.hideturtle()
-        self.turtle.clear()
\ No newline at end of file
+        if self.view is not None:
+            self.view.dispose()
+            self.view = None
\ No newline at end of file
@@ -0,0 +1,411 @@
+import numpy as np
+from const import *
+
+
+class ParticleArray:
+    """
+    A ParticleArray stores many balls as a structure of arrays.
+
+    Instead of one Python object per ball, positions, velocities, sizes and masses live in
+    contiguous NumPy arrays, so moving, bouncing and culling every particle is a single
+    vectorized step per frame. Only the first `n` slots of each array are in use; removed
+    particles are compacted away so the live particles stay contiguous.
+    """
+
+    FIELDS = ("x", "y", "vx", "vy", "size", "mass")
+
+    def __init__(self, capacity=1024, bounds=None):
+        """
+        Initialize an empty ParticleArray.
+
+        Args:
+            capacity (int): The initial number of slots to allocate. The arrays grow as needed.
+            bounds (tuple): The (half_width, half_height) of the world, centered on the origin.
+                Defaults to the game screen.
+        """
+        if bounds is None:
+            bounds = (SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2)
+        self.canvas_width = bounds[0]
+        self.canvas_height = bounds[1]
+        self.n = 0
+        for field in self.FIELDS:
+            setattr(self, field, np.zeros(capacity, dtype=np.float64))
+        self.count = np.zeros(capacity, dtype=np.int64)
+
+    def __len__(self):
+        """
+        Return the number of live particles.
+
+        Returns:
+            int: The number of live particles.
+        """
+        return self.n
+
+    @property
+    def capacity(self):
+        """
+        int: The number of allocated slots.
+        """
+        return len(self.x)
+
+    def _reserve(self, needed):
+        """
+        Grow the arrays so that at least `needed` particles fit.
+
+        Args:
+            needed (int): The number of slots required.
+        """
+        if needed <= self.capacity:
+            return
+        new_capacity = max(needed, 2 * self.capacity)
+        for field in self.FIELDS + ("count",):
+            old = getattr(self, field)
+            new = np.zeros(new_capacity, dtype=old.dtype)
+            new[:self.n] = old[:self.n]
+            setattr(self, field, new)
+
+    def add(self, x, y, vx, vy, size):
+        """
+        Add a single particle.
+
+        Args:
+            x (float): The x-coordinate of the particle's center.
+            y (float): The y-coordinate of the particle's center.
+            vx (float): The horizontal velocity.
+            vy (float): The vertical velocity.
+            size (float): The radius of the particle.
+
+        Returns:
+            int: The index of the new particle (valid until the next cull).
+        """
+        return self.add_many([x], [y], [vx], [vy], [size])[0]
+
+    def add_many(self, x, y, vx, vy, size):
+        """
+        Add a batch of particles at once.
+
+        Args:
+            x, y, vx, vy, size (array-like): Per-particle values, all of the same length.
+                `size` may also be a scalar shared by every particle.
+
+        Returns:
+            numpy.ndarray: The indices of the new particles.
+        """
+        x = np.asarray(x, dtype=np.float64)
+        k = len(x)
+        start = self.n
+        self._reserve(start + k)
+        end = start + k
+        self.x[start:end] = x
+        self.y[start:end] = y
+        self.vx[start:end] = vx
+        self.vy[start:end] = vy
+        self.size[start:end] = size
+        # Same mass as Ball: 100 * size ** 2
+        self.mass[start:end] = 100 * self.size[start:end] ** 2
+        self.count[start:end] = 0
+        self.n = end
+        return np.arange(start, end)
+
+    def move(self, dt=1.0):
+        """
+        Integrate every live particle along its velocity.
+
+        Args:
+            dt (float): The time step, in frames.
+        """
+        n = self.n
+        self.x[:n] += self.vx[:n] * dt
+        self.y[:n] += self.vy[:n] * dt
+
+    def bounce_off_walls(self):
+        """
+        Reflect the velocity of every particle touching a wall while moving into it.
+
+        This has the same effect as `Ball.bounce_off_vertical_wall` and
+        `Ball.bounce_off_horizontal_wall`, applied to all particles at once, including
+        incrementing their collision counts. A particle that moved past a wall during the
+        last step is also put back against it, so it stays inside the world bounds.
+
+        Returns:
+            int: The number of wall bounces applied.
+        """
+        n = self.n
+        x, y, vx, vy, size = self.x[:n], self.y[:n], self.vx[:n], self.vy[:n], self.size[:n]
+
+        hit_x = ((x + size >= self.canvas_width) & (vx > 0)) | ((x - size <= -self.canvas_width) & (vx < 0))
+        hit_y = ((y + size >= self.canvas_height) & (vy > 0)) | ((y - size <= -self.canvas_height) & (vy < 0))
+        vx[hit_x] *= -1
+        vy[hit_y] *= -1
+        x[hit_x] = np.clip(x[hit_x], size[hit_x] - self.canvas_width, self.canvas_width - size[hit_x])
+        y[hit_y] = np.clip(y[hit_y], size[hit_y] - self.canvas_height, self.canvas_height - size[hit_y])
+        self.count[:n] += hit_x.astype(np.int64) + hit_y.astype(np.int64)
+        return int(hit_x.sum() + hit_y.sum())
+
+    def off_screen_mask(self):
+        """
+        Compute which live particles are outside the world bounds.
+
+        Returns:
+            numpy.ndarray: A boolean mask over the live particles, True where off screen.
+        """
+        n = self.n
+        inside = (np.abs(self.x[:n]) < self.canvas_width) & (np.abs(self.y[:n]) < self.canvas_height)
+        return ~inside
+
+    def remove(self, mask):
+        """
+        Remove the particles selected by `mask` and compact the survivors.
+
+        Args:
+            mask (numpy.ndarray): A boolean mask over the live particles, True to remove.
+
+        Returns:
+            int: The number of particles removed.
+        """
+        n = self.n
+        keep = ~np.asarray(mask, dtype=bool)
+        kept = int(keep.sum())
+        if kept == n:
+            return 0
+        for field in self.FIELDS + ("count",):
+            arr = getattr(self, field)
+            arr[:kept] = arr[:n][keep]
+        self.n = kept
+        return n - kept
+
+    def cull_off_screen(self):
+        """
+        Remove every particle that has left the world bounds.
+
+        Returns:
+            int: The number of particles removed.
+        """
+        return self.remove(self.off_screen_mask())
+
+    def step(self, dt=1.0, bounce=True, cull=False):
+        """
+        Advance every particle by one frame.
+
+        Args:
+            dt (float): The time step, in frames.
+            bounce (bool): Reflect particles off the walls after moving them, keeping them
+                inside the world bounds.
+            cull (bool): Remove particles that left the screen after moving (and bouncing)
+                them.
+        """
+        self.move(dt)
+        if bounce:
+            self.bounce_off_walls()
+        if cull:
+            self.cull_off_screen()
+
+    def time_to_hit_matrix(self):
+        """
+        Compute the predicted contact time of every pair of live particles.
+
+        Returns:
+            numpy.ndarray: An (n, n) matrix, see `time_to_hit_matrix`.
+        """
+        n = self.n
+        return time_to_hit_matrix(self.x[:n], self.y[:n], self.vx[:n], self.vy[:n], self.size[:n])
+
+    def earliest_hits(self):
+        """
+        Find the earliest predicted contact of every live particle.
+
+        Returns:
+            tuple: (times, partners), see `earliest_hits`.
+        """
+        n = self.n
+        return earliest_hits(self.x[:n], self.y[:n], self.vx[:n], self.vy[:n], self.size[:n])
+
+
+def _time_to_hit_blocks(x, y, vx, vy, radius, block):
+    """
+    Compute the contact times of every pair of particles, `block` rows at a time.
+
+    This is `Ball.time_to_hit` evaluated with NumPy broadcasting. Contact times are
+    symmetric, so the block of rows `start:stop` is only computed against the particles from
+    `start` on: the columns before `start` were already computed as rows of earlier blocks.
+    The arithmetic reuses a few block-sized buffers in place instead of allocating a new
+    temporary for every operation.
+
+    Args:
+        x, y, vx, vy, radius (numpy.ndarray): Per-particle values, all of length n.
+        block (int): The number of rows computed at once.
+
+    Yields:
+        tuple: (start, stop, t), where t is a (stop - start, n - start) matrix and entry
+        [i, j] is the time until particle `start + i` hits particle `start + j`, or inf if
+        they never collide (including a particle with itself).
+    """
+    n = len(x)
+    for start in range(0, n, block):
+        stop = min(n, start + block)
+        rows = slice(start, stop)
+        dx = x[None, start:] - x[rows, None]
+        dy = y[None, start:] - y[rows, None]
+        dvx = vx[None, start:] - vx[rows, None]
+        dvy = vy[None, start:] - vy[rows, None]
+
+        dvdr = dx * dvx
+        tmp = np.multiply(dy, dvy)
+        dvdr += tmp
+        # dx = drdr - sigma * sigma
+        np.multiply(dx, dx, out=dx)
+        np.multiply(dy, dy, out=tmp)
+        dx += tmp
+        np.add(radius[None, start:], radius[rows, None], out=dy)
+        np.multiply(dy, dy, out=dy)
+        dx -= dy
+        # dvx = dvdv
+        np.multiply(dvx, dvx, out=dvx)
+        np.multiply(dvy, dvy, out=dvy)
+        dvx += dvy
+        # t = -(dvdr + sqrt(d)) / dvdv, with d = dvdr * dvdr - dvdv * (drdr - sigma * sigma)
+        t = dx
+        t *= dvx
+        np.multiply(dvdr, dvdr, out=dy)
+        np.subtract(dy, t, out=t)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            np.sqrt(t, out=t)
+            t += dvdr
+            t /= dvx
+        np.negative(t, out=t)
+        # No contact if the particles move apart or miss (d < 0 gives NaN). A particle and
+        # itself have dvdr == 0, so the diagonal is inf as well.
+        valid = np.greater(t, 0, out=np.empty(t.shape, dtype=bool))
+        valid &= dvdr < 0
+        np.copyto(t, np.inf, where=~valid)
+        yield start, stop, t
+
+
+def time_to_hit_matrix(x, y, vx, vy, radius, block=64):
+    """
+    Compute the predicted contact time of every pair of particles at once.
+
+    Args:
+        x, y, vx, vy, radius (array-like): Per-particle positions, velocities and radii.
+        block (int): The number of rows computed at once.
+
+    Returns:
+        numpy.ndarray: An (n, n) symmetric matrix where entry [i, j] is the time until
+        particle i hits particle j, or inf if they never collide.
+    """
+    x, y, vx, vy, radius = (np.asarray(a, dtype=np.float64) for a in (x, y, vx, vy, radius))
+    n = len(x)
+    matrix = np.empty((n, n))
+    for start, stop, t in _time_to_hit_blocks(x, y, vx, vy, radius, block):
+        matrix[start:stop, start:] = t
+        matrix[start:, start:stop] = t.T
+    return matrix
+
+
+def earliest_hits(x, y, vx, vy, radius, block=64):
+    """
+    Find the earliest predicted contact of every particle.
+
+    The pair matrix is computed `block` rows at a time, so memory stays bounded for
+    thousands of particles. Each block updates the running minimum of its own rows and,
+    through symmetry, of the later rows it was computed against.
+
+    Args:
+        x, y, vx, vy, radius (array-like): Per-particle positions, velocities and radii.
+        block (int): The number of rows computed at once.
+
+    Returns:
+        tuple: (times, partners) arrays of length n. `times[i]` is the time until particle
+        i first hits another particle (inf if never) and `partners[i]` is the index of that
+        particle (-1 if none).
+    """
+    x, y, vx, vy, radius = (np.asarray(a, dtype=np.float64) for a in (x, y, vx, vy, radius))
+    n = len(x)
+    times = np.full(n, np.inf)
+    partners = np.full(n, -1, dtype=np.int64)
+
+    for start, stop, t in _time_to_hit_blocks(x, y, vx, vy, radius, block):
+        size = stop - start
+        # The rows of the block, against every particle from `start` on
+        j = t.argmin(axis=1)
+        t_min = t[np.arange(size), j]
+        better = t_min < times[start:stop]
+        times[start:stop][better] = t_min[better]
+        partners[start:stop][better] = j[better] + start
+        # The later particles, against the rows of the block
+        if stop < n:
+            rest = t[:, size:]
+            i = rest.argmin(axis=0)
+            t_min = rest[i, np.arange(n - stop)]
+            better = t_min < times[stop:]
+            times[stop:][better] = t_min[better]
+            partners[stop:][better] = i[better] + start
+    return times, partners
+
+
+def _merge_top_k(times, partners, t, idx, k):
+    """
+    Merge candidate contacts into running per-row top-k arrays, in place.
+
+    Args:
+        times (numpy.ndarray): The (m, k) running contact times of some rows.
+        partners (numpy.ndarray): The (m, k) running partner indices of the same rows.
+        t (numpy.ndarray): The (m, c) candidate contact times of those rows.
+        idx (numpy.ndarray): The (m, c) partner indices of the candidates.
+        k (int): The number of contacts kept per row.
+    """
+    all_t = np.concatenate((times, t), axis=1)
+    all_idx = np.concatenate((partners, idx), axis=1)
+    keep = np.argpartition(all_t, k - 1, axis=1)[:, :k]
+    times[:] = np.take_along_axis(all_t, keep, axis=1)
+    partners[:] = np.take_along_axis(all_idx, keep, axis=1)
+
+
+def top_k_hits(x, y, vx, vy, radius, k, block=64):
+    """
+    Find the `k` earliest predicted contacts of every particle.
+
+    Args:
+        x, y, vx, vy, radius (array-like): Per-particle positions, velocities and radii.
+        k (int): The number of contacts to keep per particle.
+        block (int): The number of rows computed at once.
+
+    Returns:
+        tuple: (times, partners) arrays of shape (n, k), sorted by time along each row.
+        Missing contacts have a time of inf and a partner of -1.
+    """
+    x, y, vx, vy, radius = (np.asarray(a, dtype=np.float64) for a in (x, y, vx, vy, radius))
+    n = len(x)
+    k = max(1, min(k, n))
+    if k == 1:
+        times, partners = earliest_hits(x, y, vx, vy, radius, block)
+        return times[:, None], partners[:, None]
+
+    times = np.full((n, k), np.inf)
+    partners = np.full((n, k), -1, dtype=np.int64)
+    for start, stop, t in _time_to_hit_blocks(x, y, vx, vy, radius, block):
+        size = stop - start
+        # The rows of the block, against every particle from `start` on
+        if t.shape[1] > k:
+            idx = np.argpartition(t, k - 1, axis=1)[:, :k]
+            t_k = np.take_along_axis(t, idx, axis=1)
+        else:
+            idx = np.broadcast_to(np.arange(t.shape[1]), t.shape)
+            t_k = t
+        _merge_top_k(times[start:stop], partners[start:stop], t_k, idx + start, k)
+        # The later particles, against the rows of the block
+        if stop < n:
+            rest = t[:, size:]
+            if size > k:
+                idx = np.argpartition(rest, k - 1, axis=0)[:k]
+                t_k = np.take_along_axis(rest, idx, axis=0)
+            else:
+                idx = np.broadcast_to(np.arange(size)[:, None], rest.shape)
+                t_k = rest
+            _merge_top_k(times[stop:], partners[stop:], t_k.T, idx.T + start, k)
+
+    order = np.argsort(times, axis=1)
+    times = np.take_along_axis(times, order, axis=1)
+    partners = np.take_along_axis(partners, order, axis=1)
+    partners[~np.isfinite(times)] = -1
+    return times, partners
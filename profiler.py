@@ -0,0 +1,166 @@
+import time
+from collections import deque
+from contextlib import contextmanager
+from const import *
+
+
+class FrameProfiler:
+    """
+    Collect per-stage frame timings over a rolling window.
+
+    Code paths are wrapped in named scopes (`with profiler.scope("enemies"): ...`) and the
+    profiler keeps the last `window` durations of each scope, from which it reports rolling
+    p50/p95/p99 values.
+    """
+
+    def __init__(self, window=PROFILER_WINDOW):
+        """
+        Initialize an empty profiler.
+
+        Args:
+            window (int): The number of samples kept per scope.
+        """
+        self.window = window
+        self.enabled = True
+        self._samples = {}
+
+    @contextmanager
+    def scope(self, name):
+        """
+        Time the body of a `with` block under the given name.
+
+        Args:
+            name (str): The name of the stage being timed.
+        """
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def record(self, name, seconds):
+        """
+        Record one duration for a stage.
+
+        Args:
+            name (str): The name of the stage.
+            seconds (float): The measured duration, in seconds.
+        """
+        samples = self._samples.get(name)
+        if samples is None:
+            samples = deque(maxlen=self.window)
+            self._samples[name] = samples
+        samples.append(seconds)
+
+    def percentiles(self, name):
+        """
+        Compute the rolling p50, p95 and p99 of a stage.
+
+        Args:
+            name (str): The name of the stage.
+
+        Returns:
+            tuple: (p50, p95, p99) in milliseconds, or (0, 0, 0) if nothing was recorded.
+        """
+        samples = sorted(self._samples.get(name, ()))
+        if not samples:
+            return (0.0, 0.0, 0.0)
+        return tuple(percentile(samples, q) * 1000 for q in (50, 95, 99))
+
+    def report(self):
+        """
+        Get the rolling percentiles of every stage.
+
+        Returns:
+            dict: Maps each stage name to a dict with "p50", "p95" and "p99" in milliseconds.
+        """
+        report = {}
+        for name in self._samples:
+            p50, p95, p99 = self.percentiles(name)
+            report[name] = {"p50": p50, "p95": p95, "p99": p99}
+        return report
+
+    def reset(self):
+        """Forget every recorded sample."""
+        self._samples.clear()
+
+
+def percentile(sorted_samples, q):
+    """
+    Compute a percentile of already sorted samples (nearest-rank method).
+
+    Args:
+        sorted_samples (list): The samples, sorted in increasing order.
+        q (float): The percentile, between 0 and 100.
+
+    Returns:
+        float: The sample at the requested percentile.
+    """
+    if not sorted_samples:
+        return 0.0
+    rank = int(round(q / 100 * (len(sorted_samples) - 1)))
+    return sorted_samples[rank]
+
+
+class ProfilerOverlay:
+    """
+    An on-screen table of the profiler's per-stage percentiles and live entity counts.
+
+    The overlay is a single canvas text item, hidden by default and toggled with a key.
+    It only rewrites its text every PROFILER_REFRESH_FRAMES frames while visible.
+    """
+
+    def __init__(self, canvas, profiler):
+        """
+        Initialize a hidden overlay.
+
+        Args:
+            canvas (tkinter.Canvas): The turtle screen's canvas.
+            profiler (FrameProfiler): The profiler whose timings are shown.
+        """
+        self.canvas = canvas
+        self.profiler = profiler
+        self.visible = False
+        self._item = None
+        self._frames = 0
+
+    def toggle(self):
+        """Show the overlay if it is hidden, hide it otherwise."""
+        self.visible = not self.visible
+        if self._item is None:
+            # Turtle coordinates (x, y) map to canvas coordinates (x, -y)
+            self._item = self.canvas.create_text(
+                -SCREEN_WIDTH / 2 + 10, -(SCREEN_HEIGHT / 2 - 90),
+                text="", anchor="nw", fill=WHITE, font=PROFILER_FONT
+            )
+        self.canvas.itemconfig(self._item, state="normal" if self.visible else "hidden")
+        self._frames = 0
+
+    def update(self, counts):
+        """
+        Refresh the overlay text, at most once every PROFILER_REFRESH_FRAMES frames.
+
+        Args:
+            counts (dict): Live counts to show below the timings, e.g. {"enemies": 4}.
+                Values may be callables, which are only evaluated when the text is refreshed.
+        """
+        if not self.visible:
+            return
+        self._frames += 1
+        if self._frames % PROFILER_REFRESH_FRAMES != 1:
+            return
+
+        lines = [f"{'stage':<14}{'p50':>7}{'p95':>7}{'p99':>7}  ms"]
+        for name, stats in self.profiler.report().items():
+            lines.append(f"{name:<14}{stats['p50']:>7.2f}{stats['p95']:>7.2f}{stats['p99']:>7.2f}")
+        lines.append("")
+        for name, value in counts.items():
+            if callable(value):
+                value = value()
+            lines.append(f"{name}: {value}")
+
+        self.canvas.itemconfig(self._item, text="\n".join(lines))
+        self.canvas.tag_raise(self._item)
@@ -0,0 +1,128 @@
+from const import *
+from spatial_hash import SpatialHash, overlaps, swept_hit_time
+
+
+class ProjectileRegistry:
+    """
+    Every bullet in flight, in one flat list owned by the world.
+
+    Bullets are tagged with their owner (PLAYER or ENEMY) and the airplane that fired them,
+    but do not live in that airplane: a destroyed enemy's shots keep flying. Each bullet
+    knows its index in the list, so removing one swaps the last bullet into its place
+    (O(1), no `list.remove`), and `update` moves and collides every bullet in one linear
+    sweep per step.
+    """
+
+    def __init__(self, bullet_pool):
+        """
+        Initialize an empty registry.
+
+        Args:
+            bullet_pool (BulletPool): The pool removed bullets are returned to.
+        """
+        self.bullet_pool = bullet_pool
+        self.bullets = []
+        self._serial = 0
+        self._enemy_hash = SpatialHash()
+
+    def __len__(self):
+        """
+        Returns:
+            int: The number of bullets in flight.
+        """
+        return len(self.bullets)
+
+    def add(self, bullet, shooter):
+        """
+        Put a freshly fired bullet in flight.
+
+        Args:
+            bullet (Bullet): The bullet, with its owner tag already set.
+            shooter (Airplane): The airplane that fired it.
+
+        Returns:
+            int: The bullet's serial number, increasing with every bullet fired.
+        """
+        self._serial += 1
+        bullet.shooter = shooter
+        bullet.serial = self._serial
+        bullet.index = len(self.bullets)
+        self.bullets.append(bullet)
+        shooter.live_bullets += 1
+        return self._serial
+
+    def remove(self, bullet):
+        """
+        Take a bullet out of flight, filling its slot with the last bullet, and return it
+        to the pool.
+
+        Args:
+            bullet (Bullet): A bullet in flight.
+        """
+        bullets = self.bullets
+        last = bullets.pop()
+        if last is not bullet:
+            bullets[bullet.index] = last
+            last.index = bullet.index
+        bullet.index = -1
+        bullet.shooter.live_bullets -= 1
+        bullet.shooter = None
+        self.bullet_pool.release(bullet)
+
+    def clear(self):
+        """Take every bullet out of flight."""
+        while self.bullets:
+            self.remove(self.bullets[-1])
+
+    def count(self, owner):
+        """
+        Count the bullets in flight of one side.
+
+        Args:
+            owner (int): PLAYER or ENEMY.
+
+        Returns:
+            int: The number of bullets with that owner tag.
+        """
+        return sum(1 for bullet in self.bullets if bullet.owner == owner)
+
+    def update(self, player, enemies):
+        """
+        Move every bullet, then remove those that left the screen or hit something:
+        player bullets damage the first enemy they touch, enemy bullets damage the player.
+
+        Args:
+            player (PlayerAirplane): The player.
+            enemies (list): The enemy airplanes.
+        """
+        swept = CONTINUOUS_COLLISION
+        enemy_hash = self._enemy_hash
+        enemy_hash.rebuild([enemy for enemy in enemies if not enemy._is_destroyed])
+        player_x, player_y, player_size = player.x, player.y, player.size
+        bullets = self.bullets
+        i = 0
+        while i < len(bullets):
+            bullet = bullets[i]
+            bullet.move()
+            if bullet.is_off_screen():
+                self.remove(bullet)
+                continue
+            if bullet.owner == PLAYER:
+                enemy = enemy_hash.first_hit(bullet, swept=swept)
+                if enemy is not None:
+                    enemy.take_damage(10)
+                    if enemy._is_destroyed:
+                        enemy_hash.rebuild([e for e in enemies if not e._is_destroyed])
+                    self.remove(bullet)
+                    continue
+            else:
+                # The bullet's path this step lies within |v| of where it is now
+                reach = player_size + bullet.size
+                if (abs(player_x - bullet.x) < reach + abs(bullet.vx)
+                        and abs(player_y - bullet.y) < reach + abs(bullet.vy)
+                        and (swept_hit_time(bullet, player) <= 1.0 if swept
+                             else overlaps(bullet, player))):
+                    player.take_damage(1)
+                    self.remove(bullet)
+                    continue
+            i += 1
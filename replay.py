@@ -0,0 +1,189 @@
+"""
+Input recording and deterministic replay.
+
+A replay stores the seed of the world's spawn RNG and every player input together with
+the simulation frame it was applied on. Because the simulation only depends on the seed,
+the fixed-timestep clock and the inputs, re-applying the inputs on the same frames of a
+world with the same seed reproduces the session exactly.
+
+Replay a file headless, as fast as possible:
+
+    python replay.py session.replay
+"""
+import argparse
+import gzip
+import json
+import time
+from const import *
+from world import GameWorld
+from sound_mange import SoundManager
+
+# Player methods an input can call, in the order of their compact codes
+ACTIONS = (
+    "press_up", "release_up",
+    "press_down", "release_down",
+    "press_left", "release_left",
+    "press_right", "release_right",
+    "press_space", "release_space",
+)
+ACTION_CODES = {action: code for code, action in enumerate(ACTIONS)}
+
+
+class InputRecorder:
+    """
+    Record player inputs with the simulation frame they were applied on.
+    """
+
+    def __init__(self, seed):
+        """
+        Initialize an empty recording.
+
+        Args:
+            seed (int): The seed of the world's spawn RNG.
+        """
+        self.seed = seed
+        self.events = []
+
+    def record(self, frame, action):
+        """
+        Record one input.
+
+        Args:
+            frame (int): The simulation frame the input is applied before.
+            action (str): The name of the player method called, one of ACTIONS.
+        """
+        self.events.append((frame, ACTION_CODES[action]))
+
+    def save(self, path, frames):
+        """
+        Write the recording to a gzip-compressed replay file.
+
+        Frames are stored as deltas from the previous event, so long sessions stay small.
+
+        Args:
+            path (str): The file to write.
+            frames (int): The number of simulation frames the session lasted.
+        """
+        packed = []
+        previous = 0
+        for frame, code in self.events:
+            packed.append([frame - previous, code])
+            previous = frame
+        data = {
+            "version": REPLAY_VERSION,
+            "seed": self.seed,
+            "frames": frames,
+            "actions": list(ACTIONS),
+            "events": packed,
+        }
+        with gzip.open(path, "wt", encoding="utf-8") as f:
+            json.dump(data, f, separators=(",", ":"))
+
+
+class Replay:
+    """
+    Re-apply recorded inputs to a world, frame by frame.
+    """
+
+    def __init__(self, seed, frames, events):
+        """
+        Initialize a replay.
+
+        Args:
+            seed (int): The seed of the world's spawn RNG.
+            frames (int): The number of simulation frames of the recorded session.
+            events (list): (frame, action) pairs, in the order they were recorded.
+        """
+        self.seed = seed
+        self.frames = frames
+        self.events = events
+        self._next = 0
+
+    @classmethod
+    def load(cls, path):
+        """
+        Read a replay file written by `InputRecorder.save`.
+
+        Args:
+            path (str): The file to read.
+
+        Returns:
+            Replay: The loaded replay.
+
+        Raises:
+            ValueError: If the file was written by an unsupported replay version.
+        """
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != REPLAY_VERSION:
+            raise ValueError(f"Unsupported replay version: {data.get('version')}")
+        actions = data["actions"]
+        events = []
+        frame = 0
+        for delta, code in data["events"]:
+            frame += delta
+            events.append((frame, actions[code]))
+        return cls(data["seed"], data["frames"], events)
+
+    @property
+    def finished(self):
+        """
+        bool: True once every recorded input has been applied.
+        """
+        return self._next >= len(self.events)
+
+    def apply(self, world):
+        """
+        Apply the inputs recorded for the world's current frame. Call once before each step.
+
+        Args:
+            world (GameWorld): The world being replayed.
+        """
+        frame = world.clock.frame
+        events = self.events
+        while self._next < len(events) and events[self._next][0] <= frame:
+            getattr(world.player, events[self._next][1])()
+            self._next += 1
+
+    def run(self, world):
+        """
+        Replay the whole session headless, as fast as possible.
+
+        Args:
+            world (GameWorld): A fresh world created with this replay's seed.
+        """
+        if world.player is None:
+            world.spawn_player()
+        while world.clock.frame < self.frames and not world.game_over:
+            self.apply(world)
+            world.step()
+
+
+def main(argv=None):
+    """
+    Replay a file headless and print a summary of the final state as JSON.
+
+    Args:
+        argv (list): The command line arguments, or None to use sys.argv.
+    """
+    SoundManager.set_enabled(False)
+    parser = argparse.ArgumentParser(description="Replay a recorded session headless.")
+    parser.add_argument("path", help="The replay file.")
+    args = parser.parse_args(argv)
+
+    replay = Replay.load(args.path)
+    world = GameWorld(seed=replay.seed)
+    start = time.perf_counter()
+    replay.run(world)
+    elapsed = time.perf_counter() - start
+    print(json.dumps({
+        "frames": world.clock.frame,
+        "score": world.player.score,
+        "health": world.player._health,
+        "game_over": world.game_over,
+        "seconds": elapsed,
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+import time
+import queue
+from const import *
+
+
+class System:
+    """
+    A System is a callback the scheduler runs once per frame, or once every `interval`
+    milliseconds for periodic systems.
+    """
+
+    def __init__(self, name, callback, order, interval):
+        """
+        Initialize a system.
+
+        Args:
+            name (str): The unique name of the system.
+            callback (callable): The function to run. It takes no arguments.
+            order (int): Systems run in increasing order.
+            interval (float): The minimum milliseconds between two runs; 0 runs every frame.
+        """
+        self.name = name
+        self.callback = callback
+        self.order = order
+        self.interval = interval
+        self.next_run = 0.0
+
+
+class FrameScheduler:
+    """
+    The single frame loop of the game.
+
+    Instead of every animation scheduling its own `ontimer` chain and calling
+    `screen.update()`, subsystems register with the scheduler. Each frame it runs the
+    delayed callbacks that are due, then every due system in a defined order, and finally
+    presents the frame with exactly one `screen.update()`.
+    """
+
+    def __init__(self, screen, frame_interval=int(1000 / FPS), profiler=None):
+        """
+        Initialize a stopped scheduler.
+
+        Args:
+            screen (turtle.TurtleScreen): The screen to present, or None to run headless.
+            frame_interval (int): The milliseconds between two frames.
+            profiler (FrameProfiler): If given, every system, the present step and the whole
+                frame are timed under their names.
+        """
+        self.screen = screen
+        self.frame_interval = frame_interval
+        self.profiler = profiler
+        self.frame = 0
+        self.running = False
+        self._systems = []
+        self._timers = []
+        self._pending = queue.SimpleQueue()
+
+    def add_system(self, name, callback, order=0, interval=0):
+        """
+        Register a system, replacing any system with the same name.
+
+        Args:
+            name (str): The unique name of the system.
+            callback (callable): The function to run. It takes no arguments.
+            order (int): Systems run in increasing order; ties run in registration order.
+            interval (float): The minimum milliseconds between two runs; 0 runs every frame.
+        """
+        self.remove_system(name)
+        self._systems.append(System(name, callback, order, interval))
+        self._systems.sort(key=lambda system: system.order)
+
+    def remove_system(self, name):
+        """
+        Unregister a system. Removing a system that is not registered does nothing.
+
+        Args:
+            name (str): The name of the system.
+        """
+        self._systems = [system for system in self._systems if system.name != name]
+
+    def has_system(self, name):
+        """
+        Check whether a system is registered.
+
+        Args:
+            name (str): The name of the system.
+
+        Returns:
+            bool: True if a system with this name is registered.
+        """
+        return any(system.name == name for system in self._systems)
+
+    def call_later(self, delay, callback):
+        """
+        Run a callback once, at the start of the first frame after `delay` milliseconds.
+
+        Args:
+            delay (float): The delay in milliseconds.
+            callback (callable): The function to run. It takes no arguments.
+        """
+        self._timers.append((time.perf_counter() + delay / 1000, callback))
+
+    def call_soon_threadsafe(self, callback):
+        """
+        Run a callback at the start of the next frame. Safe to call from other threads.
+
+        Args:
+            callback (callable): The function to run. It takes no arguments.
+        """
+        self._pending.put(callback)
+
+    def start(self):
+        """Start running frames."""
+        if self.running:
+            return
+        self.running = True
+        self._schedule()
+
+    def stop(self):
+        """Stop running frames. The frame already scheduled with the screen becomes a no-op."""
+        self.running = False
+
+    def _schedule(self):
+        """Ask the screen to run the next frame."""
+        if self.screen is not None:
+            self.screen.ontimer(self._on_timer, self.frame_interval)
+
+    def _on_timer(self):
+        """Run a frame and schedule the next one, unless the scheduler was stopped."""
+        if not self.running:
+            return
+        self.run_frame()
+        if self.running:
+            self._schedule()
+
+    def run_frame(self):
+        """
+        Run one frame: due callbacks, then due systems in order, then present once.
+        """
+        now = time.perf_counter()
+        profiler = self.profiler
+
+        while not self._pending.empty():
+            self._pending.get()()
+
+        if self._timers:
+            due = [timer for timer in self._timers if timer[0] <= now]
+            if due:
+                self._timers = [timer for timer in self._timers if timer[0] > now]
+                for _, callback in due:
+                    callback()
+
+        for system in list(self._systems):
+            if system not in self._systems:
+                # Removed by a system that ran earlier in this frame
+                continue
+            if system.interval:
+                if now < system.next_run:
+                    continue
+                system.next_run = now + system.interval / 1000
+            if profiler is None:
+                system.callback()
+            else:
+                with profiler.scope(system.name):
+                    system.callback()
+
+        self.frame += 1
+        if self.screen is not None:
+            if profiler is None:
+                self.screen.update()
+            else:
+                with profiler.scope("present"):
+                    self.screen.update()
+
+        if profiler is not None:
+            profiler.record("frame", time.perf_counter() - now)
@@ -0,0 +1,281 @@
+"""
+Multi-process headless simulation farm for balancing runs.
+
+Plays many seeded games headless with scripted player policies, across every CPU core,
+for every combination of the swept enemy and spawn parameters, and writes the survival
+time, score and frame cost of each parameter set and policy to a JSON results file:
+
+    python simfarm.py --games 500 --attack-distance 200 300 400 --shot-cooldown 0.5 1.0
+    python simfarm.py --policies dodge --enemy-speed 2 3 4 --mystery-spawn-rate 5 20 \\
+        --output speed_sweep.json
+
+Every parameter set plays the same seeds, so differences between sets are not drowned out
+by differences between the games themselves.
+"""
+import argparse
+import itertools
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from const import *
+from world import GameWorld
+from sound_mange import SoundManager
+from profiler import percentile
+from benchmark import hold_space, strafe_and_shoot
+
+
+def dodge_and_shoot(world, frame):
+    """
+    Step sideways away from the closest enemy bullet coming down on the player, otherwise
+    line up under the nearest enemy, while holding the space key.
+    """
+    player = world.player
+    threat = None
+    for bullet in world.projectiles.bullets:
+        if bullet.owner != ENEMY or bullet.y < player.y:
+            continue
+        if abs(bullet.x - player.x) < player.size * 1.5 and bullet.y - player.y < 200:
+            if threat is None or bullet.y < threat.y:
+                threat = bullet
+    if threat is not None:
+        direction = 1 if threat.x <= player.x else -1
+    elif world.enemies:
+        target = min(world.enemies, key=lambda enemy: abs(enemy.x - player.x))
+        dx = target.x - player.x
+        direction = 0 if abs(dx) <= PLAYER_SPEED else (1 if dx > 0 else -1)
+    else:
+        direction = 0
+
+    player.release_left()
+    player.release_right()
+    if direction > 0:
+        player.press_right()
+    elif direction < 0:
+        player.press_left()
+    player.press_space()
+
+
+def idle(world, frame):
+    """Do nothing: never move and never shoot."""
+
+
+POLICIES = {
+    "idle": idle,
+    "hold_fire": hold_space,
+    "strafe": strafe_and_shoot,
+    "dodge": dodge_and_shoot,
+}
+
+# Command line sweep name -> EnemyAirplane attribute, or None for a GameWorld argument
+SWEEP_PARAMETERS = {
+    "attack_distance": "attack_distance",
+    "shot_cooldown": "shot_cooldown",
+    "enemy_speed": "descent_speed",
+    "mystery_spawn_rate": None,
+}
+
+
+def play_game(job):
+    """
+    Play one seeded game headless until the player dies or the time limit is reached.
+
+    Args:
+        job (tuple): (params, policy, seed, max_frames), where params maps names of
+            SWEEP_PARAMETERS to their values for this game.
+
+    Returns:
+        dict: The frames played, game time survived, whether the player died, the score,
+            and the mean and p99 frame time in milliseconds.
+    """
+    params, policy, seed, max_frames = job
+    enemy_stats = {
+        SWEEP_PARAMETERS[name]: value
+        for name, value in params.items() if SWEEP_PARAMETERS[name] is not None
+    }
+    world = GameWorld(seed=seed, enemy_stats=enemy_stats,
+                      mystery_spawn_rate=params.get("mystery_spawn_rate"))
+    world.spawn_player()
+    inputs = POLICIES[policy]
+
+    frame_times = []
+    start = time.perf_counter()
+    for frame in range(max_frames):
+        frame_start = time.perf_counter()
+        inputs(world, frame)
+        world.step()
+        frame_times.append(time.perf_counter() - frame_start)
+        if world.game_over:
+            break
+    elapsed = time.perf_counter() - start
+
+    frame_times.sort()
+    return {
+        "frames": len(frame_times),
+        "survival_s": world.clock.now,
+        "died": world.game_over,
+        "score": world.player.score,
+        "frame_ms_mean": elapsed / len(frame_times) * 1000,
+        "frame_ms_p99": percentile(frame_times, 99) * 1000,
+    }
+
+
+def summarize(samples):
+    """
+    Summarize a list of numbers.
+
+    Args:
+        samples (list): The values.
+
+    Returns:
+        dict: The mean, p10, p50, p90 and max of the values.
+    """
+    samples = sorted(samples)
+    return {
+        "mean": sum(samples) / len(samples),
+        "p10": percentile(samples, 10),
+        "p50": percentile(samples, 50),
+        "p90": percentile(samples, 90),
+        "max": samples[-1],
+    }
+
+
+def aggregate(params, policy, games):
+    """
+    Combine the results of the games played with one parameter set and policy.
+
+    Args:
+        params (dict): The swept parameter values.
+        policy (str): The name of the player policy.
+        games (list): The results of `play_game`.
+
+    Returns:
+        dict: The survival time, death rate, score and frame cost over the games.
+    """
+    frames = sum(game["frames"] for game in games)
+    return {
+        "params": params,
+        "policy": policy,
+        "games": len(games),
+        "death_rate": sum(game["died"] for game in games) / len(games),
+        "survival_s": summarize([game["survival_s"] for game in games]),
+        "score": summarize([game["score"] for game in games]),
+        "frame_ms": {
+            # Weighted by frames, so long games count for as much as they cost
+            "mean": sum(game["frame_ms_mean"] * game["frames"] for game in games) / frames,
+            "p99": summarize([game["frame_ms_p99"] for game in games])["p50"],
+        },
+    }
+
+
+def parameter_grid(sweeps):
+    """
+    List every combination of the swept parameter values.
+
+    Args:
+        sweeps (dict): Maps each swept parameter name to its list of values.
+
+    Returns:
+        list: One dict of parameter values per combination, or [{}] if nothing is swept.
+    """
+    names = list(sweeps)
+    return [dict(zip(names, values)) for values in itertools.product(*sweeps.values())]
+
+
+def run_farm(sweeps, policies, games, seed=BENCHMARK_SEED, max_seconds=SIMFARM_MAX_SECONDS,
+             workers=None, progress=None):
+    """
+    Play every combination of parameter set, policy and seed on a process pool.
+
+    Args:
+        sweeps (dict): Maps each swept parameter name to its list of values.
+        policies (list): The names of the player policies in POLICIES.
+        games (int): The number of seeded games per parameter set and policy.
+        seed (int): The seed of the first game; game i uses seed + i.
+        max_seconds (float): The game time after which a game is stopped.
+        workers (int): The number of worker processes, or None for one per CPU.
+        progress (callable): Called with (done, total) as games finish.
+
+    Returns:
+        list: One `aggregate` result per parameter set and policy.
+    """
+    max_frames = int(max_seconds / SIM_TIMESTEP)
+    groups = [(params, policy) for params in parameter_grid(sweeps) for policy in policies]
+    jobs = [(params, policy, seed + i, max_frames)
+            for params, policy in groups for i in range(games)]
+    workers = workers or os.cpu_count() or 1
+    # Big enough chunks to keep pickling overhead low, small enough to balance the cores
+    chunksize = max(1, len(jobs) // (workers * 16))
+
+    results = []
+    with ProcessPoolExecutor(max_workers=workers, initializer=SoundManager.set_enabled,
+                             initargs=(False,)) as executor:
+        for done, result in enumerate(executor.map(play_game, jobs, chunksize=chunksize), 1):
+            results.append(result)
+            if progress is not None:
+                progress(done, len(jobs))
+    return [aggregate(params, policy, results[i * games:(i + 1) * games])
+            for i, (params, policy) in enumerate(groups)]
+
+
+def main(argv=None):
+    """
+    Parse the command line, run the simulation farm and write the JSON results.
+
+    Args:
+        argv (list): The command line arguments, or None to use sys.argv.
+    """
+    SoundManager.set_enabled(False)
+    parser = argparse.ArgumentParser(description="Play seeded headless games in parallel for balancing.")
+    parser.add_argument("--games", type=int, default=SIMFARM_GAMES,
+                        help="Seeded games per parameter set and policy.")
+    parser.add_argument("--policies", nargs="+", default=list(POLICIES), choices=list(POLICIES),
+                        help="Scripted player policies to play with (default: all).")
+    parser.add_argument("--attack-distance", type=float, nargs="+",
+                        help="Enemy attack distances to sweep.")
+    parser.add_argument("--shot-cooldown", type=float, nargs="+",
+                        help="Enemy shot cooldowns to sweep, in seconds.")
+    parser.add_argument("--enemy-speed", type=float, nargs="+",
+                        help=f"Enemy patrol descent speeds to sweep (default: ENEMY_SPEED = {ENEMY_SPEED}).")
+    parser.add_argument("--mystery-spawn-rate", type=float, nargs="+",
+                        help="Percentage chances of spawning a mystery ball when the score goes up "
+                             "(default: one every 7 points).")
+    parser.add_argument("--max-seconds", type=float, default=SIMFARM_MAX_SECONDS,
+                        help="Game time after which a surviving player's game is stopped.")
+    parser.add_argument("--seed", type=int, default=BENCHMARK_SEED, help="Seed of the first game.")
+    parser.add_argument("--workers", type=int, help="Worker processes (default: one per CPU).")
+    parser.add_argument("--output", default=SIMFARM_OUTPUT, help="The JSON results file.")
+    args = parser.parse_args(argv)
+    if args.games < 1:
+        parser.error("--games must be at least 1")
+
+    sweeps = {name: getattr(args, name) for name in SWEEP_PARAMETERS
+              if getattr(args, name) is not None}
+
+    def progress(done, total):
+        if done == total or done % max(1, total // 20) == 0:
+            print(f"{done}/{total} games", file=sys.stderr)
+
+    start = time.perf_counter()
+    results = run_farm(sweeps, args.policies, args.games, args.seed, args.max_seconds,
+                       args.workers, progress)
+    report = {
+        "settings": {
+            "games": args.games,
+            "policies": args.policies,
+            "sweeps": sweeps,
+            "max_seconds": args.max_seconds,
+            "seed": args.seed,
+            "workers": args.workers or os.cpu_count() or 1,
+        },
+        "seconds": time.perf_counter() - start,
+        "results": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        f.write(json.dumps(report, indent=2) + "\n")
+    print(f"Wrote {len(results)} results to {args.output}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
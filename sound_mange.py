@@ -1,36 +1,94 @@
-import pygame
+import queue
+import threading
 from const import *
-from ball import Ball
 
 
 class SoundManager:
     """
     Manage all the sound effects for the game.
+
+    Nothing touches the audio device at import time. The first play request starts a
+    background worker thread, which initializes the mixer and decodes each clip the first
+    time it is played. Play requests are handed to the worker through a bounded queue and
+    dropped if it is full, so playing a sound never stalls a frame on the mixer.
+
+    If pygame or an audio device is not available, or audio was disabled with
+    `set_enabled(False)` for a headless run, every play request is silently ignored.
     """
-    pygame.mixer.init()
+    _enabled = SOUND_ENABLED
+    _queue = queue.Queue(maxsize=SOUND_QUEUE_SIZE)
+    _worker = None
+    _lock = threading.Lock()
+
+    @classmethod
+    def set_enabled(cls, enabled):
+        """
+        Turn audio on or off. Disable it before anything is played to never open the mixer.
+
+        Args:
+            enabled (bool): False to ignore every play request (null-audio mode).
+        """
+        cls._enabled = enabled
+
+    @classmethod
+    def _play(cls, path):
+        """
+        Queue a clip to be played by the worker thread, starting the worker if needed.
+
+        Args:
+            path (str): The path of the sound file.
+        """
+        if not cls._enabled:
+            return
+        if cls._worker is None:
+            with cls._lock:
+                if cls._worker is None:
+                    cls._worker = threading.Thread(target=cls._run, name="SoundManager", daemon=True)
+                    cls._worker.start()
+        try:
+            cls._queue.put_nowait(path)
+        except queue.Full:
+            pass  # The worker is behind; skipping a sound beats stalling the frame
+
+    @classmethod
+    def _run(cls):
+        """Initialize the mixer, then play queued clips, loading each one on first use."""
+        try:
+            import pygame
+            pygame.mixer.init()
+        except Exception:
+            # No pygame or no audio device: fall back to null audio
+            cls._enabled = False
+            return
 
-    # Load sounds
-    START_SOUND = pygame.mixer.Sound(START)
-    POWERUP_SOUND = pygame.mixer.Sound(POWERUP)
-    EXPLOSION_SOUND = pygame.mixer.Sound(EXPLOSION)
-    SHOOTING_SOUND = pygame.mixer.Sound(SHOOT)
+        sounds = {}
+        while True:
+            path = cls._queue.get()
+            sound = sounds.get(path)
+            if sound is None:
+                try:
+                    sound = pygame.mixer.Sound(path)
+                except Exception:
+                    continue
+                sounds[path] = sound
+            sound.play()
 
     @staticmethod
     def play_start_sound():
         """Play the start sound effect."""
-        SoundManager.START_SOUND.play()
+        SoundManager._play(START)
 
     @staticmethod
     def play_powerup_sound():
         """Play the power-up sound effect."""
-        SoundManager.POWERUP_SOUND.play()
+        SoundManager._play(POWERUP)
 
     @staticmethod
     def play_explosion_sound():
         """Play the explosion sound effect."""
-        SoundManager.EXPLOSION_SOUND.play()
+        SoundManager._play(EXPLOSION)
 
     @staticmethod
     def play_shooting_sound():
         """Play the shooting sound effect."""
-        SoundManager.SHOOTING_SOUND.play()
\ No newline at end of file
+        SoundManager._play(SHOOT)
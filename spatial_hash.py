@@ -0,0 +1,176 @@
+import math
+from const import *
+from ball import contact_time
+
+
+class SpatialHash:
+    """
+    A uniform-grid spatial hash over the playfield.
+
+    Objects are inserted into every grid cell their bounding circle overlaps. A query then
+    only returns the objects that share a cell with the queried circle, so narrowphase
+    checks run on a handful of candidates instead of on every object in the game.
+    """
+
+    def __init__(self, cell_size=SPATIAL_HASH_CELL_SIZE):
+        """
+        Initialize an empty spatial hash.
+
+        Args:
+            cell_size (float): The width and height of a grid cell. It should be at least
+                as large as the typical object, so most objects only touch a few cells.
+        """
+        self.cell_size = cell_size
+        self._cells = {}
+
+    def _cell_range(self, x, y, radius):
+        """
+        Compute the range of cells overlapped by a circle.
+
+        Args:
+            x (float): The x-coordinate of the circle's center.
+            y (float): The y-coordinate of the circle's center.
+            radius (float): The radius of the circle.
+
+        Returns:
+            tuple: (min_cx, max_cx, min_cy, max_cy), inclusive cell coordinates.
+        """
+        cs = self.cell_size
+        return (int((x - radius) // cs), int((x + radius) // cs),
+                int((y - radius) // cs), int((y + radius) // cs))
+
+    def clear(self):
+        """Remove every object from the hash."""
+        self._cells.clear()
+
+    def insert(self, obj, radius=None):
+        """
+        Insert an object into every cell its bounding circle overlaps.
+
+        Args:
+            obj: An object with x, y and size attributes.
+            radius (float): The radius to use instead of `obj.size`.
+        """
+        if radius is None:
+            radius = obj.size
+        min_cx, max_cx, min_cy, max_cy = self._cell_range(obj.x, obj.y, radius)
+        cells = self._cells
+        for cx in range(min_cx, max_cx + 1):
+            for cy in range(min_cy, max_cy + 1):
+                bucket = cells.get((cx, cy))
+                if bucket is None:
+                    cells[(cx, cy)] = [obj]
+                else:
+                    bucket.append(obj)
+
+    def rebuild(self, objects):
+        """
+        Clear the hash and insert every object again. Called once per frame.
+
+        Args:
+            objects (iterable): The objects to insert.
+        """
+        self._cells.clear()
+        for obj in objects:
+            self.insert(obj)
+
+    def query(self, x, y, radius=0):
+        """
+        Find the objects that share a cell with a circle.
+
+        Args:
+            x (float): The x-coordinate of the circle's center.
+            y (float): The y-coordinate of the circle's center.
+            radius (float): The radius of the circle.
+
+        Returns:
+            list: The candidate objects, without duplicates.
+        """
+        min_cx, max_cx, min_cy, max_cy = self._cell_range(x, y, radius)
+        cells = self._cells
+        if min_cx == max_cx and min_cy == max_cy:
+            return cells.get((min_cx, min_cy), [])
+
+        found = []
+        seen = set()
+        for cx in range(min_cx, max_cx + 1):
+            for cy in range(min_cy, max_cy + 1):
+                for obj in cells.get((cx, cy), ()):
+                    if id(obj) not in seen:
+                        seen.add(id(obj))
+                        found.append(obj)
+        return found
+
+    def first_hit(self, obj, swept=False):
+        """
+        Find the first object in the hash that overlaps `obj`.
+
+        Args:
+            obj: An object with x, y and size attributes, and vx and vy if swept.
+            swept (bool): Test the whole path `obj` moved along during the last step
+                instead of only its current position, and return the object it touched
+                first along that path.
+
+        Returns:
+            The first overlapping object, or None if nothing overlaps.
+        """
+        if not swept:
+            for other in self.query(obj.x, obj.y, obj.size):
+                if overlaps(obj, other):
+                    return other
+            return None
+
+        # The circle around the middle of the path covers everything the path touches
+        half_vx = obj.vx / 2
+        half_vy = obj.vy / 2
+        radius = obj.size + math.sqrt(half_vx * half_vx + half_vy * half_vy)
+        first = None
+        first_time = math.inf
+        for other in self.query(obj.x - half_vx, obj.y - half_vy, radius):
+            t = swept_hit_time(obj, other)
+            if t < first_time:
+                first, first_time = other, t
+        return first
+
+
+def overlaps(a, b):
+    """
+    Check whether the bounding circles of two objects overlap, without a square root.
+
+    Args:
+        a: An object with x, y and size attributes.
+        b: An object with x, y and size attributes.
+
+    Returns:
+        bool: True if the distance between the centers is less than the sum of the sizes.
+    """
+    dx = b.x - a.x
+    dy = b.y - a.y
+    reach = a.size + b.size
+    return dx * dx + dy * dy < reach * reach
+
+
+def swept_hit_time(a, b):
+    """
+    Find when a moving object touched a still one along the path it moved during the last
+    step, from (a.x - a.vx, a.y - a.vy) to (a.x, a.y).
+
+    Unlike `overlaps`, this also catches a fast object that passed through the other between
+    two steps, using the closed-form contact time of `Ball.time_to_hit`.
+
+    Args:
+        a: The moving object, with x, y, vx, vy and size attributes, already moved.
+        b: The still object, with x, y and size attributes.
+
+    Returns:
+        float: The fraction of the step, between 0 and 1, at which the objects touched, or
+            math.inf if they did not touch during the step.
+    """
+    dx = b.x - a.x + a.vx
+    dy = b.y - a.y + a.vy
+    reach = a.size + b.size
+    if dx * dx + dy * dy < reach * reach:
+        # Already touching when the step started
+        return 0.0
+    t = contact_time(dx, dy, -a.vx, -a.vy, reach)
+    return t if t <= 1.0 else math.inf
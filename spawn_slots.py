@@ -0,0 +1,116 @@
+from const import *
+
+
+class SpawnSlots:
+    """
+    An occupancy bitmap over the band at the top of the screen where enemies spawn.
+
+    The band is cut into fixed slots one enemy wide. Bit i of the bitmap is set while an
+    enemy occupies slot i, so a free slot is found from the bitmap in constant time instead
+    of retrying random positions against every enemy. When every slot is taken, `pick`
+    returns None rather than waiting for one to free up.
+
+    Occupants are only checked lazily, when a slot is looked at: a slot frees up once all of
+    its enemies have been destroyed or have moved out of the band.
+    """
+
+    def __init__(self, min_x, max_x, y, width=SPAWN_SLOT_WIDTH):
+        """
+        Initialize an empty spawn band.
+
+        Args:
+            min_x (float): The leftmost x-coordinate an enemy may spawn at.
+            max_x (float): The rightmost x-coordinate an enemy may spawn at.
+            y (float): The y-coordinate enemies spawn at.
+            width (float): The width of a slot; enemies whose centers are closer than this
+                overlap.
+        """
+        self.y = y
+        self.width = width
+        count = int((max_x - min_x) // width) + 1
+        # Center the slots in the band
+        first = (min_x + max_x) / 2 - (count - 1) * width / 2
+        self.xs = [first + i * width for i in range(count)]
+        self._occupied = 0
+        self._occupants = [[] for _ in range(count)]
+
+    def __len__(self):
+        """
+        Returns:
+            int: The number of slots.
+        """
+        return len(self.xs)
+
+    def _in_band(self, enemy):
+        """
+        Check whether an enemy still blocks the spawn band.
+
+        Args:
+            enemy (EnemyAirplane): The enemy.
+
+        Returns:
+            bool: True if the enemy is alive and overlaps the band vertically.
+        """
+        return not enemy._is_destroyed and abs(self.y - enemy.y) < self.width
+
+    def _refresh(self):
+        """Free the occupied slots whose enemies have all left the band."""
+        bits = self._occupied
+        while bits:
+            low = bits & -bits
+            index = low.bit_length() - 1
+            bits ^= low
+            occupants = [enemy for enemy in self._occupants[index] if self._in_band(enemy)]
+            self._occupants[index] = occupants
+            if not occupants:
+                self._occupied &= ~low
+
+    def free_count(self):
+        """
+        Count the free slots.
+
+        Returns:
+            int: The number of slots no enemy occupies.
+        """
+        self._refresh()
+        return len(self.xs) - bin(self._occupied).count("1")
+
+    def pick(self, rng):
+        """
+        Choose a random free slot.
+
+        Args:
+            rng (random.Random): The random number generator choosing among free slots.
+
+        Returns:
+            float: The x-coordinate of the chosen slot, or None if every slot is occupied.
+        """
+        free = self.free_count()
+        if free == 0:
+            return None
+        skip = rng.randrange(free)
+        for index in range(len(self.xs)):
+            if not self._occupied >> index & 1:
+                if skip == 0:
+                    return self.xs[index]
+                skip -= 1
+        return None
+
+    def occupy(self, enemy):
+        """
+        Mark every slot an enemy overlaps as occupied, if it is in the spawn band.
+
+        Args:
+            enemy (EnemyAirplane): The enemy that was placed.
+        """
+        if not self._in_band(enemy):
+            return
+        for index, x in enumerate(self.xs):
+            if abs(x - enemy.x) < self.width:
+                self._occupants[index].append(enemy)
+                self._occupied |= 1 << index
+
+    def clear(self):
+        """Mark every slot as free."""
+        self._occupied = 0
+        self._occupants = [[] for _ in self.xs]
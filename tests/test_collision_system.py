@@ -0,0 +1,51 @@
+import random
+import numpy as np
+import pytest
+from ball import Ball
+from collision_system import CollisionSystem
+
+
+def make_balls(count, radius=8, speed=5, seed=0):
+    """Place `count` non-overlapping balls with random velocities on the game screen."""
+    rng = random.Random(seed)
+    probe = Ball(radius, 0, 0, 0, 0, "red")
+    half_w, half_h = probe.canvas_width, probe.canvas_height
+    balls = []
+    while len(balls) < count:
+        x = rng.uniform(-half_w + radius, half_w - radius)
+        y = rng.uniform(-half_h + radius, half_h - radius)
+        if all((b.x - x) ** 2 + (b.y - y) ** 2 > (2 * radius) ** 2 for b in balls):
+            balls.append(Ball(radius, x, y, rng.uniform(-speed, speed),
+                              rng.uniform(-speed, speed), "red"))
+    return balls
+
+
+def max_overlap(balls):
+    """The deepest overlap between any two balls, or 0 if none overlap."""
+    xy = np.array([(b.x, b.y) for b in balls])
+    radius = np.array([b.size for b in balls])
+    dist = np.sqrt(((xy[:, None] - xy[None]) ** 2).sum(axis=-1))
+    overlap = radius[:, None] + radius[None] - dist
+    np.fill_diagonal(overlap, 0.0)
+    return max(0.0, overlap.max())
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+@pytest.mark.parametrize("k", [None, 1, 2])
+def test_balls_never_overlap(k, seed):
+    balls = make_balls(300, seed=seed)
+    system = CollisionSystem(balls, k=k)
+    for _ in range(100):
+        system.advance(0.5)
+        assert max_overlap(balls) < 1e-6
+
+
+def test_seeded_run_matches_full_prediction():
+    full = make_balls(300, seed=1)
+    seeded = make_balls(300, seed=1)
+    full_system = CollisionSystem(full)
+    seeded_system = CollisionSystem(seeded, k=1)
+    for _ in range(40):
+        assert full_system.advance(0.5) == seeded_system.advance(0.5)
+    for a, b in zip(full, seeded):
+        assert a.x == pytest.approx(b.x) and a.y == pytest.approx(b.y)
@@ -0,0 +1,52 @@
+import pytest
+from benchmark import setup_enemies_50_each, hold_space, strafe_and_shoot
+from enemy_ai import EnemyController
+from sound_mange import SoundManager
+from world import GameWorld
+from const import *
+
+
+@pytest.fixture(autouse=True)
+def no_sound():
+    SoundManager.set_enabled(False)
+
+
+def snapshot(world):
+    """Everything the enemy update can change, in a comparable form."""
+    return (
+        world.player.position, world.player._health, world.player.score,
+        [(e.position, e.state, e.moving_right, e.last_shot_time, e._is_destroyed)
+         for e in world.enemies],
+        [(b.x, b.y, b.vx, b.vy, b.owner) for b in world.projectiles.bullets],
+    )
+
+
+@pytest.mark.parametrize("setup, inputs", [
+    (setup_enemies_50_each, hold_space),
+    (None, strafe_and_shoot),
+])
+def test_batched_update_matches_scalar_update(setup, inputs):
+    worlds = []
+    for batch_min in (10 ** 9, 0):
+        world = GameWorld(seed=7)
+        world.enemy_ai = EnemyController(batch_min=batch_min)
+        world.spawn_player(health=BENCHMARK_PLAYER_HEALTH)
+        if setup is not None:
+            setup(world)
+        worlds.append(world)
+
+    scalar, batched = worlds
+    for frame in range(600):
+        for world in worlds:
+            inputs(world, frame)
+            world.step()
+        assert snapshot(batched) == snapshot(scalar), f"paths diverged at frame {frame}"
+
+
+def test_update_without_live_enemies():
+    world = GameWorld(seed=1)
+    world.spawn_player()
+    enemy = world.add_enemy(0, 200, AIRPLANE_2)
+    enemy.destroy()
+    EnemyController(batch_min=0).update([], world.player)
+    EnemyController(batch_min=0).update([enemy], world.player)
@@ -0,0 +1,15 @@
+from bullet import Bullet
+from mystery import MysteryBall
+from const import *
+
+
+def test_bullet_off_screen_uses_its_bounds():
+    bullet = Bullet(150, 0, 0, 0, PLAYER, bounds=(100, 100))
+    assert bullet.is_off_screen()
+    assert not Bullet(150, 0, 0, 0, PLAYER).is_off_screen()
+
+
+def test_mystery_ball_off_screen_uses_its_bounds():
+    ball = MysteryBall(20, 0, -150, 0, -5, "red", MYSTERY_BALL1, bounds=(100, 100))
+    assert ball.is_off_screen()
+    assert not MysteryBall(20, 0, -150, 0, -5, "red", MYSTERY_BALL1).is_off_screen()
@@ -0,0 +1,113 @@
+import pytest
+from leaderboard import CsvLeaderboard, Leaderboard, open_leaderboard
+
+
+@pytest.fixture
+def legacy_csv(tmp_path):
+    path = tmp_path / "scores.csv"
+    path.write_text("username,score\nalice,10\n\nbob,30\ncarol,not a number\ndave,30\neve,5\n",
+                    encoding="utf-8")
+    return str(path)
+
+
+def test_migration_skips_bad_rows_and_keeps_order(tmp_path, legacy_csv):
+    board = Leaderboard(str(tmp_path / "scores.db"), legacy_csv)
+    assert len(board) == 4
+    # Ties keep the order the scores were recorded in
+    assert board.top(3) == [("bob", 30), ("dave", 30), ("alice", 10)]
+    board.close()
+
+
+def test_migration_runs_once(tmp_path, legacy_csv):
+    db = str(tmp_path / "scores.db")
+    Leaderboard(db, legacy_csv).close()
+    board = Leaderboard(db, legacy_csv)
+    assert len(board) == 4
+    board.close()
+
+
+def test_add_and_top(tmp_path):
+    board = Leaderboard(str(tmp_path / "scores.db"), None)
+    for name, score in [("a", 1), ("b", 7), ("c", 3), ("d", 7)]:
+        board.add(name, score)
+    board.sync()
+    assert board.top(2) == [("b", 7), ("d", 7)]
+    assert board.top(10) == [("b", 7), ("d", 7), ("c", 3), ("a", 1)]
+    board.close()
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError):
+        open_leaderboard("nope")
+
+
+def test_csv_add_after_unterminated_row(tmp_path):
+    path = tmp_path / "scores.csv"
+    path.write_bytes(b"username,score\r\nalice,10\r\npartial,")
+    board = CsvLeaderboard(str(path))
+    board.add("bob", 99)
+    board.close()
+    assert path.read_bytes().endswith(b"partial,\r\nbob,99\r\n")
+    assert board.top(2) == [("bob", 99), ("alice", 10)]
+    assert board.skipped == 1
+
+
+def test_csv_ties_keep_recording_order(tmp_path):
+    board = CsvLeaderboard(str(tmp_path / "scores.csv"), k=3)
+    for name, score in [("a", 5), ("b", 9), ("c", 5), ("d", 9), ("e", 5)]:
+        board.add(name, score)
+    assert board.top(3) == [("b", 9), ("d", 9), ("a", 5)]
+    assert len(board) == 5
+    board.close()
+
+
+def test_csv_reads_only_rows_appended_by_others(tmp_path):
+    path = tmp_path / "scores.csv"
+    path.write_bytes(b"username,score\r\nalice,10\r\n")
+    board = CsvLeaderboard(str(path))
+    assert board.top(5) == [("alice", 10)]
+    offset = board._offset
+
+    # Another game instance appends a row and starts writing a second one
+    with open(path, "ab") as f:
+        f.write(b"bob,20\r\ncar")
+    assert board.top(5) == [("bob", 20), ("alice", 10)]
+    assert board._offset == offset + len(b"bob,20\r\n")
+
+    with open(path, "ab") as f:
+        f.write(b"ol,15\r\n")
+    assert board.top(5) == [("bob", 20), ("carol", 15), ("alice", 10)]
+    assert board.skipped == 0
+
+
+def test_csv_rereads_a_replaced_file(tmp_path):
+    path = tmp_path / "scores.csv"
+    path.write_bytes(b"username,score\r\nalice,10\r\nbob,20\r\n")
+    board = CsvLeaderboard(str(path))
+    assert len(board) == 2
+
+    replacement = tmp_path / "new.csv"
+    replacement.write_bytes(b"username,score\r\nzoe,3\r\n")
+    replacement.replace(path)
+    assert board.top(5) == [("zoe", 3)]
+
+    board.add("yan", 4)
+    board.close()
+    assert path.read_bytes() == b"username,score\r\nzoe,3\r\nyan,4\r\n"
+
+
+def test_csv_skips_blank_and_malformed_rows(tmp_path):
+    path = tmp_path / "scores.csv"
+    path.write_bytes(b"username,score\r\n\r\nalice,x\r\nbob,2,3\r\ncarol,7\r\n")
+    board = CsvLeaderboard(str(path))
+    assert board.top(5) == [("carol", 7)]
+    assert board.skipped == 3
+
+
+def test_csv_creates_the_file_with_a_header(tmp_path):
+    path = tmp_path / "scores.csv"
+    board = CsvLeaderboard(str(path))
+    assert board.top(5) == []
+    board.add("alice", 1)
+    board.close()
+    assert path.read_bytes() == b"username,score\r\nalice,1\r\n"
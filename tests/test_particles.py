@@ -0,0 +1,155 @@
+import time
+import numpy as np
+import pytest
+from ball import Ball
+from particles import ParticleArray, earliest_hits, time_to_hit_matrix, top_k_hits
+
+
+def make_array(bounds=(100, 50)):
+    """Three particles of radius 5 in a 200x100 world."""
+    particles = ParticleArray(capacity=2, bounds=bounds)
+    particles.add_many([0, 90, -20], [0, 10, -40], [3, 4, -1], [-2, 0, -6], 5)
+    return particles
+
+
+def test_add_grows_and_sets_mass():
+    particles = make_array()
+    assert len(particles) == 3 and particles.capacity >= 3
+    assert particles.mass[:3].tolist() == [2500, 2500, 2500]
+
+
+def test_move():
+    particles = make_array()
+    particles.move(dt=2)
+    assert particles.x[:3].tolist() == [6, 98, -22]
+    assert particles.y[:3].tolist() == [-4, 10, -52]
+
+
+def test_bounce_off_walls():
+    particles = make_array()
+    particles.x[1], particles.y[2] = 96, -46
+    assert particles.bounce_off_walls() == 2
+    assert particles.vx[:3].tolist() == [3, -4, -1]
+    assert particles.vy[:3].tolist() == [-2, 0, 6]
+    assert particles.count[:3].tolist() == [0, 1, 1]
+    # Put back against the wall it went past, and not bounced again while moving away
+    assert particles.x[1] == 95 and particles.y[2] == -45
+    assert particles.bounce_off_walls() == 0
+
+
+def test_cull_off_screen_compacts_survivors():
+    particles = make_array()
+    particles.x[0] = -101
+    particles.count[1] = 7
+    assert particles.cull_off_screen() == 1
+    assert len(particles) == 2
+    assert particles.x[:2].tolist() == [90, -20]
+    assert particles.count[:2].tolist() == [7, 0]
+
+
+def test_remove():
+    particles = make_array()
+    assert particles.remove(np.array([False, False, False])) == 0
+    assert particles.remove(np.array([False, True, False])) == 1
+    assert particles.x[:2].tolist() == [0, -20]
+    assert particles.vy[:2].tolist() == [-2, -6]
+
+
+def test_step_keeps_fast_particles_that_bounce():
+    particles = ParticleArray(bounds=(100, 50))
+    particles.add_many([90, 0], [0, 40], [30, 0], [0, 25], 5)
+    particles.step(bounce=True, cull=True)
+    assert len(particles) == 2
+    assert particles.x[:2].tolist() == [95, 0]
+    assert particles.y[:2].tolist() == [0, 45]
+    assert particles.vx[:2].tolist() == [-30, 0]
+    assert particles.vy[:2].tolist() == [0, -25]
+
+
+def test_step_culls_without_bounce():
+    particles = ParticleArray(bounds=(100, 50))
+    particles.add_many([90, 0], [0, 0], [30, 0], [0, 1], 5)
+    particles.step(bounce=False, cull=True)
+    assert len(particles) == 1
+    assert particles.x[0] == 0
+
+
+def make_swarm(count, seed=0):
+    """Random positions and velocities of `count` particles of mixed radii."""
+    rng = np.random.default_rng(seed)
+    return (rng.uniform(-400, 400, count), rng.uniform(-300, 300, count),
+            rng.uniform(-5, 5, count), rng.uniform(-5, 5, count), rng.uniform(4, 10, count))
+
+
+def reference_matrix(x, y, vx, vy, radius):
+    """Every pair's contact time as one full broadcast matrix, without any blocking."""
+    dx, dy = x[None] - x[:, None], y[None] - y[:, None]
+    dvx, dvy = vx[None] - vx[:, None], vy[None] - vy[:, None]
+    dvdr = dx * dvx + dy * dvy
+    dvdv = dvx * dvx + dvy * dvy
+    sigma = radius[None] + radius[:, None]
+    d = dvdr * dvdr - dvdv * (dx * dx + dy * dy - sigma * sigma)
+    valid = (dvdr <= 0) & (dvdv > 0) & (d >= 0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = -(dvdr + np.sqrt(np.where(valid, d, 0.0))) / np.where(valid, dvdv, 1.0)
+    t = np.where(valid & (t > 0), t, np.inf)
+    np.fill_diagonal(t, np.inf)
+    return t
+
+
+def test_matrix_matches_ball_time_to_hit():
+    x, y, vx, vy, radius = make_swarm(150)
+    balls = [Ball(*values, "red") for values in zip(radius, x, y, vx, vy)]
+    expected = [[a.time_to_hit(b) for b in balls] for a in balls]
+    assert time_to_hit_matrix(x, y, vx, vy, radius, block=32) == pytest.approx(np.array(expected))
+
+
+@pytest.fixture(scope="module")
+def swarm():
+    x, y, vx, vy, radius = make_swarm(2000, seed=1)
+    return (x, y, vx, vy, radius), reference_matrix(x, y, vx, vy, radius)
+
+
+def test_large_matrix_matches_reference(swarm):
+    values, expected = swarm
+    assert np.array_equal(time_to_hit_matrix(*values), expected)
+
+
+def test_earliest_hits_matches_reference(swarm):
+    values, expected = swarm
+    times, partners = earliest_hits(*values)
+    assert np.array_equal(times, expected.min(axis=1))
+    hit = np.isfinite(times)
+    assert hit.any() and not hit.all()
+    assert np.array_equal(expected[hit.nonzero()[0], partners[hit]], times[hit])
+    assert (partners[~hit] == -1).all()
+
+
+@pytest.mark.parametrize("k", [1, 2, 4])
+def test_top_k_hits_matches_reference(swarm, k):
+    values, expected = swarm
+    times, partners = top_k_hits(*values, k)
+    assert np.array_equal(times, np.sort(expected, axis=1)[:, :k])
+    hit = np.isfinite(times)
+    assert np.array_equal(expected[hit.nonzero()[0], partners[hit]], times[hit])
+    assert (partners[~hit] == -1).all()
+    # No partner is listed twice
+    for row in partners:
+        row = row[row >= 0]
+        assert len(np.unique(row)) == len(row)
+
+
+def best_time(function, *args, repeat=3):
+    """The fastest of a few timed calls, in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def test_earliest_hits_beats_full_matrix(swarm):
+    # Half the pairs and in-place arithmetic: well ahead of the plain broadcast version
+    values, _ = swarm
+    assert best_time(earliest_hits, *values) < best_time(reference_matrix, *values)
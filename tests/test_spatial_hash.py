@@ -0,0 +1,90 @@
+import math
+import random
+import numpy as np
+from bullet import Bullet
+from ball import Ball
+from spatial_hash import SpatialHash, swept_hit_time
+from const import *
+
+
+def random_case(rng):
+    """A bullet that has just moved one step, and a still target near its path."""
+    bullet = Bullet(rng.uniform(-100, 100), rng.uniform(-100, 100),
+                    rng.uniform(-40, 40), rng.uniform(-40, 40), PLAYER)
+    target = Ball(rng.uniform(5, 40), rng.uniform(-120, 120), rng.uniform(-120, 120), 0, 0, "red")
+    return bullet, target
+
+
+def sampled_hit_time(bullet, target, samples=2001):
+    """
+    The first sampled fraction of the step at which the bullet overlapped the target, the
+    sampled closest distance along the path and the sampling resolution.
+    """
+    t = np.linspace(0.0, 1.0, samples)
+    x = bullet.x - bullet.vx + bullet.vx * t
+    y = bullet.y - bullet.vy + bullet.vy * t
+    dist = np.hypot(target.x - x, target.y - y)
+    hits = np.nonzero(dist < bullet.size + target.size)[0]
+    first = t[hits[0]] if len(hits) else math.inf
+    step = math.hypot(bullet.vx, bullet.vy) / (samples - 1)
+    return first, dist.min(), step
+
+
+def test_swept_hit_time_matches_brute_force():
+    rng = random.Random(0)
+    checked = 0
+    for _ in range(20000):
+        bullet, target = random_case(rng)
+        expected, closest, step = sampled_hit_time(bullet, target)
+        if abs(closest - (bullet.size + target.size)) <= step:
+            # Grazing contact: too close to call by sampling
+            continue
+        actual = swept_hit_time(bullet, target)
+        if expected == math.inf:
+            assert actual == math.inf
+        else:
+            assert abs(actual - expected) <= 1.0 / 2000 + 1e-9
+        checked += 1
+    assert checked > 19000
+
+
+def test_swept_hit_time_of_a_start_overlap_is_zero():
+    bullet = Bullet(10, 0, 30, 0, PLAYER)
+    target = Ball(10, -20, 0, 0, 0, "red")
+    assert swept_hit_time(bullet, target) == 0.0
+
+
+def test_first_hit_matches_brute_force():
+    rng = random.Random(1)
+    for _ in range(2000):
+        targets = [Ball(rng.uniform(10, 40), rng.uniform(-300, 300), rng.uniform(-300, 300),
+                        0, 0, "red") for _ in range(20)]
+        spatial_hash = SpatialHash()
+        spatial_hash.rebuild(targets)
+        bullet = Bullet(rng.uniform(-300, 300), rng.uniform(-300, 300),
+                        rng.uniform(-60, 60), rng.uniform(-60, 60), PLAYER)
+
+        # Targets may overlap each other, so compare hit times rather than which of two
+        # equally early targets was returned
+        first_time = min(swept_hit_time(bullet, target) for target in targets)
+        found = spatial_hash.first_hit(bullet, swept=True)
+        if first_time == math.inf:
+            assert found is None
+        else:
+            assert found is not None and swept_hit_time(bullet, found) == first_time
+
+        overlapping = [t for t in targets if (t.x - bullet.x) ** 2 + (t.y - bullet.y) ** 2
+                       < (t.size + bullet.size) ** 2]
+        found = spatial_hash.first_hit(bullet)
+        assert (found is None) == (not overlapping)
+        assert found is None or found in overlapping
+
+
+def test_fast_bullet_does_not_tunnel_through_an_enemy():
+    spatial_hash = SpatialHash()
+    enemy = Ball(20, 0, 100, 0, 0, "red")
+    spatial_hash.rebuild([enemy])
+    # Jumped from y=60 to y=140 in one step, past the enemy
+    bullet = Bullet(0, 140, 0, 80, PLAYER)
+    assert spatial_hash.first_hit(bullet) is None
+    assert spatial_hash.first_hit(bullet, swept=True) is enemy
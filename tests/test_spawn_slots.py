@@ -0,0 +1,56 @@
+import random
+from sound_mange import SoundManager
+from spawn_slots import SpawnSlots
+from world import GameWorld
+from const import *
+
+
+class Enemy:
+    """The parts of an EnemyAirplane that SpawnSlots looks at."""
+
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+        self._is_destroyed = False
+
+
+def test_full_band_reports_no_free_slot():
+    slots = SpawnSlots(-250, 250, 250)
+    rng = random.Random(0)
+    for _ in range(len(slots)):
+        x = slots.pick(rng)
+        assert x is not None
+        slots.occupy(Enemy(x, slots.y))
+    assert slots.free_count() == 0
+    assert slots.pick(rng) is None
+
+
+def test_picked_slots_do_not_overlap():
+    slots = SpawnSlots(-250, 250, 250)
+    rng = random.Random(1)
+    xs = []
+    while (x := slots.pick(rng)) is not None:
+        slots.occupy(Enemy(x, slots.y))
+        xs.append(x)
+    xs.sort()
+    assert all(b - a >= slots.width for a, b in zip(xs, xs[1:]))
+
+
+def test_slot_frees_up_when_its_enemy_leaves():
+    slots = SpawnSlots(-250, 250, 250)
+    enemies = [Enemy(x, slots.y) for x in slots.xs]
+    for enemy in enemies:
+        slots.occupy(enemy)
+    enemies[0]._is_destroyed = True
+    enemies[1].y -= 2 * slots.width
+    assert slots.free_count() == 2
+    assert slots.pick(random.Random(0)) in slots.xs[:2]
+
+
+def test_world_skips_spawning_when_the_band_is_full():
+    SoundManager.set_enabled(False)
+    world = GameWorld(seed=2)
+    world.spawn_player()
+    spawned = [world.spawn_enemy() for _ in range(len(world.spawn_slots) + 3)]
+    assert all(enemy is not None for enemy in spawned[:len(world.spawn_slots)])
+    assert spawned[len(world.spawn_slots):] == [None] * 3
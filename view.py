@@ -0,0 +1,295 @@
+import turtle
+from const import *
+from assets import circle_polygon
+
+
+class TurtlePool:
+    """
+    A TurtlePool keeps the turtles of disposed views so new views can draw with them.
+
+    The turtle module has no public way to delete a turtle: a hidden turtle keeps its canvas
+    items and its place in the screen's list of turtles. Views therefore never throw their
+    turtle away. `dispose` hands it back here, and the next view takes it over, so the screen
+    never holds more turtles than were ever in use at the same time.
+    """
+
+    def __init__(self):
+        """
+        Initialize an empty pool.
+        """
+        self._idle = []
+        self.created = 0
+
+    def __len__(self):
+        """
+        Return the number of idle turtles waiting to be reused.
+
+        Returns:
+            int: The number of idle turtles.
+        """
+        return len(self._idle)
+
+    def acquire(self):
+        """
+        Take an idle turtle from the pool, creating one if the pool is empty.
+
+        Returns:
+            turtle.Turtle: A visible turtle with its pen up.
+        """
+        if self._idle:
+            pen = self._idle.pop()
+            pen.showturtle()
+            return pen
+        self.created += 1
+        pen = turtle.Turtle()
+        pen.penup()
+        return pen
+
+    def release(self, pen):
+        """
+        Erase and hide a turtle, and keep it for the next view.
+
+        Args:
+            pen (turtle.Turtle): A turtle no view uses anymore.
+        """
+        pen.clear()
+        pen.hideturtle()
+        pen.penup()
+        self._idle.append(pen)
+
+
+class TurtleView:
+    """
+    A TurtleView draws a simulation entity on the turtle screen.
+
+    Entities (balls, bullets, airplanes) only hold their simulation state. A view is attached
+    to them afterwards and is told to update whenever the entity moves, so the same entities
+    can run headless (without any view) on machines that have no display.
+    """
+
+    def __init__(self, shape=None, assets=None, pool=None):
+        """
+        Initialize the view with its own turtle.
+
+        Args:
+            shape (str): An optional image shape used to draw the entity.
+            assets (AssetRegistry): The registry image shapes are taken from. Without one,
+                shapes are registered with the screen directly.
+            pool (TurtlePool): The pool the turtle is taken from and handed back to on
+                `dispose`. Without one, the view creates its own turtle.
+        """
+        self.assets = assets
+        self.pool = pool
+        if pool is not None:
+            self.turtle = pool.acquire()
+        else:
+            self.turtle = turtle.Turtle()
+            self.turtle.penup()
+        if shape is not None:
+            self.set_shape(shape)
+
+    def set_shape(self, shape):
+        """
+        Change the image shape used to draw the entity.
+
+        Args:
+            shape (str): The new shape name.
+        """
+        self.turtle.shape(self._register(shape))
+
+    def _register(self, shape):
+        """
+        Make sure an image shape is registered with the screen.
+
+        Args:
+            shape (str): The path of the GIF image.
+
+        Returns:
+            str: The registered shape name.
+        """
+        if self.assets is not None:
+            return self.assets.shape(shape)
+        self.turtle.screen.register_shape(shape)
+        return shape
+
+    def update(self, entity):
+        """
+        Move the drawing to the current position of the entity.
+
+        Args:
+            entity: The entity being drawn, with x and y attributes.
+        """
+        self.turtle.goto(entity.x, entity.y)
+
+    def show(self):
+        """Make the drawing visible."""
+        self.turtle.showturtle()
+
+    def hide(self):
+        """Erase and hide the drawing."""
+        self.turtle.clear()
+        self.turtle.hideturtle()
+
+    def dispose(self):
+        """
+        Erase the drawing for good and hand the turtle back to the pool, if the view has one,
+        for the next view to draw with. The view cannot be used afterwards.
+        """
+        if self.pool is not None:
+            self.pool.release(self.turtle)
+        else:
+            self.hide()
+
+
+class BulletView(TurtleView):
+    """
+    A BulletView draws a bullet as a small filled circle in the bullet's color.
+
+    The circle is registered once as a turtle shape, so the turtle itself is the bullet
+    sprite: moving the bullet is a single `goto` (one coordinate update of an existing
+    canvas item) instead of erasing and re-filling a circle every frame.
+    """
+
+    def __init__(self, bullet, assets=None, pool=None):
+        """
+        Initialize the view for a bullet.
+
+        Args:
+            bullet (Bullet): The bullet to draw.
+            assets (AssetRegistry): The registry the bullet shape is registered with. Without
+                one, the shape is registered with the turtle's screen directly.
+            pool (TurtlePool): The pool the turtle is taken from and handed back to.
+        """
+        super().__init__(assets=assets, pool=pool)
+        self.set_shape(self._register_shape(bullet.size))
+        self.turtle.setheading(90 if bullet.owner == PLAYER else 270)
+        self._color = None
+
+    def _register_shape(self, size):
+        """
+        Register the circular bullet shape of the given radius, once per screen.
+
+        Args:
+            size (int): The radius of the bullet.
+
+        Returns:
+            str: The name of the registered shape.
+        """
+        if self.assets is not None:
+            return self.assets.circle(size)
+        name = f"{BULLET_SHAPE}_{size}"
+        screen = self.turtle.getscreen()
+        if name not in screen.getshapes():
+            screen.register_shape(name, circle_polygon(size))
+        return name
+
+    def set_shape(self, shape):
+        """
+        Change the shape used to draw the bullet. Shapes are registered by the view itself.
+
+        Args:
+            shape (str): The registered shape name.
+        """
+        self.turtle.shape(shape)
+
+    def update(self, bullet):
+        """
+        Move the bullet sprite to the bullet's current position.
+
+        Args:
+            bullet (Bullet): The bullet being drawn.
+        """
+        if bullet.color != self._color:
+            # Only recolor when a pooled bullet changes owner
+            self._color = bullet.color
+            self.turtle.color(bullet.color)
+        self.turtle.goto(bullet.x, bullet.y)
+        if not self.turtle.isvisible():
+            self.turtle.showturtle()
+
+
+class TurtleViewFactory:
+    """
+    Create the turtle views for entities spawned by a GameWorld.
+    """
+
+    def __init__(self, effects=None, assets=None):
+        """
+        Initialize the factory. The views it creates share one TurtlePool.
+
+        Args:
+            effects (ExplosionManager): The manager airplane views play their explosion with.
+            assets (AssetRegistry): The registry the views take their image shapes from.
+        """
+        self.effects = effects
+        self.assets = assets
+        self.turtles = TurtlePool()
+
+    def airplane_view(self, shape):
+        """
+        Create the view of an airplane.
+
+        Args:
+            shape (str): The image shape of the airplane.
+
+        Returns:
+            AirplaneView: The new view.
+        """
+        return AirplaneView(shape, self.effects, self.assets, self.turtles)
+
+    def mystery_view(self, ball):
+        """
+        Create the view of a mystery ball.
+
+        Args:
+            ball (MysteryBall): The mystery ball to draw.
+
+        Returns:
+            TurtleView: The new view.
+        """
+        return TurtleView(ball.shape, self.assets, self.turtles)
+
+
+class AirplaneView(TurtleView):
+    """
+    An AirplaneView draws an airplane with its image shape and starts its explosion
+    animation when the airplane is destroyed.
+    """
+
+    def __init__(self, shape, effects=None, assets=None, pool=None):
+        """
+        Initialize the view for an airplane.
+
+        Args:
+            shape (str): The image shape of the airplane.
+            effects (ExplosionManager): The manager playing the explosion. Without one, the
+                airplane just disappears.
+            assets (AssetRegistry): The registry the image shapes are taken from.
+            pool (TurtlePool): The pool the turtles of the airplane and its bullets are
+                taken from and handed back to.
+        """
+        super().__init__(shape, assets, pool)
+        self.effects = effects
+
+    def bullet_view(self, bullet):
+        """
+        Create the view for a bullet fired by this airplane.
+
+        Args:
+            bullet (Bullet): The bullet that was fired.
+
+        Returns:
+            BulletView: The view drawing the bullet.
+        """
+        return BulletView(bullet, self.assets, self.pool)
+
+    def explode(self, airplane):
+        """
+        Remove the airplane's drawing and start an explosion at its position.
+
+        Args:
+            airplane (Airplane): The destroyed airplane.
+        """
+        self.dispose()
+        if self.effects is not None:
+            self.effects.spawn(airplane.x, airplane.y)
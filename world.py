@@ -0,0 +1,213 @@
+import random
+from const import *
+from airplane import PlayerAirplane, EnemyAirplane
+from mystery import MysteryBall
+from clock import SimClock
+from bullet_pool import BulletPool
+from projectiles import ProjectileRegistry
+from profiler import FrameProfiler
+from enemy_ai import EnemyController
+from spawn_slots import SpawnSlots
+
+
+class GameWorld:
+    """
+    The simulation state of one game: the player, enemies, mystery balls, the simulation
+    clock, the bullet pool, the bullets in flight and the random number generator used for spawning.
+
+    The world knows nothing about the screen. `GameController` drives it from the frame
+    scheduler and gives it a view factory so new entities get drawn; the benchmark and
+    other headless tools drive it directly, one `step` per simulation frame.
+    """
+
+    def __init__(self, seed=None, view_factory=None, profiler=None, enemy_stats=None,
+                 mystery_spawn_rate=None):
+        """
+        Initialize an empty world.
+
+        Args:
+            seed (int): The seed of the spawn random number generator, for reproducible runs.
+                A random seed is picked (and kept in `seed`) if none is given.
+            view_factory: An object with `airplane_view(shape)` and `mystery_view(ball)`
+                methods used to draw new entities, or None to run headless.
+            profiler (FrameProfiler): The profiler the simulation stages are timed with.
+            enemy_stats (dict): EnemyAirplane attributes (e.g. attack_distance, shot_cooldown,
+                descent_speed) overridden on every new enemy, for balancing runs.
+            mystery_spawn_rate (float): If given, the percentage chance of spawning a mystery
+                ball each time the score goes up, instead of one every 7 points.
+        """
+        if seed is None:
+            seed = random.randrange(2 ** 32)
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.view_factory = view_factory
+        self.profiler = profiler if profiler is not None else FrameProfiler()
+        self.enemy_stats = dict(enemy_stats or {})
+        self.mystery_spawn_rate = mystery_spawn_rate
+        self.clock = SimClock()
+        self.bullet_pool = BulletPool()
+        self.projectiles = ProjectileRegistry(self.bullet_pool)
+        self.player = None
+        self.enemies = []
+        self.enemy_ai = EnemyController()
+        self.spawn_slots = SpawnSlots(
+            -SCREEN_WIDTH // 2 + 50, SCREEN_WIDTH // 2 - 50, SCREEN_HEIGHT // 2 - 50
+        )
+        self.mystery_balls = []
+        self.last_score_used_to_spawn = -1
+
+    @property
+    def game_over(self):
+        """
+        bool: True once the player has no health left.
+        """
+        return self.player is not None and self.player._health <= 0
+
+    def spawn_player(self, health=3):
+        """
+        Create the player's airplane at its starting position.
+
+        Args:
+            health (int): The initial health of the player.
+
+        Returns:
+            PlayerAirplane: The player's airplane.
+        """
+        self.player = PlayerAirplane(
+            position=(0, -200),
+            velocity=(0, 0),
+            shape=PLAYER_PIC,
+            health=health,
+            size=40,
+            clock=self.clock,
+            bullet_pool=self.bullet_pool,
+            projectiles=self.projectiles
+        )
+        if self.view_factory is not None:
+            self.player.attach_view(self.view_factory.airplane_view(PLAYER_PIC))
+        return self.player
+
+    def add_enemy(self, x, y, shape, health=3):
+        """
+        Create an enemy airplane at a given position.
+
+        Args:
+            x (float): The x-coordinate of the enemy.
+            y (float): The y-coordinate of the enemy.
+            shape (str): One of the AIRPLANE_* shapes, which also selects its firing pattern.
+            health (int): The health points of the enemy.
+
+        Returns:
+            EnemyAirplane: The new enemy.
+        """
+        enemy = EnemyAirplane(
+            position=(x, y),
+            velocity=(0, 0),
+            shape=shape,
+            health=health,
+            size=40,
+            clock=self.clock,
+            bullet_pool=self.bullet_pool,
+            projectiles=self.projectiles
+        )
+        for name, value in self.enemy_stats.items():
+            setattr(enemy, name, value)
+        if self.view_factory is not None:
+            enemy.attach_view(self.view_factory.airplane_view(shape))
+        self.enemies.append(enemy)
+        self.spawn_slots.occupy(enemy)
+        return enemy
+
+    def spawn_enemy(self):
+        """
+        Spawn an enemy airplane in a random free slot of the spawn band, so it does not
+        overlap existing enemies.
+
+        Returns:
+            EnemyAirplane: The new enemy, or None if every spawn slot is occupied.
+        """
+        shapes = [AIRPLANE_2, AIRPLANE_3, AIRPLANE_4, AIRPLANE_5]
+        random_shape = self.rng.choice(shapes)
+        x_pos = self.spawn_slots.pick(self.rng)
+        if x_pos is None:
+            return None
+        return self.add_enemy(x_pos, self.spawn_slots.y, random_shape)
+
+    def spawn_mystery_ball(self):
+        """Spawn a mystery ball with a random type at a random position."""
+        mystery_types = [1, 2, 3]
+        mystery_type = self.rng.choice(mystery_types)
+        mystery_ball = MysteryBall(
+            size=20,
+            x=self.rng.randint(-SCREEN_WIDTH // 2 + 50, SCREEN_WIDTH // 2 - 50),
+            y=SCREEN_HEIGHT // 2 - 50,
+            vx=0,
+            vy=-5,
+            color="red",
+            ball_type=mystery_type
+        )
+        if self.view_factory is not None:
+            mystery_ball.attach_view(self.view_factory.mystery_view(mystery_ball))
+        self.mystery_balls.append(mystery_ball)
+
+    def step(self):
+        """
+        Run one fixed simulation step and advance the clock.
+        """
+        self.update()
+        self.clock.tick()
+
+    def update(self):
+        """
+        Update the player, mystery balls, enemies and bullets in flight, and spawn new
+        enemies and mystery balls, timing each stage with the profiler.
+        """
+        profiler = self.profiler
+        with profiler.scope("player"):
+            self.player.update()
+        if self.player._health <= 0:
+            return
+
+        with profiler.scope("mystery_balls"):
+            for ball in self.mystery_balls[:]:
+                ball.move()
+                if self.player.distance(ball) < self.player.size + ball.size:
+                    ball.activate_ability(self.player)
+                    self.mystery_balls.remove(ball)
+                elif ball.is_off_screen():
+                    ball._hide_ball()
+                    self.mystery_balls.remove(ball)
+
+        with profiler.scope("enemies"):
+            self.enemy_ai.update(self.enemies, self.player)
+
+        with profiler.scope("projectiles"):
+            self.projectiles.update(self.player, self.enemies)
+            # Destroyed enemies leave the world; their bullets stay in flight
+            for enemy in self.enemies[:]:
+                if enemy._is_destroyed:
+                    self.enemies.remove(enemy)
+                    self.player.score += 1
+
+        with profiler.scope("spawn"):
+            if not self.enemies:
+                for _ in range(self.rng.randint(1, 4)):
+                    self.spawn_enemy()
+
+            if self.player.score != self.last_score_used_to_spawn:
+                if self.mystery_spawn_rate is not None:
+                    if self.rng.uniform(0, 100) < self.mystery_spawn_rate:
+                        self.spawn_mystery_ball()
+                elif self.player.score % 7 == 0:
+                    self.spawn_mystery_ball()
+                self.last_score_used_to_spawn = self.player.score
+
+    def bullet_count(self):
+        """
+        Count the bullets in flight.
+
+        Returns:
+            int: The number of live bullets of the player and every enemy, destroyed ones
+                included.
+        """
+        return len(self.projectiles)